@@ -10,6 +10,31 @@ from src.pages import team_vs_teamAnalysis
 from src.pages import matches
 from src.predictions import winnerPrediction
 from src.predictions import scorePrediction
+from src.analysis.datasetPreprocessing import (
+    ensure_large_files_exist,
+    load_deliveries_data,
+    load_matches_data,
+    load_state,
+)
+from src.analysis.deliveriesIndex import (
+    MATCH_INDEX_COLUMNS,
+    MATCHUP_INDEX_COLUMNS,
+    PLAYER_ROLES,
+    load_match_index,
+    load_matchup_index,
+    load_player_index,
+)
+from src.analysis.edaAggregates import EDA_STATISTICS, statistic_columns
+from src.analysis.matchCalendar import load_match_calendar
+from src.analysis.matchupMatrix import MATCHUP_MATRIX_COLUMNS, load_matchup_matrix
+from src.analysis.overRates import OVER_RATE_COLUMNS, load_over_rates
+from src.analysis.playerProfiles import PLAYER_PROFILE_COLUMNS, load_player_profiles
+from src.analysis.scorecards import SCORECARD_COLUMNS, load_scorecards
+from src.analysis.teamBundles import TEAM_BUNDLE_COLUMNS, load_team_bundles
+from src.analysis.teamPairs import TEAM_PAIR_COLUMNS, load_team_pairs
+from src.predictions import modelLoading
+from src.predictions.winnerMatches import load_winner_matches
+from src.utils.warmUp import start_warm_up
 
 # Set up page config first (must be first Streamlit command)
 st.set_page_config(
@@ -19,6 +44,42 @@ st.set_page_config(
     layout="wide",
 )
 
+# Deliveries columns read anywhere in the app; warm-up loads only these,
+# so the projected loads that follow are served from this frame without reading every column
+WARM_UP_COLUMNS = list(dict.fromkeys(
+    team_vs_teamAnalysis.DELIVERIES_COLUMNS
+    + batter_vs_bowlerAnalysis.DELIVERIES_COLUMNS
+    + MATCH_INDEX_COLUMNS
+    + PLAYER_ROLES
+    + MATCHUP_INDEX_COLUMNS
+    + MATCHUP_MATRIX_COLUMNS
+    + TEAM_PAIR_COLUMNS
+    + statistic_columns(EDA_STATISTICS)
+    + OVER_RATE_COLUMNS
+    + TEAM_BUNDLE_COLUMNS
+    + PLAYER_PROFILE_COLUMNS
+    + SCORECARD_COLUMNS
+))
+
+# Load datasets and models in the background while HOME is served (once per process)
+start_warm_up([
+    ("matches data", load_matches_data),
+    ("deliveries data", lambda: load_deliveries_data(WARM_UP_COLUMNS)),
+    ("match index", load_match_index),
+    ("match calendar", load_match_calendar),
+    ("player index", load_player_index),
+    ("matchup index", load_matchup_index),
+    ("matchup matrix", load_matchup_matrix),
+    ("team pair index", load_team_pairs),
+    ("over rates", load_over_rates),
+    ("team bundles", load_team_bundles),
+    ("player profiles", load_player_profiles),
+    ("scorecards", load_scorecards),
+    ("winner matches", load_winner_matches),
+    ("winner model", modelLoading.load_winner_model),
+    ("score model", modelLoading.load_score_model),
+])
+
 # Bootstrap CSS
 st.markdown(
     '''
@@ -65,8 +126,8 @@ def check_and_download_files():
             need_download = any(not os.path.exists(f) for f in required_files[:2])
             
             if need_download:
-                from scripts.download_large_files import download_large_files
-                download_large_files()
+                # Joins the download the warm-up may already have started
+                ensure_large_files_exist()
             
             # Handle score model decompression if compressed file exists
             if os.path.exists('Model/predict_ipl_score_compressed.pkl.bz2') and not os.path.exists('Model/predict_ipl_score_best_rf.pkl'):
@@ -98,6 +159,21 @@ def check_and_download_files():
     st.session_state.files_checked = True
     return st.session_state.files_ready
 
+def seconds_so_far(status):
+    return "just started" if status["seconds"] is None else f"{status['seconds']:.0f}s so far"
+
+def show_load_state():
+    """Report datasets and models still loading, and datasets that failed to load"""
+    for status in load_state():
+        if status["state"] == "loading":
+            st.info(f" Loading {status['name']} data ({seconds_so_far(status)})...")
+        elif status["state"] == "failed":
+            st.warning(f" Last load of {status['name']} data failed: {status['error']}")
+    # Prediction pages report their own model errors
+    for status in modelLoading.load_state():
+        if status["state"] == "loading":
+            st.info(f" Loading {status['name']} ({seconds_so_far(status)})...")
+
 # Pages that need data files
 PAGES_NEEDING_FILES = {
     "Exploratory Data Analysis", 
@@ -133,6 +209,7 @@ if selection == "HOME":
 elif selection in PAGES_NEEDING_FILES:
     # Check files only when user selects a page that needs them
     if check_and_download_files():
+        show_load_state()
         page = PAGES[selection]
         page.app()
     else:
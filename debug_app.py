@@ -47,4 +47,22 @@ try:
 except Exception as e:
     st.error(f" Import error: {str(e)}")
 
+st.write("## Dataset and Model Load State")
+try:
+    from src.analysis.datasetPreprocessing import load_state
+    from src.predictions import modelLoading
+    for status in load_state() + modelLoading.load_state():
+        seconds = "-" if status["seconds"] is None else f"{status['seconds']:.2f}s"
+        message = f" {status['name']}: {status['state']} ({seconds})"
+        if status.get("memory_mb") is not None:
+            message += f", {status['memory_mb']} MB"
+        if status["state"] == "failed":
+            st.error(f"{message} - {status['error']}")
+        elif status["state"] == "ready":
+            st.success(message)
+        else:
+            st.info(message)
+except Exception as e:
+    st.error(f" Import error: {str(e)}")
+
 st.write("## Ready for main app!")
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+
+# Allow running as `python scripts/benchmark_eda_aggregates.py` from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from src.analysis.datasetPreprocessing import ensure_large_files_exist, load_deliveries_data
+from src.analysis.edaAggregates import EDA_STATISTICS, aggregate, cached_codes, statistic_columns
+
+
+def previous_statistics(deliveries):
+    """The deliveries statistics of the EDA page before the engine: one groupby pass each"""
+    first_over = deliveries[deliveries["over"] == 0]
+    last_over = deliveries[deliveries["over"] == 19]
+    return {
+        "batter_runs": deliveries.groupby("batter", observed=True)["batsman_runs"].sum(),
+        "bowler_runs": deliveries.groupby("bowler", observed=True)["total_runs"].agg("sum"),
+        "first_over_bowler_runs": first_over.groupby("bowler", observed=True)["total_runs"].agg("sum"),
+        "last_over_bowler_runs": last_over.groupby("bowler", observed=True)["total_runs"].agg("sum"),
+        "last_over_team_mean_runs": last_over.groupby("batting_team", observed=True)["total_runs"].mean(),
+        "last_over_team_runs": last_over.groupby("batting_team", observed=True)["total_runs"].sum(),
+        "innings_runs": deliveries.groupby(
+            ["match_id", "inning", "batting_team", "bowling_team"], observed=True
+        )["total_runs"].sum(),
+    }
+
+
+def timed(label, compute, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = compute()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"⏱️ {label}: {best * 1000:.1f} ms (best of {repeat})")
+    return result, best
+
+
+def same(old, new):
+    old, new = old.astype(float), new.astype(float)
+    return old.to_csv() == new.to_csv()
+
+
+def main():
+    """Check the aggregation engine against the previous groupby passes and time both."""
+    ensure_large_files_exist()
+    deliveries = load_deliveries_data(statistic_columns(EDA_STATISTICS))
+    print(f"📊 {len(deliveries)} deliveries, {len(EDA_STATISTICS)} statistics")
+
+    before, before_time = timed("previous groupby passes", lambda: previous_statistics(deliveries))
+    after, after_time = timed(
+        "aggregation engine", lambda: aggregate(deliveries, EDA_STATISTICS, cached_codes(deliveries, EDA_STATISTICS))
+    )
+    print(f"🚀 {before_time / after_time:.1f}x faster")
+
+    mismatches = [name for name in EDA_STATISTICS if not same(before[name], after[name])]
+    if mismatches:
+        print(f"❌ Statistics differ: {mismatches}")
+        sys.exit(1)
+    print(f"🎉 All {len(EDA_STATISTICS)} statistics match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+import itertools
+
+# Allow running as `python scripts/benchmark_head_to_head.py` from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from src.analysis.datasetPreprocessing import ensure_large_files_exist, load_deliveries_data, load_matches_data
+from src.analysis.teamPairs import TEAM_PAIR_COLUMNS, load_team_pairs
+
+
+def previous_info(total_del, t1, t2):
+    """The per-team info() of Team v/s Team before the cube: six boolean filters per team"""
+
+    def info(t):
+        er = total_del[total_del.bowling_team == t]["extra_runs"].sum()
+        sixes = total_del[(total_del["batting_team"] == t) & (total_del["total_runs"] == 6)].count().iloc[0]
+        fours = total_del[(total_del["batting_team"] == t) & (total_del["total_runs"] == 4)].count().iloc[0]
+        doubles = total_del[(total_del["batting_team"] == t) & (total_del["total_runs"] == 2)].count().iloc[0]
+        singles = total_del[(total_del["batting_team"] == t) & (total_del["total_runs"] == 1)].count().iloc[0]
+        total_runs = total_del[total_del["batting_team"] == t]["total_runs"].sum()
+        return [er, sixes, fours, doubles, singles, total_runs]
+
+    df = pd.DataFrame(columns=["info", f"{t1}", f"{t2}"], index=None)
+    df["info"] = ["Extra Runs", "Sixes", "Fours", "Doubles", "Singles", "Total Runs"]
+    df[f"{t1}"] = info(t1)
+    df[f"{t2}"] = info(t2)
+    return df
+
+
+def timed(label, pairs, compute):
+    started = time.perf_counter()
+    tables = [compute(t1, t2) for t1, t2 in pairs]
+    elapsed = time.perf_counter() - started
+    print(f"⏱️ {label}: {elapsed:.3f}s for {len(pairs)} pairs ({elapsed / len(pairs) * 1000:.2f} ms/pair)")
+    return tables
+
+
+def main():
+    """Check the head-to-head table against the previous info() and time both."""
+    ensure_large_files_exist()
+    matches = load_matches_data()
+    deliveries = load_deliveries_data(TEAM_PAIR_COLUMNS)
+    team_pairs = load_team_pairs()
+
+    combine_df = matches.merge(deliveries, left_on="id", right_on="match_id", how="left")
+    teams = matches["team1"].unique().tolist()
+    pairs = [
+        (t1, t2) for t1, t2 in itertools.combinations(teams, 2)
+        if len(team_pairs.matches(matches, t1, t2)) + len(team_pairs.matches(matches, t2, t1))
+    ]
+
+    # The previous version gets its head-to-head deliveries prebuilt, as the page had them
+    total_del = {
+        (t1, t2): combine_df[
+            ((combine_df["batting_team"] == t1) & (combine_df["bowling_team"] == t2))
+            | ((combine_df["batting_team"] == t2) & (combine_df["bowling_team"] == t1))
+        ]
+        for t1, t2 in pairs
+    }
+
+    before = timed(
+        "previous info() on total_del", pairs,
+        lambda t1, t2: previous_info(total_del[(t1, t2)], t1, t2),
+    )
+    from_cube = timed("team-pair cube", pairs, team_pairs.head_to_head)
+
+    mismatches = [
+        pair for pair, old, cube in zip(pairs, before, from_cube)
+        if not old.astype(str).equals(cube.astype(str))
+    ]
+    if mismatches:
+        print(f"❌ Tables differ for {mismatches}")
+        sys.exit(1)
+    print(f"🎉 All {len(pairs)} head-to-head tables match")
+
+
+if __name__ == "__main__":
+    main()
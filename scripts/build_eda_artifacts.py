@@ -0,0 +1,23 @@
+import os
+import sys
+
+# Allow running as `python scripts/build_eda_artifacts.py` from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from src.analysis.datasetPreprocessing import ensure_large_files_exist
+from src.pages.exploratoryDataAnalysis import eda_fingerprint, sections
+
+
+def main():
+    """Compute every EDA section and save its statistics and figures into the dataset cache ahead of serving."""
+    ensure_large_files_exist()
+    sections.build_artifacts(eda_fingerprint())
+    print("🎉 EDA artifacts ready")
+
+
+if __name__ == "__main__":
+    main()
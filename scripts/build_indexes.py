@@ -0,0 +1,31 @@
+import os
+import sys
+
+# Allow running as `python scripts/build_indexes.py` from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis.datasetPreprocessing import ensure_large_files_exist
+from src.analysis.deliveriesIndex import load_match_index, load_matchup_index, load_player_index
+from src.analysis.matchupMatrix import load_matchup_matrix
+from src.analysis.overRates import load_over_rates
+from src.analysis.playerProfiles import load_player_profiles
+from src.analysis.scorecards import load_scorecards
+from src.analysis.teamPairs import load_team_pairs
+
+
+def main():
+    """Build the deliveries indexes and precomputed stores into the dataset cache ahead of serving."""
+    ensure_large_files_exist()
+    load_match_index()
+    load_player_index()
+    load_matchup_index()
+    load_matchup_matrix()
+    load_team_pairs()
+    load_over_rates()
+    load_player_profiles()
+    load_scorecards()
+    print("🎉 Deliveries indexes ready")
+
+
+if __name__ == "__main__":
+    main()
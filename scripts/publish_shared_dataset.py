@@ -0,0 +1,20 @@
+import os
+import sys
+
+# Allow running as `python scripts/publish_shared_dataset.py` from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis.datasetPreprocessing import ensure_large_files_exist, publish_shared_deliveries
+
+
+def main():
+    """Publish the preprocessed deliveries into the shared store used by IPL_SHARED_DATASET=1 workers."""
+    ensure_large_files_exist()
+    path = publish_shared_deliveries()
+    if path is None:
+        sys.exit(1)
+    print(f"🎉 Shared deliveries ready at {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import os
+import shutil
+import hashlib
+import numpy as np
+import pandas as pd
+
+# Directory holding the preprocessed column stores (override with IPL_CACHE_DIR)
+CACHE_DIR = os.getenv("IPL_CACHE_DIR", ".cache")
+
+# Bump when the on-disk layout written by save_frame changes
+CACHE_FORMAT_VERSION = "2"
+
+
+def file_fingerprint(path, chunk_size=1 << 20):
+    """Return a content hash of a file"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_fingerprint(*paths):
+    """Return a hash of the given source files, used as the preprocessing code version"""
+    digest = hashlib.sha1(CACHE_FORMAT_VERSION.encode())
+    for path in paths:
+        digest.update(file_fingerprint(path).encode())
+    return digest.hexdigest()
+
+
+def cache_key(source_path, code_version):
+    """Combine the source CSV fingerprint and the code version into a cache key"""
+    digest = hashlib.sha1()
+    digest.update(file_fingerprint(source_path).encode())
+    digest.update(code_version.encode())
+    return digest.hexdigest()[:16]
+
+
+def cache_path(name, key):
+    return os.path.join(CACHE_DIR, f"{name}-{key}")
+
+
+def _encode_column(series):
+    """Split a column into the arrays stored on disk"""
+    if series.dtype == "object":
+        codes, categories = pd.factorize(series, sort=True)
+        return {
+            "codes": codes.astype(np.int32),
+            "categories": np.asarray(categories, dtype=str),
+        }
+    return {"values": series.to_numpy()}
+
+
+def _decode_column(arrays):
+    """Rebuild a column from the arrays stored on disk"""
+    if "codes" in arrays:
+        # The trailing NaN is picked up by the -1 codes of missing values
+        categories = np.append(arrays["categories"].astype(object), np.nan)
+        return categories[arrays["codes"]]
+    return arrays["values"]
+
+
+def _save_array(directory, filename, array):
+    """Write one array so that readers only ever see a complete file"""
+    tmp = os.path.join(directory, f".{filename}.tmp-{os.getpid()}")
+    with open(tmp, "wb") as f:
+        np.save(f, array, allow_pickle=False)
+    os.replace(tmp, os.path.join(directory, filename))
+
+
+def save_frame(df, name, key):
+    """Persist the columns of a preprocessed frame as .npy files, adding to any columns already cached"""
+    target = cache_path(name, key)
+    try:
+        if not os.path.isdir(target):
+            os.makedirs(target, exist_ok=True)
+            remove_stale(CACHE_DIR, name, key)
+        for col in df.columns:
+            arrays = _encode_column(df[col])
+            # "categories" sorts before "codes": the codes/values file marks a complete column
+            for part in sorted(arrays):
+                _save_array(target, f"{col}.{part}.npy", arrays[part])
+        print(f"💾 Cached {len(df.columns)} {name} columns at {target}")
+    except OSError as e:
+        print(f"⚠️ Could not write {name} cache: {str(e)}")
+
+
+def cached_columns(name, key):
+    """Names of the columns cached for the key"""
+    target = cache_path(name, key)
+    if not os.path.isdir(target):
+        return set()
+    columns = set()
+    for entry in os.listdir(target):
+        for suffix in (".codes.npy", ".values.npy"):
+            if entry.endswith(suffix) and not entry.startswith("."):
+                columns.add(entry[: -len(suffix)])
+    return columns
+
+
+def load_frame(name, key, columns):
+    """Load whichever of the requested columns are cached for the key, or None if none are"""
+    target = cache_path(name, key)
+    available = cached_columns(name, key)
+    try:
+        data = {}
+        for col in columns:
+            if col not in available:
+                continue
+            if os.path.exists(os.path.join(target, f"{col}.codes.npy")):
+                parts = ["codes", "categories"]
+            else:
+                parts = ["values"]
+            arrays = {
+                part: np.load(os.path.join(target, f"{col}.{part}.npy"), allow_pickle=False)
+                for part in parts
+            }
+            data[col] = _decode_column(arrays)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Ignoring unreadable {name} cache: {str(e)}")
+        return None
+    if not data:
+        return None
+    return pd.DataFrame(data, columns=list(data))
+
+
+def load_codes(name, key, column):
+    """(codes, categories) of a cached text column, or None when it is not cached as codes"""
+    target = cache_path(name, key)
+    try:
+        codes = np.load(os.path.join(target, f"{column}.codes.npy"), allow_pickle=False)
+        categories = np.load(os.path.join(target, f"{column}.categories.npy"), allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    return codes, pd.Index(categories.astype(object))
+
+
+def index_path(name, key, label):
+    return os.path.join(cache_path(name, key), "indexes", label)
+
+
+def save_arrays(name, key, label, arrays):
+    """Persist named arrays derived from a cached dataset (e.g. an index) next to its columns"""
+    target = index_path(name, key, label)
+    try:
+        if not os.path.isdir(cache_path(name, key)):
+            os.makedirs(target, exist_ok=True)
+            remove_stale(CACHE_DIR, name, key)
+        os.makedirs(target, exist_ok=True)
+        # Drop copies of the same index written by older code or for older data
+        prefix = label.split("-")[0] + "-"
+        for entry in os.listdir(os.path.dirname(target)):
+            if entry.startswith(prefix) and entry != label:
+                shutil.rmtree(os.path.join(os.path.dirname(target), entry), ignore_errors=True)
+        for part, array in arrays.items():
+            _save_array(target, f"{part}.npy", array)
+    except OSError as e:
+        print(f"⚠️ Could not write {name} {label}: {str(e)}")
+
+
+def load_arrays(name, key, label, parts, mmap_mode=None):
+    """Load the named arrays saved by save_arrays, or None if any is missing
+
+    With mmap_mode="r" the arrays are mapped rather than read, so only the
+    slices used are ever loaded from disk.
+    """
+    target = index_path(name, key, label)
+    try:
+        return {
+            part: np.load(os.path.join(target, f"{part}.npy"), allow_pickle=False, mmap_mode=mmap_mode)
+            for part in parts
+        }
+    except (OSError, ValueError):
+        return None
+
+
+def remove_stale(base_dir, name, key):
+    """Delete directories of the same dataset written for older keys"""
+    prefix = f"{name}-"
+    for entry in os.listdir(base_dir):
+        if entry.startswith(prefix) and entry != f"{name}-{key}" and ".tmp-" not in entry:
+            shutil.rmtree(os.path.join(base_dir, entry), ignore_errors=True)
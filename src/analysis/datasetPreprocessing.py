@@ -1,46 +1,245 @@
 import pandas as pd
 import os
+import threading
+from . import datasetCache
+from .datasetCache import cache_key, code_fingerprint, load_frame, save_frame
+from .sharedDataset import attach_frame, publish_frame
+from ..utils.singleFlight import SingleFlight
+
+MATCHES_CSV = "Datasets/matches_2008-2024.csv"
+DELIVERIES_CSV = "Datasets/deliveries_2008-2024.csv"
+
+# Set IPL_COMPACT_DELIVERIES=1 to hold deliveries as categoricals and small integers
+COMPACT_DELIVERIES = os.getenv("IPL_COMPACT_DELIVERIES", "0") == "1"
+
+# Set IPL_SHARED_DATASET=1 to map deliveries from a store shared by every worker on the host
+SHARED_DELIVERIES = os.getenv("IPL_SHARED_DATASET", "0") == "1"
 
 # Global variables for cached data
 _matches_df = None
 _deliveries_df = None
 
+def _download_large_files():
+    print("📥 Downloading large files...")
+    from scripts.download_large_files import download_large_files
+    download_large_files()
+
+
+_download_flight = SingleFlight("large files", _download_large_files)
+
+
 def ensure_large_files_exist():
     """Ensure large files are downloaded before loading data"""
     # Note: Score model is now in Git LFS, only CSV and winner model need downloading
-    if not os.path.exists("Datasets/deliveries_2008-2024.csv") or not os.path.exists("Model/winner_prediction_model.pkl"):
-        print("📥 Downloading large files...")
-        from scripts.download_large_files import download_large_files
-        download_large_files()
+    if not os.path.exists(DELIVERIES_CSV) or not os.path.exists("Model/winner_prediction_model.pkl"):
+        _download_flight.get()
 
-def load_matches_data():
-    """Load and preprocess matches data (lazy loading)"""
+def _preprocessing_version():
+    """Fingerprint of the code that shapes the cached frames"""
+    return code_fingerprint(__file__, datasetCache.__file__)
+
+
+# Dataset keys by file stat, so asking for the key of an unchanged CSV does not hash it again
+_dataset_keys = {}
+
+
+def _dataset_key(csv_path):
+    stat = os.stat(csv_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _dataset_keys.get(csv_path)
+    if cached is None or cached[0] != signature:
+        cached = (signature, cache_key(csv_path, _preprocessing_version()))
+        _dataset_keys[csv_path] = cached
+    return cached[1]
+
+
+def csv_columns(csv_path):
+    """Column names of a dataset CSV, as they appear after preprocessing"""
+    return pd.read_csv(csv_path, nrows=0).columns.str.strip().tolist()
+
+
+def _read_csv_columns(csv_path, columns):
+    """Read only the given columns of a CSV"""
+    wanted = set(columns)
+    df = pd.read_csv(csv_path, usecols=lambda col: col.strip() in wanted)
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _load_cached(name, csv_path, build, columns=None):
+    """Return preprocessed columns, reading the CSV only for the columns missing from the cache"""
+    key = _dataset_key(csv_path)
+    if columns is None:
+        columns = csv_columns(csv_path)
+    df = load_frame(name, key, columns)
+    missing = [col for col in columns if df is None or col not in df.columns]
+    if not missing:
+        print(f"⚡ Loaded {name} data from cache")
+        return df
+    built = build(csv_path, missing)
+    save_frame(built, name, key)
+    if df is None:
+        return built
+    return _merge_columns([df, built], columns)
+
+
+def _merge_columns(frames, order):
+    """Combine frames holding different columns of the same rows, without copying them"""
+    data = {}
+    for frame in frames:
+        if frame is not None:
+            for col in frame.columns:
+                data[col] = frame[col]
+    return pd.DataFrame({col: data[col] for col in order if col in data}, copy=False)
+
+
+def _build_matches(csv_path, columns):
+    print("📊 Loading matches data...")
+    df = _read_csv_columns(csv_path, columns)
+    df = trimSpaceInValues(df)
+    df = latest_teams(df, [col for col in ['team1', 'team2', 'winner'] if col in df.columns])
+    if "venue" in df.columns:
+        unique_stadium(df)
+    return df
+
+
+def _build_deliveries(csv_path, columns):
+    print(f"🏏 Loading deliveries data ({len(columns)} columns)...")
+    return _preprocess_deliveries(_read_csv_columns(csv_path, columns))
+
+
+def _preprocess_deliveries(df):
+    df = trimSpaceInValues(df)
+    df = latest_teams(df, [col for col in ['batting_team', 'bowling_team'] if col in df.columns])
+
+    # Replacing the empty values in the 'extra_types' with 'None' when it is normal deliveries
+    if "extras_type" in df.columns:
+        df.loc[df["extras_type"].str.strip() == "", "extras_type"] = "None"
+    return df
+
+
+def matches_key():
+    """Cache key of the current matches data, shared by everything derived from it"""
+    return _dataset_key(MATCHES_CSV)
+
+
+def deliveries_key():
+    """Cache key of the current deliveries data, shared by everything derived from it"""
+    return _dataset_key(DELIVERIES_CSV)
+
+
+def _load_matches():
     global _matches_df
-    if _matches_df is None:
+    ensure_large_files_exist()
+    # The key is taken before reading, so a file replaced during the load is loaded again
+    key = matches_key()
+    _matches_df = _load_cached("matches", MATCHES_CSV, _build_matches)
+    return key, _matches_df
+
+
+# Union of the deliveries columns requested so far; the cached frame holds all of them
+_deliveries_requested = set()
+_deliveries_requested_lock = threading.Lock()
+_deliveries_header = None
+
+
+def deliveries_columns():
+    """All columns of the deliveries dataset"""
+    global _deliveries_header
+    if _deliveries_header is None:
         ensure_large_files_exist()
-        print("📊 Loading matches data...")
-        _matches_df = pd.read_csv("Datasets/matches_2008-2024.csv")
-        _matches_df.columns = _matches_df.columns.str.strip()
-        _matches_df = trimSpaceInValues(_matches_df)
-        _matches_df = latest_teams(_matches_df, ['team1', 'team2', 'winner'])
-        unique_stadium(_matches_df)
-    return _matches_df
-
-def load_deliveries_data():
-    """Load and preprocess deliveries data (lazy loading)"""
+        _deliveries_header = csv_columns(DELIVERIES_CSV)
+    return _deliveries_header
+
+
+def _load_deliveries():
     global _deliveries_df
-    if _deliveries_df is None:
-        ensure_large_files_exist()
-        print("🏏 Loading deliveries data...")
-        _deliveries_df = pd.read_csv("Datasets/deliveries_2008-2024.csv")
-        _deliveries_df.columns = _deliveries_df.columns.str.strip()
-        _deliveries_df = trimSpaceInValues(_deliveries_df)
-        _deliveries_df = latest_teams(_deliveries_df, ['batting_team', 'bowling_team'])
-        
-        # Replacing the empty values in the 'extra_types' with 'None' when it is normal deliveries
-        _deliveries_df.loc[_deliveries_df["extras_type"].str.strip() == "", "extras_type"] = "None"
+    ensure_large_files_exist()
+    with _deliveries_requested_lock:
+        requested = set(_deliveries_requested)
+    columns = [col for col in deliveries_columns() if col in requested]
+
+    current = _deliveries_df
+    missing = [col for col in columns if current is None or col not in current.columns]
+    if not missing:
+        return current
+    if SHARED_DELIVERIES:
+        loaded = _attach_shared_deliveries(missing)
+    else:
+        loaded = _load_cached("deliveries", DELIVERIES_CSV, _build_deliveries, missing)
+    deliveries = _merge_columns([current, loaded], columns)
+    if COMPACT_DELIVERIES and not SHARED_DELIVERIES:
+        deliveries = compact_deliveries(deliveries)
+    _deliveries_df = deliveries
     return _deliveries_df
 
+
+def publish_shared_deliveries():
+    """Publish compact deliveries for the workers on this host, returning the store path"""
+    key = deliveries_key()
+    deliveries = _load_cached("deliveries", DELIVERIES_CSV, _build_deliveries)
+    return publish_frame(compact_deliveries(deliveries), "deliveries", key)
+
+
+def _attach_shared_deliveries(columns):
+    key = deliveries_key()
+    deliveries = attach_frame("deliveries", key, columns)
+    if deliveries is None:
+        # Nobody has published this version yet, so this worker does it
+        publish_shared_deliveries()
+        deliveries = attach_frame("deliveries", key, columns)
+    if deliveries is None:
+        print("⚠️ Shared deliveries unavailable, using a private compact copy")
+        deliveries = compact_deliveries(
+            _load_cached("deliveries", DELIVERIES_CSV, _build_deliveries, columns)
+        )
+    else:
+        print("🔗 Attached shared deliveries data")
+    return deliveries
+
+
+# One flight per dataset: concurrent sessions wait for a single load
+_matches_flight = SingleFlight("matches", _load_matches)
+_deliveries_flight = SingleFlight("deliveries", _load_deliveries)
+
+
+def load_keyed_matches():
+    """(key, matches data), with the key of the file the frame was read from (reloaded when the file changes)"""
+    return _matches_flight.get(is_stale=lambda loaded: loaded[0] != matches_key())
+
+
+def load_matches_data():
+    """Load and preprocess matches data (lazy loading)"""
+    return load_keyed_matches()[1]
+
+def load_deliveries_data(columns=None):
+    """Load and preprocess deliveries data (lazy loading)
+
+    Pass the columns a page needs to load only those; the returned frame holds
+    at least them, shared with every other page that asked for columns.
+    """
+    all_columns = deliveries_columns()
+    wanted = set(all_columns if columns is None else columns)
+    unknown = wanted.difference(all_columns)
+    if unknown:
+        raise KeyError(f"Columns {sorted(unknown)} not found in deliveries data")
+
+    with _deliveries_requested_lock:
+        _deliveries_requested.update(wanted)
+    return _deliveries_flight.get(is_stale=lambda df: not wanted.issubset(df.columns))
+
+
+def read_deliveries_head(rows=5):
+    """First rows of the preprocessed deliveries data, read without loading the rest of the table"""
+    ensure_large_files_exist()
+    df = pd.read_csv(DELIVERIES_CSV, nrows=rows)
+    df.columns = df.columns.str.strip()
+    return _preprocess_deliveries(df)
+
+def load_state():
+    """Load state (idle/loading/ready/failed) and timing of each dataset"""
+    return [_matches_flight.status(), _deliveries_flight.status()]
+
 # Public interface (backward compatibility)
 def get_matches_data():
     return load_matches_data()
@@ -112,5 +311,66 @@ def trimSpaceInValues(df):
     return df
 
 
+# Columns sharing one categorical dtype in the compact deliveries frame
+SHARED_CATEGORY_COLUMNS = {
+    "player": ["batter", "bowler", "non_striker", "player_dismissed", "fielder"],
+    "team": ["batting_team", "bowling_team"],
+    "extras_type": ["extras_type"],
+    "dismissal_kind": ["dismissal_kind"],
+}
+
+# Narrow integer types for the compact deliveries frame
+COMPACT_INT_COLUMNS = {
+    "inning": "int8",
+    "over": "int8",
+    "ball": "int8",
+    "batsman_runs": "int8",
+    "extra_runs": "int8",
+    "total_runs": "int16",
+    "is_wicket": "int8",
+}
+
+
+def frame_memory_mb(df):
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+
+def compact_deliveries(df, report=True):
+    """Return a copy of deliveries with shared categoricals and downcast integers"""
+    compact = df.copy(deep=False)
+
+    for cols in SHARED_CATEGORY_COLUMNS.values():
+        values = set()
+        for col in cols:
+            if col not in df.columns:
+                continue
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                values.update(df[col].cat.categories)
+            elif df[col].dtype == "object":
+                values.update(df[col].dropna().unique())
+        if not values:
+            continue
+        # Columns loaded later widen the shared categories of those loaded before
+        dtype = pd.CategoricalDtype(sorted(values))
+        for col in cols:
+            if col in df.columns and df[col].dtype != dtype and (
+                df[col].dtype == "object" or isinstance(df[col].dtype, pd.CategoricalDtype)
+            ):
+                compact[col] = df[col].astype(dtype)
+
+    for col, dtype in COMPACT_INT_COLUMNS.items():
+        if col in df.columns and df[col].dtype.kind == "i":
+            compact[col] = df[col].astype(dtype)
+
+    if report:
+        before = frame_memory_mb(df)
+        after = frame_memory_mb(compact)
+        print(
+            f"🗜️ Compact deliveries: {before:.1f} MB -> {after:.1f} MB "
+            f"({(1 - after / before) * 100:.0f}% smaller)"
+        )
+    return compact
+
+
 # Note: Data is now loaded lazily through functions above.
 # This ensures files are downloaded before loading during cloud deployment.
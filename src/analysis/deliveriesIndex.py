@@ -0,0 +1,293 @@
+import numpy as np
+import pandas as pd
+from .datasetCache import code_fingerprint, load_arrays, save_arrays
+from .datasetPreprocessing import deliveries_key, load_deliveries_data
+from ..utils.singleFlight import SingleFlight
+
+# Deliveries columns the match index is sorted by
+MATCH_INDEX_COLUMNS = ["match_id", "inning", "over", "ball"]
+
+MATCH_INDEX_PARTS = ["order", "match_ids", "innings", "starts", "stops"]
+
+# Deliveries columns holding a player, indexed by the player index
+PLAYER_ROLES = ["batter", "bowler", "non_striker", "player_dismissed"]
+
+PLAYER_INDEX_PARTS = ["players"] + [
+    f"{role}_{part}" for role in PLAYER_ROLES for part in ("order", "offsets")
+]
+
+MATCHUP_INDEX_COLUMNS = ["batter", "bowler"]
+
+MATCHUP_INDEX_PARTS = ["keys", "names", "batter_keys", "bowler_keys", "pairs", "order", "offsets"]
+
+
+def build_match_index(deliveries):
+    """Sort deliveries by (match_id, inning, over, ball) into per-inning row ranges
+
+    Returns the arrays of the index: the row order of the sorted deliveries and,
+    for every (match_id, inning), the start and stop of its range in that order.
+    """
+    keys = [deliveries[col].to_numpy() for col in MATCH_INDEX_COLUMNS]
+    # lexsort sorts by the last key first; it is stable, so ties keep file order
+    order = np.lexsort(keys[::-1])
+    match_ids = keys[0][order]
+    innings = keys[1][order]
+
+    boundaries = np.flatnonzero((np.diff(match_ids) != 0) | (np.diff(innings) != 0)) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [len(order)]))
+    return {
+        "order": order.astype(np.int64),
+        "match_ids": match_ids[starts].astype(np.int64),
+        "innings": innings[starts].astype(np.int64),
+        "starts": starts.astype(np.int64),
+        "stops": stops.astype(np.int64),
+    }
+
+
+class MatchIndex:
+    """Row positions of each match and inning in the deliveries frame"""
+
+    def __init__(self, arrays):
+        self.order = arrays["order"]
+        self._innings = {}
+        self._matches = {}
+        for match_id, inning, start, stop in zip(
+            arrays["match_ids"].tolist(), arrays["innings"].tolist(),
+            arrays["starts"].tolist(), arrays["stops"].tolist(),
+        ):
+            self._innings[(match_id, inning)] = (start, stop)
+            first, _ = self._matches.get(match_id, (start, stop))
+            self._matches[match_id] = (first, stop)
+
+    def match_ids(self):
+        return list(self._matches)
+
+    def rows(self, match_id, inning=None):
+        """Row positions of a match (or one of its innings), ordered by over and ball"""
+        if inning is None:
+            start, stop = self._matches.get(int(match_id), (0, 0))
+        else:
+            start, stop = self._innings.get((int(match_id), int(inning)), (0, 0))
+        return self.order[start:stop]
+
+    def take(self, deliveries, match_id, inning=None):
+        """Deliveries of a match (or one of its innings)"""
+        return deliveries.iloc[self.rows(match_id, inning)]
+
+
+def build_player_index(deliveries):
+    """Group the row positions of every player by role
+
+    Returns the arrays of the index: the sorted player directory and, for each
+    role column, the rows ordered by player with each player's offsets into them.
+    """
+    names = set()
+    for role in PLAYER_ROLES:
+        names.update(deliveries[role].dropna().unique())
+    players = np.array(sorted(names), dtype=str)
+
+    arrays = {"players": players}
+    directory = pd.Index(players)
+    for role in PLAYER_ROLES:
+        codes = directory.get_indexer(np.asarray(deliveries[role], dtype=object))
+        # Stable, so every player's rows stay in file order; -1 (no player) sorts first
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(players))
+        offsets = np.concatenate(([0], np.cumsum(counts))) + np.count_nonzero(codes < 0)
+        arrays[f"{role}_order"] = order.astype(np.int64)
+        arrays[f"{role}_offsets"] = offsets.astype(np.int64)
+    return arrays
+
+
+class PlayerIndex:
+    """Row positions of each player as batter, bowler, non-striker and dismissed player"""
+
+    def __init__(self, arrays):
+        self.players = arrays["players"].tolist()
+        self._codes = {player: code for code, player in enumerate(self.players)}
+        self._orders = {role: arrays[f"{role}_order"] for role in PLAYER_ROLES}
+        self._offsets = {role: arrays[f"{role}_offsets"] for role in PLAYER_ROLES}
+
+    def count(self, player, role):
+        code = self._codes.get(player)
+        if code is None:
+            return 0
+        offsets = self._offsets[role]
+        return int(offsets[code + 1] - offsets[code])
+
+    def counts(self, role):
+        """Rows of every player of the directory in the role"""
+        return np.diff(self._offsets[role])
+
+    def directory(self, roles=("batter", "bowler")):
+        """Sorted players who appear in any of the roles"""
+        appears = np.zeros(len(self.players), dtype=bool)
+        for role in roles:
+            appears |= self.counts(role) > 0
+        return [player for player, found in zip(self.players, appears) if found]
+
+    def rows(self, player, role):
+        """Row positions (in file order) where the player is in the role"""
+        code = self._codes.get(player)
+        if code is None:
+            return self._orders[role][:0]
+        offsets = self._offsets[role]
+        return self._orders[role][offsets[code]:offsets[code + 1]]
+
+    def take(self, deliveries, player, role):
+        """Deliveries where the player is in the role"""
+        return deliveries.iloc[self.rows(player, role)]
+
+
+def group_rows(codes):
+    """Group row positions by a non-negative integer code (-1 rows are left out)
+
+    Returns the row order, the sorted distinct codes and the offsets of each
+    code's rows in that order. The sort is stable, so each group keeps row order.
+    """
+    order = np.argsort(codes, kind="stable")
+    groups, starts = np.unique(codes[order], return_index=True)
+    offsets = np.append(starts, len(order))
+    if len(groups) and groups[0] < 0:
+        groups, offsets = groups[1:], offsets[1:]
+    return order, groups, offsets
+
+
+def normalize_player(name):
+    """Join key of a player name: case and surrounding spaces are ignored"""
+    return name.strip().lower()
+
+
+def _player_keys(column, directory):
+    # Normalize each distinct name once, then map every row through its code
+    codes, uniques = pd.factorize(column)
+    normalized = directory.get_indexer([normalize_player(str(name)) for name in uniques])
+    return np.where(codes >= 0, normalized[codes], -1).astype(np.int32)
+
+
+def build_matchup_index(deliveries):
+    """Key every delivery by its normalized (batter, bowler) pair
+
+    Returns the arrays of the index: the sorted normalized player keys, the
+    integer batter and bowler key of every row, and the rows grouped by pair
+    with the offsets of each pair into them.
+    """
+    # Display name of each key: the first spelling in sorted order
+    names = {}
+    for col in MATCHUP_INDEX_COLUMNS:
+        for name in sorted(str(name).strip() for name in deliveries[col].dropna().unique()):
+            names.setdefault(normalize_player(name), name)
+    keys = np.array(sorted(names), dtype=str)
+    directory = pd.Index(keys)
+
+    batter_keys = _player_keys(deliveries["batter"], directory)
+    bowler_keys = _player_keys(deliveries["bowler"], directory)
+    valid = (batter_keys >= 0) & (bowler_keys >= 0)
+    codes = np.where(valid, batter_keys.astype(np.int64) * len(keys) + bowler_keys, -1)
+
+    order, pairs, offsets = group_rows(codes)
+    return {
+        "keys": keys,
+        "names": np.array([names[key] for key in keys], dtype=str),
+        "batter_keys": batter_keys,
+        "bowler_keys": bowler_keys,
+        "pairs": pairs.astype(np.int64),
+        "order": order.astype(np.int64),
+        "offsets": offsets.astype(np.int64),
+    }
+
+
+class MatchupIndex:
+    """Rows of every (batter, bowler) pair, looked up by normalized player keys"""
+
+    def __init__(self, arrays):
+        self.batter_keys = arrays["batter_keys"]
+        self.bowler_keys = arrays["bowler_keys"]
+        self.order = arrays["order"]
+        self.offsets = arrays["offsets"]
+        self.pairs = arrays["pairs"]
+        self.names = arrays["names"]
+        self._keys = {key: code for code, key in enumerate(arrays["keys"].tolist())}
+        self._pair_positions = {pair: i for i, pair in enumerate(self.pairs.tolist())}
+
+    def key(self, player):
+        """Integer key of a player, or None if they never batted or bowled"""
+        return self._keys.get(normalize_player(player))
+
+    def pair(self, batter, bowler):
+        """Position of the (batter, bowler) pair, or None if they never met"""
+        batter_key, bowler_key = self.key(batter), self.key(bowler)
+        if batter_key is None or bowler_key is None:
+            return None
+        return self._pair_positions.get(batter_key * len(self._keys) + bowler_key)
+
+    def batter_pairs(self, batter):
+        """Positions of every pair the batter is part of"""
+        batter_key = self.key(batter)
+        if batter_key is None:
+            return np.zeros(0, dtype=np.int64)
+        # Pairs are sorted by batter key first, so the batter's pairs are contiguous
+        first = batter_key * len(self._keys)
+        start, stop = np.searchsorted(self.pairs, [first, first + len(self._keys)])
+        return np.arange(start, stop)
+
+    def bowlers_of(self, pairs):
+        """Display names of the bowlers of the given pairs"""
+        return self.names[self.pairs[pairs] % len(self._keys)]
+
+    def rows(self, batter, bowler):
+        """Row positions (in file order) where the batter faced the bowler"""
+        pair = self.pair(batter, bowler)
+        if pair is None:
+            return self.order[:0]
+        return self.order[self.offsets[pair]:self.offsets[pair + 1]]
+
+    def take(self, deliveries, batter, bowler):
+        """Deliveries where the batter faced the bowler"""
+        return deliveries.iloc[self.rows(batter, bowler)]
+
+
+def _load_index(name, columns, parts, build):
+    """Load a persisted index over deliveries, building and saving it when missing"""
+    key = deliveries_key()
+    # Rebuild persisted indexes whenever this module changes
+    label = f"{name.replace(' ', '_')}-{code_fingerprint(__file__)[:12]}"
+    arrays = load_arrays("deliveries", key, label, parts)
+    if arrays is None:
+        print(f"🗂️ Building {name}...")
+        arrays = build(load_deliveries_data(columns))
+        save_arrays("deliveries", key, label, arrays)
+    return arrays
+
+
+def _load_match_index():
+    return MatchIndex(_load_index("match index", MATCH_INDEX_COLUMNS, MATCH_INDEX_PARTS, build_match_index))
+
+
+def _load_player_index():
+    return PlayerIndex(_load_index("player index", PLAYER_ROLES, PLAYER_INDEX_PARTS, build_player_index))
+
+
+def _load_matchup_index():
+    return MatchupIndex(_load_index("matchup index", MATCHUP_INDEX_COLUMNS, MATCHUP_INDEX_PARTS, build_matchup_index))
+
+
+_match_index_flight = SingleFlight("match index", _load_match_index)
+_player_index_flight = SingleFlight("player index", _load_player_index)
+_matchup_index_flight = SingleFlight("matchup index", _load_matchup_index)
+
+
+def load_match_index():
+    """Load the match_id/inning range index over deliveries (lazy loading)"""
+    return _match_index_flight.get()
+
+
+def load_player_index():
+    """Load the per-player row index over deliveries (lazy loading)"""
+    return _player_index_flight.get()
+
+
+def load_matchup_index():
+    """Load the (batter, bowler) pair index over deliveries (lazy loading)"""
+    return _matchup_index_flight.get()
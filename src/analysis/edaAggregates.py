@@ -0,0 +1,188 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from .datasetCache import load_codes
+from .datasetPreprocessing import deliveries_key, load_deliveries_data
+from ..utils.singleFlight import SingleFlight
+
+# A grouped reduction of one value column, optionally over the rows where a column equals a value
+# ("count" needs no value column)
+Statistic = namedtuple("Statistic", ["group_by", "value", "reduction", "where"])
+
+# Deliveries statistics of the Exploratory Data Analysis page
+EDA_STATISTICS = {
+    "batter_runs": Statistic(["batter"], "batsman_runs", "sum", None),
+    "bowler_runs": Statistic(["bowler"], "total_runs", "sum", None),
+    "first_over_bowler_runs": Statistic(["bowler"], "total_runs", "sum", ("over", 0)),
+    "last_over_bowler_runs": Statistic(["bowler"], "total_runs", "sum", ("over", 19)),
+    "last_over_team_mean_runs": Statistic(["batting_team"], "total_runs", "mean", ("over", 19)),
+    "last_over_team_runs": Statistic(["batting_team"], "total_runs", "sum", ("over", 19)),
+    "innings_runs": Statistic(
+        ["match_id", "inning", "batting_team", "bowling_team"], "total_runs", "sum", None
+    ),
+}
+
+
+def _value_columns(stat):
+    """Columns a statistic reads besides its grouping columns"""
+    return ([stat.value] if stat.value else []) + ([stat.where[0]] if stat.where else [])
+
+
+def statistic_columns(statistics):
+    """Columns read by the statistics"""
+    columns = []
+    for stat in statistics.values():
+        for col in stat.group_by + _value_columns(stat):
+            if col not in columns:
+                columns.append(col)
+    return columns
+
+
+def _column_codes(column):
+    """Integer codes of a column and the label of each code (-1 for missing values)
+
+    Categorical columns keep their category order, other columns are sorted,
+    matching the group order of groupby(observed=True).
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy(), column.cat.categories
+    values = column.to_numpy()
+    if values.dtype.kind in "iu" and len(values):
+        low, high = int(values.min()), int(values.max())
+        if high - low <= 4 * len(values):
+            # A small integer range is coded through a lookup table of the values seen, without hashing
+            offsets = values - low
+            seen = np.flatnonzero(np.bincount(offsets, minlength=high - low + 1))
+            lookup = np.full(high - low + 1, -1, dtype=np.int64)
+            lookup[seen] = np.arange(len(seen))
+            return lookup[offsets], pd.Index(seen + low)
+    codes, labels = pd.factorize(column, sort=True)
+    return codes, labels
+
+
+def aggregate(frame, statistics, codes=None):
+    """Compute every statistic with bincounts over integer group codes
+
+    Each grouping column is coded once (or taken from codes, a dict of
+    column -> (codes, sorted labels)) and shared by all statistics that group
+    by it. Returns a Series per statistic, indexed by the observed groups in
+    groupby order; rows with a missing group value are left out.
+    """
+    coded = dict(codes or {})
+    values = {}
+    results = {}
+    for name, stat in statistics.items():
+        if stat.reduction not in ("count", "sum", "mean"):
+            raise ValueError(f"Unknown reduction {stat.reduction!r} of {name}")
+        for col in stat.group_by:
+            if col not in coded:
+                coded[col] = _column_codes(frame[col])
+        for col in _value_columns(stat):
+            if col not in values:
+                values[col] = frame[col].to_numpy()
+
+        col_codes = [coded[col][0] for col in stat.group_by]
+        sizes = [len(coded[col][1]) for col in stat.group_by]
+        keep = np.logical_and.reduce([c >= 0 for c in col_codes])
+        if stat.where is not None:
+            col, wanted = stat.where
+            keep &= values[col] == wanted
+        # Row-major keys order groups like a sort by every grouping column in turn
+        if len(sizes) > 1:
+            keys = np.ravel_multi_index([c[keep] for c in col_codes], sizes)
+        else:
+            keys = col_codes[0][keep]
+        value = values[stat.value][keep] if stat.value else None
+
+        space = int(np.prod(sizes, dtype=np.int64))
+        if space <= 16 * len(keys) + (1 << 20):
+            # Dense: a slot per possible group, of which the observed ones are kept
+            slots, groups = keys, None
+        else:
+            groups, slots = np.unique(keys, return_inverse=True)
+            space = len(groups)
+        counts = np.bincount(slots, minlength=space)
+        sums = np.bincount(slots, weights=value, minlength=space) if value is not None else None
+        if groups is None:
+            groups = np.flatnonzero(counts)
+            counts = counts[groups]
+            sums = sums[groups] if sums is not None else None
+
+        if stat.reduction == "count":
+            reduced = counts
+        elif stat.reduction == "sum":
+            reduced = sums.astype(np.int64) if value.dtype.kind in "iub" else sums
+        else:
+            reduced = sums / counts
+
+        group_codes = np.unravel_index(groups, sizes) if len(sizes) > 1 else (groups,)
+        labels = [coded[col][1][c] for col, c in zip(stat.group_by, group_codes)]
+        if len(labels) > 1:
+            index = pd.MultiIndex.from_arrays(labels, names=stat.group_by)
+        else:
+            index = pd.Index(labels[0], name=stat.group_by[0])
+        results[name] = pd.Series(reduced, index=index, name=stat.value or stat.reduction)
+    return results
+
+
+def cached_codes(deliveries, statistics):
+    """Codes of the text grouping columns, read from the deliveries cache
+
+    The cache stores text columns as codes of their sorted values already,
+    which saves hashing every value again.
+    """
+    key = deliveries_key()
+    codes = {}
+    for stat in statistics.values():
+        for col in stat.group_by:
+            if col in codes or deliveries[col].dtype != "object":
+                continue
+            cached = load_codes("deliveries", key, col)
+            if cached is not None and len(cached[0]) == len(deliveries):
+                codes[col] = cached
+    return codes
+
+
+def _load_eda_aggregates():
+    key = deliveries_key()
+    print("🧮 Aggregating EDA statistics...")
+    deliveries = load_deliveries_data(statistic_columns(EDA_STATISTICS))
+    return key, aggregate(deliveries, EDA_STATISTICS, cached_codes(deliveries, EDA_STATISTICS))
+
+
+_eda_aggregates_flight = SingleFlight("EDA aggregates", _load_eda_aggregates)
+
+
+def load_eda_aggregates():
+    """EDA deliveries statistics by name, aggregated once per deliveries data (lazy loading)"""
+    _, results = _eda_aggregates_flight.get(is_stale=lambda loaded: loaded[0] != deliveries_key())
+    return results
+
+
+def top_venue_wins(matches, n=10):
+    """Top n venues by wins of every team (in team1 order), from one team x venue win table
+
+    Venues a team won at equally often keep the order of the team's first win there.
+    """
+    teams = pd.Index(matches["team1"].dropna().unique())
+    venue_codes, venues = pd.factorize(matches["venue"])
+    team_codes = teams.get_indexer(matches["winner"])
+    won = np.flatnonzero((team_codes >= 0) & (venue_codes >= 0))
+    cells = team_codes[won].astype(np.int64) * len(venues) + venue_codes[won]
+
+    wins = np.bincount(cells, minlength=len(teams) * len(venues)).reshape(len(teams), len(venues))
+    first_win = np.full(len(teams) * len(venues), len(matches))
+    seen, first = np.unique(cells, return_index=True)
+    first_win[seen] = won[first]
+    first_win = first_win.reshape(wins.shape)
+
+    # Most wins first, earliest first win among ties
+    order = np.lexsort((first_win, -wins), axis=-1)[:, :n]
+    top = np.take_along_axis(wins, order, axis=-1)
+    result = []
+    for team, columns, counts in zip(teams, order, top):
+        kept = counts > 0
+        result.append((team, pd.Series(
+            counts[kept], index=pd.Index(venues[columns[kept]], name="venue"), name="count"
+        )))
+    return result
@@ -0,0 +1,73 @@
+from .datasetPreprocessing import load_keyed_matches, matches_key
+from ..utils.singleFlight import SingleFlight
+
+
+def _pair(team1, team2):
+    """Key of a team pair, whichever team is listed first"""
+    return (team1, team2) if team1 <= team2 else (team2, team1)
+
+
+class MatchCalendar:
+    """Matches nested by season, then team pair, then (date, match_id)
+
+    Built once from the matches frame, so the Match Scorecard selectors are
+    answered with dictionary lookups. Every match is kept as (date, match_id,
+    row), with the date as text and row its position in the matches frame,
+    in matches order.
+    """
+
+    def __init__(self, matches):
+        self._seasons = {}
+        self._teams = {}
+        rows = zip(
+            matches["season"].tolist(), matches["team1"].tolist(), matches["team2"].tolist(),
+            matches["date"].astype(str).tolist(), matches["id"].tolist(),
+        )
+        for row, (season, team1, team2, date, match_id) in enumerate(rows):
+            pairs = self._seasons.setdefault(season, {})
+            pairs.setdefault(_pair(team1, team2), []).append((date, match_id, row))
+            teams = self._teams.setdefault(season, {})
+            for team in (team1, team2):
+                teams.setdefault(team, []).append((date, match_id, row))
+
+    def seasons(self):
+        return sorted(self._seasons)
+
+    def teams(self, season):
+        """Teams that played in a season, by name"""
+        return sorted(self._teams.get(season, {}))
+
+    def pair_matches(self, season, team1, team2):
+        """(date, match_id, row) of every match between two teams in a season"""
+        if team1 is None or team2 is None:
+            return []
+        return self._seasons.get(season, {}).get(_pair(team1, team2), [])
+
+    def dates(self, season, team1, team2):
+        """Distinct dates the two teams met on in a season"""
+        return list(dict.fromkeys(date for date, _, _ in self.pair_matches(season, team1, team2)))
+
+    def match_row(self, season, team1, team2, date):
+        """Row of the first match between the two teams on a date, None if there is none"""
+        for match_date, _, row in self.pair_matches(season, team1, team2):
+            if match_date == date:
+                return row
+        return None
+
+    def team_matches(self, season, team):
+        """(date, match_id, row) of every match a team played in a season"""
+        return self._teams.get(season, {}).get(team, [])
+
+
+def _load_match_calendar():
+    key, matches = load_keyed_matches()
+    return key, MatchCalendar(matches)
+
+
+_match_calendar_flight = SingleFlight("match calendar", _load_match_calendar)
+
+
+def load_match_calendar():
+    """Season / team pair / date index of the matches, built once per matches data (lazy loading)"""
+    _, calendar = _match_calendar_flight.get(is_stale=lambda loaded: loaded[0] != matches_key())
+    return calendar
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+from . import deliveriesIndex
+from .datasetCache import code_fingerprint, load_arrays, save_arrays
+from .datasetPreprocessing import deliveries_key, load_deliveries_data
+from .deliveriesIndex import load_matchup_index
+from ..utils.singleFlight import SingleFlight
+
+# Deliveries columns the matchup matrix is computed from
+MATCHUP_MATRIX_COLUMNS = [
+    "batter",
+    "batsman_runs",
+    "total_runs",
+    "extras_type",
+    "is_wicket",
+    "player_dismissed",
+    "dismissal_kind",
+]
+
+# Extras counted per pair, as named in the extras_type column
+MATCHUP_EXTRAS = ["wides", "legbyes", "byes", "noballs", "penalty"]
+
+# Dismissals not credited to the bowler
+NON_BOWLER_DISMISSALS = ["run out", "retired hurt", "retired out", "obstructing the field"]
+
+MATCHUP_STATS = ["balls", "runs", "fours", "sixes", "dots"] + MATCHUP_EXTRAS + ["dismissals"]
+
+
+def build_matchup_matrix(deliveries, matchup_index):
+    """Sum the ball-by-ball stats of every (batter, bowler) pair
+
+    Returns one array per stat with a row per pair of the matchup index (a
+    sparse batter x bowler matrix: pairs that never met are not stored).
+    """
+    order = matchup_index.order
+    starts = matchup_index.offsets[:-1]
+    batsman_runs = deliveries["batsman_runs"].to_numpy()
+    extras_type = deliveries["extras_type"].astype(object).to_numpy()
+    dismissed = deliveries["player_dismissed"].astype(object).to_numpy()
+    per_ball = {
+        "balls": np.ones(len(deliveries), dtype=np.int32),
+        "runs": deliveries["total_runs"].to_numpy(),
+        "fours": batsman_runs == 4,
+        "sixes": batsman_runs == 6,
+        "dots": batsman_runs == 0,
+        "dismissals": (
+            (deliveries["is_wicket"].to_numpy() == 1)
+            & (dismissed == deliveries["batter"].astype(object).to_numpy())
+            & ~deliveries["dismissal_kind"].isin(NON_BOWLER_DISMISSALS).to_numpy()
+        ),
+    }
+    for extra in MATCHUP_EXTRAS:
+        per_ball[extra] = extras_type == extra
+
+    if len(starts) == 0:
+        return {stat: np.zeros(0, dtype=np.int32) for stat in MATCHUP_STATS}
+    # The rows of each pair are contiguous in the index order, so one reduceat sums every pair
+    return {
+        stat: np.add.reduceat(per_ball[stat].astype(np.int32)[order], starts).astype(np.int32)
+        for stat in MATCHUP_STATS
+    }
+
+
+class MatchupMatrix:
+    """Head-to-head totals of every (batter, bowler) pair"""
+
+    def __init__(self, arrays, matchup_index):
+        self.matchup_index = matchup_index
+        self.stats = arrays
+
+    def summary(self, batter, bowler):
+        """Totals of the batter against the bowler (all zero if they never met)"""
+        pair = self.matchup_index.pair(batter, bowler)
+        if pair is None:
+            return {stat: 0 for stat in MATCHUP_STATS}
+        return {stat: int(self.stats[stat][pair]) for stat in MATCHUP_STATS}
+
+    def batter_matchups(self, batter, min_balls=1):
+        """Totals of the batter against every bowler they faced at least min_balls times"""
+        pairs = self.matchup_index.batter_pairs(batter)
+        table = pd.DataFrame({stat: self.stats[stat][pairs] for stat in MATCHUP_STATS})
+        table.insert(0, "bowler", self.matchup_index.bowlers_of(pairs))
+        return table[table["balls"] >= min_balls].reset_index(drop=True)
+
+    def toughest_bowlers(self, batter, min_balls=12, n=10):
+        """Bowlers who dismissed the batter most often, then conceded the fewest runs per ball"""
+        table = self.batter_matchups(batter, min_balls)
+        table["strike_rate"] = table["runs"] / table["balls"] * 100
+        return table.sort_values(
+            ["dismissals", "strike_rate"], ascending=[False, True], kind="stable"
+        ).head(n)
+
+
+def _matrix_label():
+    # Rows follow the pairs of the matchup index, so it is rebuilt when either module changes
+    return f"matchup_matrix-{code_fingerprint(__file__, deliveriesIndex.__file__)[:12]}"
+
+
+def _load_matchup_matrix():
+    key = deliveries_key()
+    matchup_index = load_matchup_index()
+    arrays = load_arrays("deliveries", key, _matrix_label(), MATCHUP_STATS)
+    if arrays is None:
+        print("🗂️ Building matchup matrix...")
+        arrays = build_matchup_matrix(load_deliveries_data(MATCHUP_MATRIX_COLUMNS), matchup_index)
+        save_arrays("deliveries", key, _matrix_label(), arrays)
+    return MatchupMatrix(arrays, matchup_index)
+
+
+_matchup_matrix_flight = SingleFlight("matchup matrix", _load_matchup_matrix)
+
+
+def load_matchup_matrix():
+    """Load the batter x bowler matchup matrix (lazy loading)"""
+    return _matchup_matrix_flight.get()
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from .datasetCache import code_fingerprint, load_arrays, save_arrays
+from .datasetPreprocessing import deliveries_key, load_deliveries_data, load_matches_data, matches_key
+from ..utils.singleFlight import SingleFlight
+
+# Deliveries columns the over rates are computed from
+OVER_RATE_COLUMNS = ["match_id", "inning", "batting_team", "over", "total_runs"]
+
+OVER_RATE_PARTS = ["teams", "seasons", "innings", "overs", "runs", "balls"]
+
+
+def _axis_codes(values):
+    """Codes of every row on an axis and the sorted labels of the axis (-1 for missing values)"""
+    codes, labels = pd.factorize(values, sort=True)
+    return codes, np.asarray(labels)
+
+
+def build_over_rates(matches, deliveries):
+    """Sum runs and count balls per (batting team, season, inning, over)
+
+    Returns the arrays of a dense cube with one axis per key. Deliveries of
+    matches missing from the matches data go to an extra last season slot,
+    which only unfiltered totals include.
+    """
+    team_codes, teams = _axis_codes(np.asarray(deliveries["batting_team"], dtype=object))
+    inning_codes, innings = _axis_codes(deliveries["inning"].to_numpy())
+    over_codes, overs = _axis_codes(deliveries["over"].to_numpy())
+
+    seasons = np.sort(matches["season"].dropna().unique())
+    match_positions = pd.Index(matches["id"]).get_indexer(deliveries["match_id"])
+    match_seasons = np.searchsorted(seasons, matches["season"].to_numpy())
+    season_codes = np.where(match_positions >= 0, match_seasons[match_positions], len(seasons))
+
+    shape = (len(teams), len(seasons) + 1, len(innings), len(overs))
+    valid = (team_codes >= 0) & (inning_codes >= 0) & (over_codes >= 0)
+    cells = np.ravel_multi_index(
+        (team_codes[valid], season_codes[valid], inning_codes[valid], over_codes[valid]), shape
+    )
+    size = int(np.prod(shape))
+    runs = np.bincount(cells, weights=deliveries["total_runs"].to_numpy()[valid], minlength=size)
+    balls = np.bincount(cells, minlength=size)
+    return {
+        "teams": teams.astype(str),
+        "seasons": seasons.astype(np.int64),
+        "innings": innings.astype(np.int64),
+        "overs": overs.astype(np.int64),
+        "runs": runs.astype(np.int64).reshape(shape),
+        "balls": balls.astype(np.int64).reshape(shape),
+    }
+
+
+class OverRates:
+    """Runs per over of every batting team, by season, inning and over"""
+
+    def __init__(self, arrays):
+        self.teams = arrays["teams"].tolist()
+        self.seasons = arrays["seasons"]
+        self.innings = arrays["innings"]
+        self.overs = arrays["overs"]
+        self.runs = arrays["runs"]
+        self.balls = arrays["balls"]
+        self._codes = {team: code for code, team in enumerate(self.teams)}
+
+    def _totals(self, seasons=None, innings=None):
+        """Runs and balls per (team, over), summed over the selected seasons and innings"""
+        runs, balls = self.runs, self.balls
+        if seasons is not None:
+            first, last = seasons
+            # The unknown-season slot is never in a season range
+            keep = np.append((self.seasons >= first) & (self.seasons <= last), False)
+            runs, balls = runs[:, keep], balls[:, keep]
+        if innings is not None:
+            keep = np.isin(self.innings, list(innings))
+            runs, balls = runs[:, :, keep], balls[:, :, keep]
+        return runs.sum(axis=(1, 2)), balls.sum(axis=(1, 2))
+
+    def matrix(self, seasons=None, innings=None, include_overs=()):
+        """Team x over run rate (runs per 6 balls), NaN where a team faced no ball in an over
+
+        seasons is an inclusive (first, last) range and innings a collection of
+        inning numbers. Teams and overs with at least one ball are kept, plus
+        the overs in include_overs, in over order.
+        """
+        runs, balls = self._totals(seasons, innings)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rates = runs / balls * 6
+        rates[balls == 0] = np.nan
+        teams = balls.sum(axis=1) > 0
+        overs = self.overs[balls.sum(axis=0) > 0]
+        columns = np.union1d(overs, np.asarray(list(include_overs), dtype=np.int64))
+        # Overs outside the cube get a column of NaN
+        positions = np.searchsorted(self.overs, columns).clip(max=len(self.overs) - 1)
+        found = self.overs[positions] == columns
+        values = np.full((int(teams.sum()), len(columns)), np.nan)
+        values[:, found] = rates[teams][:, positions[found]]
+        return pd.DataFrame(
+            values,
+            index=pd.Index(np.asarray(self.teams, dtype=object)[teams], name="batting_team"),
+            columns=pd.Index(columns, name="over"),
+        )
+
+    def team_profile(self, team, seasons=None, innings=None):
+        """Run rate of the team in each over it batted, by over"""
+        code = self._codes.get(team)
+        runs, balls = self._totals(seasons, innings)
+        if code is None:
+            return pd.Series([], index=pd.Index([], name="over", dtype=np.int64), name="total_runs", dtype=float)
+        played = balls[code] > 0
+        return pd.Series(
+            runs[code][played] / balls[code][played] * 6,
+            index=pd.Index(self.overs[played], name="over"),
+            name="total_runs",
+        )
+
+
+def _load_over_rates():
+    # The cube depends on both datasets, so it is stored under both keys
+    label = f"over_rates-{code_fingerprint(__file__)[:12]}-{matches_key()}"
+    key = deliveries_key()
+    arrays = load_arrays("deliveries", key, label, OVER_RATE_PARTS)
+    if arrays is None:
+        print("🗂️ Building over rates...")
+        arrays = build_over_rates(load_matches_data(), load_deliveries_data(OVER_RATE_COLUMNS))
+        save_arrays("deliveries", key, label, arrays)
+    return OverRates(arrays)
+
+
+_over_rates_flight = SingleFlight("over rates", _load_over_rates)
+
+
+def load_over_rates():
+    """Load the team x season x inning x over run cube (lazy loading)"""
+    return _over_rates_flight.get()
@@ -0,0 +1,71 @@
+import bisect
+import numpy as np
+from functools import lru_cache
+from .deliveriesIndex import load_player_index
+from ..utils.singleFlight import SingleFlight
+
+# Players offered per page of search results
+PLAYER_PAGE_SIZE = 50
+
+
+class PlayerDirectory:
+    """Player name search over the player index, ranked by balls faced and bowled
+
+    Names starting with the query come first, then names with a word starting
+    with it, then names containing it anywhere (case is ignored). Within each
+    group players with more balls in the searched roles come first.
+    """
+
+    def __init__(self, players, balls):
+        self.players = players
+        self.balls = balls
+        self._names = [player.lower() for player in players]
+        # Sorted names for prefix lookups by bisection
+        self._sorted = sorted(zip(self._names, range(len(players))))
+        self._sorted_names = [name for name, _ in self._sorted]
+        self._search = lru_cache(maxsize=1024)(self._matches)
+
+    def _ranked(self, roles):
+        """Players who appear in any of the roles, most balls first, then by name"""
+        weight = sum(self.balls[role] for role in roles)
+        candidates = np.flatnonzero(weight > 0)
+        return candidates[np.lexsort((candidates, -weight[candidates]))]
+
+    def _matches(self, query, roles):
+        ranked = self._ranked(roles)
+        if not query:
+            return tuple(self.players[i] for i in ranked)
+        start = bisect.bisect_left(self._sorted_names, query)
+        stop = bisect.bisect_left(self._sorted_names, query + "\uffff")
+        prefixed = {i for _, i in self._sorted[start:stop]}
+        tiers = ([], [], [])
+        for i in ranked:
+            if i in prefixed:
+                tiers[0].append(i)
+            else:
+                name = self._names[i]
+                at = name.find(query)
+                if at > 0:
+                    # A later word of the name starting with the query ranks above a mid-word match
+                    word_start = (" " + name).find(" " + query) >= 0
+                    tiers[1 if word_start else 2].append(i)
+        return tuple(self.players[i] for tier in tiers for i in tier)
+
+    def search(self, query="", roles=("batter", "bowler"), page=0, page_size=PLAYER_PAGE_SIZE):
+        """One page of the players matching the query, and the number of matches"""
+        matches = self._search(query.strip().lower(), tuple(roles))
+        return list(matches[page * page_size:(page + 1) * page_size]), len(matches)
+
+
+def _load_player_directory():
+    player_index = load_player_index()
+    balls = {role: player_index.counts(role) for role in ("batter", "bowler")}
+    return PlayerDirectory(player_index.players, balls)
+
+
+_player_directory_flight = SingleFlight("player directory", _load_player_directory)
+
+
+def load_player_directory():
+    """Load the searchable player directory (lazy loading)"""
+    return _player_directory_flight.get()
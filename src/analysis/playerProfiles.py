@@ -0,0 +1,205 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from . import edaAggregates
+from .datasetCache import code_fingerprint, load_arrays, save_arrays
+from .datasetPreprocessing import deliveries_key, load_deliveries_data
+from .deliveriesIndex import load_player_index
+from .edaAggregates import Statistic, aggregate, cached_codes, statistic_columns
+from ..utils.singleFlight import SingleFlight
+
+# Grouped tables of every player, keyed by the player first (batter tables, then bowler tables)
+PLAYER_PROFILE_STATISTICS = {
+    "runs_by_team": Statistic(["batter", "bowling_team"], "total_runs", "sum", None),
+    "runs_by_bowler": Statistic(["batter", "bowler"], "total_runs", "sum", None),
+    "runs_with_partner": Statistic(["batter", "non_striker"], "total_runs", "sum", None),
+    "runs_by_inning": Statistic(["batter", "inning"], "total_runs", "sum", None),
+    "runs_to_batter": Statistic(["bowler", "batter"], "total_runs", "sum", None),
+    "runs_by_over": Statistic(["bowler", "over"], "total_runs", "sum", None),
+    "balls_by_over": Statistic(["bowler", "over"], None, "count", None),
+    "runs_by_batting_team": Statistic(["bowler", "batting_team"], "total_runs", "sum", None),
+}
+
+# Deliveries columns the player profiles are computed from
+PLAYER_PROFILE_COLUMNS = statistic_columns(PLAYER_PROFILE_STATISTICS)
+
+PLAYER_PROFILE_PARTS = ["players"] + [
+    f"{name}_{part}" for name in PLAYER_PROFILE_STATISTICS for part in ("offsets", "labels", "values")
+]
+
+# What the Player Analysis page shows of a player as batter and as bowler
+BattingProfile = namedtuple(
+    "BattingProfile", ["runs_by_team", "runs_by_bowler", "runs_with_partner", "runs_by_inning"]
+)
+BowlingProfile = namedtuple(
+    "BowlingProfile", ["runs_to_batter", "runs_by_over", "overs_bowled", "runs_by_batting_team"]
+)
+
+
+def _ranked(table, top=None):
+    ranked = table.sort_values(by="total_runs", ascending=False, kind="stable")
+    return ranked if top is None else ranked[:top]
+
+
+def batting_profile(tables):
+    """Batting profile from the player's per-label run tables (in label order)"""
+    runs_by_inning = tables["runs_by_inning"]
+    return BattingProfile(
+        runs_by_team=_ranked(tables["runs_by_team"]),
+        runs_by_bowler=_ranked(tables["runs_by_bowler"], 15),
+        runs_with_partner=_ranked(tables["runs_with_partner"], 15),
+        runs_by_inning=runs_by_inning[runs_by_inning["inning"] < 3].reset_index(drop=True),
+    )
+
+
+def bowling_profile(tables, over_counts):
+    """Bowling profile from the player's run tables and their balls bowled per over"""
+    overs_bowled = over_counts.reset_index()
+    overs_bowled.columns = ["over", "count"]
+    overs_bowled["over"] = overs_bowled["over"].astype(int)
+    overs_bowled = overs_bowled.sort_values(by="over").reset_index(drop=True)
+    overs_bowled["count"] = (overs_bowled["count"] / 6).round(2)
+    return BowlingProfile(
+        runs_to_batter=_ranked(tables["runs_to_batter"], 15),
+        runs_by_over=tables["runs_by_over"].sort_values(by="over", ascending=True),
+        overs_bowled=overs_bowled,
+        runs_by_batting_team=_ranked(tables["runs_by_batting_team"], 15),
+    )
+
+
+def _grouped_runs(deliveries, column):
+    return deliveries.groupby(column, observed=True)["total_runs"].sum().reset_index()
+
+
+def profiles_from_deliveries(batting, bowling):
+    """(batting, bowling) profiles computed from the player's raw deliveries, None for an empty role"""
+    batting_result = None
+    if len(batting) != 0:
+        batting_result = batting_profile({
+            "runs_by_team": _grouped_runs(batting, "bowling_team"),
+            "runs_by_bowler": _grouped_runs(batting, "bowler"),
+            "runs_with_partner": _grouped_runs(batting, "non_striker"),
+            "runs_by_inning": _grouped_runs(batting, "inning"),
+        })
+    bowling_result = None
+    if len(bowling) != 0:
+        bowling_result = bowling_profile({
+            "runs_to_batter": _grouped_runs(bowling, "batter"),
+            "runs_by_over": _grouped_runs(bowling, "over"),
+            "runs_by_batting_team": _grouped_runs(bowling, "batting_team"),
+        }, bowling["over"].value_counts())
+    return batting_result, bowling_result
+
+
+def build_player_profiles(deliveries, codes=None):
+    """Compute the profile tables of every player in one aggregation pass
+
+    Returns the arrays of the store: the sorted player directory and, per
+    table, the rows of every player in directory order (offsets into the
+    labels and values of the rows).
+    """
+    results = aggregate(deliveries, PLAYER_PROFILE_STATISTICS, codes)
+    names = set()
+    for series in results.values():
+        names.update(series.index.get_level_values(0))
+    players = np.array(sorted(names), dtype=str)
+    directory = pd.Index(players)
+
+    arrays = {"players": players}
+    for name, series in results.items():
+        owners = directory.get_indexer(series.index.get_level_values(0))
+        # Stable, so each player's rows keep the label order of the aggregation
+        order = np.argsort(owners, kind="stable")
+        counts = np.bincount(owners, minlength=len(players))
+        labels = series.index.get_level_values(1)
+        labels = labels.to_numpy(dtype=str) if labels.dtype == object else labels.to_numpy().astype(np.int64)
+        arrays[f"{name}_offsets"] = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        arrays[f"{name}_labels"] = labels[order]
+        arrays[f"{name}_values"] = series.to_numpy()[order].astype(np.int64)
+    return arrays
+
+
+class PlayerProfiles:
+    """Profile tables of every batter and bowler, read per player from the mapped store"""
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self._codes = {player: code for code, player in enumerate(arrays["players"].tolist())}
+
+    def __contains__(self, player):
+        return player in self._codes
+
+    def _rows(self, name, code):
+        offsets = self.arrays[f"{name}_offsets"]
+        start, stop = int(offsets[code]), int(offsets[code + 1])
+        labels = self.arrays[f"{name}_labels"][start:stop]
+        labels = labels.tolist() if labels.dtype.kind == "U" else np.array(labels)
+        return labels, np.array(self.arrays[f"{name}_values"][start:stop])
+
+    def _table(self, name, code, column):
+        labels, values = self._rows(name, code)
+        return pd.DataFrame({column: labels, "total_runs": values})
+
+    def batting(self, player):
+        """Batting profile of a player, None if they never batted"""
+        code = self._codes[player]
+        tables = {
+            name: self._table(name, code, stat.group_by[1])
+            for name, stat in PLAYER_PROFILE_STATISTICS.items()
+            if stat.group_by[0] == "batter"
+        }
+        if tables["runs_by_team"].empty:
+            return None
+        return batting_profile(tables)
+
+    def bowling(self, player):
+        """Bowling profile of a player, None if they never bowled"""
+        code = self._codes[player]
+        tables = {
+            name: self._table(name, code, stat.group_by[1])
+            for name, stat in PLAYER_PROFILE_STATISTICS.items()
+            if stat.group_by[0] == "bowler" and stat.value is not None
+        }
+        if tables["runs_by_over"].empty:
+            return None
+        # Balls per over, in over order (bowling_profile sorts the overs anyway)
+        overs, balls = self._rows("balls_by_over", code)
+        over_counts = pd.Series(balls, index=pd.Index(overs, name="over"), name="count")
+        return bowling_profile(tables, over_counts)
+
+
+def _load_player_profiles():
+    key = deliveries_key()
+    # Rebuild the store whenever this module or the aggregation engine changes
+    label = f"player_profiles-{code_fingerprint(__file__, edaAggregates.__file__)[:12]}"
+    arrays = load_arrays("deliveries", key, label, PLAYER_PROFILE_PARTS, mmap_mode="r")
+    if arrays is None:
+        print("🗂️ Building player profiles...")
+        deliveries = load_deliveries_data(PLAYER_PROFILE_COLUMNS)
+        built = build_player_profiles(deliveries, cached_codes(deliveries, PLAYER_PROFILE_STATISTICS))
+        save_arrays("deliveries", key, label, built)
+        # Serve from the mapped files like later processes do, or from memory if they could not be written
+        arrays = load_arrays("deliveries", key, label, PLAYER_PROFILE_PARTS, mmap_mode="r") or built
+    return PlayerProfiles(arrays)
+
+
+_player_profiles_flight = SingleFlight("player profiles", _load_player_profiles)
+
+
+def load_player_profiles():
+    """Load the player profile store, mapped rather than read (lazy loading)"""
+    return _player_profiles_flight.get()
+
+
+def player_profile(player):
+    """(batting, bowling) profiles of a player, from the store or else from raw deliveries"""
+    profiles = load_player_profiles()
+    if player in profiles:
+        return profiles.batting(player), profiles.bowling(player)
+    print(f"⚠️ {player} is not in the player profiles, computing from deliveries")
+    deliveries = load_deliveries_data(PLAYER_PROFILE_COLUMNS)
+    player_index = load_player_index()
+    return profiles_from_deliveries(
+        player_index.take(deliveries, player, "batter"),
+        player_index.take(deliveries, player, "bowler"),
+    )
@@ -0,0 +1,194 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from . import deliveriesIndex
+from .datasetCache import code_fingerprint, load_arrays, save_arrays
+from .datasetPreprocessing import deliveries_key, load_deliveries_data
+from .deliveriesIndex import MATCH_INDEX_COLUMNS, build_match_index
+from ..utils.singleFlight import SingleFlight
+
+# Deliveries columns the scorecards are computed from
+SCORECARD_COLUMNS = MATCH_INDEX_COLUMNS + [
+    "batter",
+    "bowler",
+    "batsman_runs",
+    "total_runs",
+    "extras_type",
+    "is_wicket",
+    "player_dismissed",
+    "dismissal_kind",
+]
+
+# Extras that are bowled again, so they do not count towards an over
+ILLEGAL_EXTRAS = ["wides", "noballs"]
+
+SCORECARD_PARTS = [
+    "players", "match_ids", "innings", "runs", "wickets", "balls",
+    "batting_offsets", "batting_players", "batting_runs", "batting_balls", "batting_dismissals",
+    "bowling_offsets", "bowling_players", "bowling_balls", "bowling_runs", "bowling_wickets",
+]
+
+# Batting and bowling cards of one innings, with its total, wickets and overs
+InningsCard = namedtuple("InningsCard", ["batting", "bowling", "runs", "wickets", "overs"])
+
+
+def overs_notation(balls):
+    """Overs of a number of legal balls in cricket notation (22 balls -> "3.4")"""
+    overs, rest = divmod(int(balls), 6)
+    return f"{overs}.{rest}" if rest else str(overs)
+
+
+def _slot_offsets(slots, count):
+    """Offsets of each innings' rows in rows sorted by innings slot"""
+    return np.searchsorted(slots, np.arange(count + 1)).astype(np.int64)
+
+
+def build_scorecards(deliveries):
+    """Compute the batting card, bowling card and total of every innings in one pass
+
+    Rows are taken in (match_id, inning, over, ball) order. Batters are listed
+    in the order they first faced a ball, bowlers by name, like the page's
+    former groupbys. Overs count legal balls only (wides and no-balls are
+    bowled again).
+    """
+    index = build_match_index(deliveries)
+    order, starts, stops = index["order"], index["starts"], index["stops"]
+    count = len(starts)
+    # Innings slot of every ordered row
+    slots = np.repeat(np.arange(count, dtype=np.int64), stops - starts)
+
+    names = set()
+    for col in ("batter", "bowler", "player_dismissed"):
+        names.update(deliveries[col].dropna().astype(str).unique())
+    players = np.array(sorted(names), dtype=str)
+    directory = pd.Index(players)
+
+    def ordered(col):
+        return deliveries[col].to_numpy()[order]
+
+    def player_codes(col):
+        return directory.get_indexer(np.asarray(deliveries[col], dtype=object)[order]).astype(np.int64)
+
+    batsman_runs = ordered("batsman_runs").astype(np.int64)
+    total_runs = ordered("total_runs").astype(np.int64)
+    wickets = ordered("is_wicket").astype(np.int64)
+    legal = ~deliveries["extras_type"].isin(ILLEGAL_EXTRAS).to_numpy()[order]
+
+    # Batting: one row per (innings, batter), in order of the batter's first ball
+    batter = player_codes("batter")
+    faced = np.flatnonzero(batter >= 0)
+    bat_keys = slots[faced] * len(players) + batter[faced]
+    bat_groups, first, inverse = np.unique(bat_keys, return_index=True, return_inverse=True)
+    appearance = np.argsort(first, kind="stable")
+    bat_groups = bat_groups[appearance]
+    bat_runs = np.bincount(inverse, weights=batsman_runs[faced], minlength=len(first))[appearance]
+    bat_balls = np.bincount(inverse, minlength=len(first))[appearance]
+
+    # Dismissal of each batter in the innings, "Not Out" when they were not dismissed
+    dismissed = player_codes("player_dismissed")
+    out = np.flatnonzero(dismissed >= 0)
+    out_keys, out_first = np.unique(slots[out] * len(players) + dismissed[out], return_index=True)
+    kinds = np.append(np.asarray(ordered("dismissal_kind"), dtype=object)[out][out_first], "Not Out")
+    kinds[pd.isna(kinds)] = "Not Out"
+    at = np.searchsorted(out_keys, bat_groups)
+    was_out = np.append(out_keys, -1)[at] == bat_groups
+    dismissals = np.where(was_out, kinds[at], "Not Out")
+
+    # Bowling: one row per (innings, bowler), bowlers by name
+    bowler = player_codes("bowler")
+    bowled = np.flatnonzero(bowler >= 0)
+    bowl_groups, inverse = np.unique(slots[bowled] * len(players) + bowler[bowled], return_inverse=True)
+    space = len(bowl_groups)
+
+    return {
+        "players": players,
+        "match_ids": index["match_ids"],
+        "innings": index["innings"],
+        "runs": np.add.reduceat(total_runs, starts) if count else np.zeros(0, np.int64),
+        "wickets": np.add.reduceat(wickets, starts) if count else np.zeros(0, np.int64),
+        "balls": np.add.reduceat(legal.astype(np.int64), starts) if count else np.zeros(0, np.int64),
+        "batting_offsets": _slot_offsets(bat_groups // len(players), count),
+        "batting_players": (bat_groups % len(players)).astype(np.int64),
+        "batting_runs": bat_runs.astype(np.int64),
+        "batting_balls": bat_balls.astype(np.int64),
+        "batting_dismissals": np.asarray(dismissals, dtype=str),
+        "bowling_offsets": _slot_offsets(bowl_groups // len(players), count),
+        "bowling_players": (bowl_groups % len(players)).astype(np.int64),
+        "bowling_balls": np.bincount(inverse, weights=legal[bowled], minlength=space).astype(np.int64),
+        "bowling_runs": np.bincount(inverse, weights=total_runs[bowled], minlength=space).astype(np.int64),
+        "bowling_wickets": np.bincount(inverse, weights=wickets[bowled], minlength=space).astype(np.int64),
+    }
+
+
+class Scorecards:
+    """Scorecard of every innings, fetched by match_id"""
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self.players = arrays["players"]
+        self._slots = {}
+        for slot, (match_id, inning) in enumerate(
+            zip(arrays["match_ids"].tolist(), arrays["innings"].tolist())
+        ):
+            self._slots.setdefault(match_id, {})[inning] = slot
+
+    def _rows(self, part, slot):
+        offsets = self.arrays[f"{part}_offsets"]
+        return slice(int(offsets[slot]), int(offsets[slot + 1]))
+
+    def _innings_card(self, slot):
+        a = self.arrays
+        rows = self._rows("batting", slot)
+        runs, balls = np.array(a["batting_runs"][rows]), np.array(a["batting_balls"][rows])
+        batting = pd.DataFrame({
+            "batter": self.players[a["batting_players"][rows]].tolist(),
+            "Runs": runs,
+            "Balls": balls,
+            "Dismissal": a["batting_dismissals"][rows].tolist(),
+            "Strike Rate": runs / balls * 100,
+        })
+
+        rows = self._rows("bowling", slot)
+        balls, runs = np.array(a["bowling_balls"][rows]), np.array(a["bowling_runs"][rows])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            economy = np.where(balls > 0, runs * 6 / balls, np.nan)
+        bowling = pd.DataFrame({
+            "bowler": self.players[a["bowling_players"][rows]].tolist(),
+            "Overs": [overs_notation(b) for b in balls.tolist()],
+            "Runs": runs,
+            "Wickets": np.array(a["bowling_wickets"][rows]),
+            "Economy": economy,
+        })
+        return InningsCard(
+            batting=batting,
+            bowling=bowling,
+            runs=int(a["runs"][slot]),
+            wickets=int(a["wickets"][slot]),
+            overs=overs_notation(a["balls"][slot]),
+        )
+
+    def match(self, match_id):
+        """Innings cards of a match by inning number (empty if it has no deliveries)"""
+        slots = self._slots.get(int(match_id), {})
+        return {inning: self._innings_card(slot) for inning, slot in slots.items()}
+
+
+def _load_scorecards():
+    key = deliveries_key()
+    # The innings order comes from the match index, so its code is part of the label too
+    label = f"scorecards-{code_fingerprint(__file__, deliveriesIndex.__file__)[:12]}"
+    arrays = load_arrays("deliveries", key, label, SCORECARD_PARTS, mmap_mode="r")
+    if arrays is None:
+        print("🗂️ Building scorecards...")
+        built = build_scorecards(load_deliveries_data(SCORECARD_COLUMNS))
+        save_arrays("deliveries", key, label, built)
+        arrays = load_arrays("deliveries", key, label, SCORECARD_PARTS, mmap_mode="r") or built
+    return Scorecards(arrays)
+
+
+_scorecards_flight = SingleFlight("scorecards", _load_scorecards)
+
+
+def load_scorecards():
+    """Load the scorecards of every match, mapped rather than read (lazy loading)"""
+    return _scorecards_flight.get()
@@ -0,0 +1,87 @@
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from .datasetCache import CACHE_DIR, remove_stale
+
+# tmpfs keeps the mapped columns in shared memory; elsewhere the page cache is shared instead
+SHARED_DIR = os.getenv(
+    "IPL_SHARED_DATASET_DIR",
+    "/dev/shm/ipl-dataset" if os.path.isdir("/dev/shm") else os.path.join(CACHE_DIR, "shared"),
+)
+
+
+def shared_path(name, key):
+    return os.path.join(SHARED_DIR, f"{name}-{key}")
+
+
+def publish_frame(df, name, key):
+    """Write a compact frame's numeric columns and category codes for other processes to map"""
+    target = shared_path(name, key)
+    if os.path.exists(os.path.join(target, "meta.json")):
+        return target
+
+    tmp = f"{target}.tmp-{os.getpid()}"
+    try:
+        os.makedirs(tmp, exist_ok=True)
+        meta = {"columns": list(df.columns), "categories": {}}
+        # Columns with the same categorical dtype share one categories file
+        groups = {}
+        for col in df.columns:
+            series = df[col]
+            if series.dtype == "object":
+                series = series.astype("category")
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                group = groups.setdefault(series.dtype, col)
+                if group == col:
+                    categories = np.asarray(series.cat.categories, dtype=str)
+                    np.save(os.path.join(tmp, f"{col}.categories.npy"), categories, allow_pickle=False)
+                meta["categories"][col] = group
+                np.save(os.path.join(tmp, f"{col}.codes.npy"), series.cat.codes.to_numpy(), allow_pickle=False)
+            else:
+                np.save(os.path.join(tmp, f"{col}.values.npy"), series.to_numpy(), allow_pickle=False)
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(meta, f)
+
+        if os.path.exists(target):
+            # Another process published the same key first
+            shutil.rmtree(tmp)
+        else:
+            os.replace(tmp, target)
+        remove_stale(SHARED_DIR, name, key)
+        print(f"📡 Published shared {name} data at {target}")
+        return target
+    except OSError as e:
+        shutil.rmtree(tmp, ignore_errors=True)
+        print(f"⚠️ Could not publish shared {name} data: {str(e)}")
+        return None
+
+
+def attach_frame(name, key, columns=None):
+    """Map a published frame (or some of its columns) as zero-copy, read-only views (None if not published)"""
+    target = shared_path(name, key)
+    meta_path = os.path.join(target, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if columns is None:
+            columns = meta["columns"]
+        dtypes = {}
+        data = {}
+        for col in columns:
+            group = meta["categories"].get(col)
+            if group is None:
+                data[col] = np.load(os.path.join(target, f"{col}.values.npy"), mmap_mode="r")
+                continue
+            if group not in dtypes:
+                categories = np.load(os.path.join(target, f"{group}.categories.npy"), allow_pickle=False)
+                dtypes[group] = pd.CategoricalDtype(categories.astype(object))
+            codes = np.load(os.path.join(target, f"{col}.codes.npy"), mmap_mode="r")
+            data[col] = pd.Categorical.from_codes(codes, dtype=dtypes[group])
+        return pd.DataFrame(data, columns=list(columns), copy=False)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Could not attach shared {name} data: {str(e)}")
+        return None
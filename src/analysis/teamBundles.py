@@ -0,0 +1,111 @@
+from collections import namedtuple
+import pandas as pd
+from .datasetPreprocessing import deliveries_key, load_deliveries_data
+from .edaAggregates import EDA_STATISTICS, aggregate, cached_codes, statistic_columns
+from .overRates import load_over_rates
+from ..utils.singleFlight import SingleFlight
+
+# One total per (match, inning, batting team, bowling team), shared with the EDA page
+TEAM_INNINGS_STATISTICS = {"innings_runs": EDA_STATISTICS["innings_runs"]}
+
+# Deliveries columns the team bundles are computed from
+TEAM_BUNDLE_COLUMNS = statistic_columns(TEAM_INNINGS_STATISTICS)
+
+# Everything the Team Analysis page shows from deliveries, for one team
+TeamBundle = namedtuple(
+    "TeamBundle",
+    ["innings", "opponent_averages", "over_profile", "highest_totals", "lowest_totals", "inning_splits"],
+)
+
+INNING_NAMES = {1: "Batting First", 2: "Chasing"}
+
+
+def _labelled(innings):
+    """Innings with a match_opponent label for the totals charts"""
+    innings = innings.copy()
+    innings["data"] = innings["match_id"].astype(str) + "_" + innings["bowling_team"].astype(str)
+    return innings
+
+
+def inning_splits(innings):
+    """Innings count, average, highest and lowest total when batting first and chasing"""
+    rows = []
+    for inning, name in INNING_NAMES.items():
+        totals = innings.loc[innings["inning"] == inning, "total_runs"]
+        if totals.empty:
+            continue
+        rows.append({
+            "Innings": name,
+            "Played": len(totals),
+            "Average": round(totals.mean(), 1),
+            "Highest": int(totals.max()),
+            "Lowest": int(totals.min()),
+        })
+    return pd.DataFrame(rows, columns=["Innings", "Played", "Average", "Highest", "Lowest"]).set_index("Innings")
+
+
+def build_team_bundle(innings, over_profile):
+    """Bundle of one team from its innings totals (match_id, inning, bowling_team, total_runs)"""
+    opponent_averages = (
+        innings.groupby("bowling_team", observed=True)["total_runs"]
+        .mean()
+        .round()
+        .astype(int)
+        .reset_index()
+        .sort_values(by="total_runs", ascending=False)
+    )
+    # Innings by match then inning, so equal totals keep match order
+    by_match = innings.sort_values(["match_id", "inning"], kind="stable")
+    highest = by_match.sort_values(by="total_runs", ascending=False, kind="stable")
+    lowest = by_match.sort_values(by="total_runs", ascending=True, kind="stable")
+    return TeamBundle(
+        innings=innings,
+        opponent_averages=opponent_averages,
+        over_profile=over_profile.round().astype(int).reset_index(),
+        highest_totals=_labelled(highest[highest["total_runs"] > 200]),
+        lowest_totals=_labelled(lowest[lowest["inning"] < 3][:10]),
+        inning_splits=inning_splits(innings),
+    )
+
+
+def build_team_bundles(innings_runs, over_rates):
+    """Bundle of every batting team, from the innings totals of all teams"""
+    innings = innings_runs.reset_index()
+    bundles = {}
+    for team, team_innings in innings.groupby("batting_team", observed=True, sort=False):
+        team_innings = team_innings.drop(columns="batting_team").reset_index(drop=True)
+        bundles[team] = build_team_bundle(team_innings, over_rates.team_profile(team))
+    return bundles
+
+
+def _load_team_bundles():
+    key = deliveries_key()
+    print("🧮 Building team bundles...")
+    deliveries = load_deliveries_data(TEAM_BUNDLE_COLUMNS)
+    innings_runs = aggregate(
+        deliveries, TEAM_INNINGS_STATISTICS, cached_codes(deliveries, TEAM_INNINGS_STATISTICS)
+    )["innings_runs"]
+    return key, build_team_bundles(innings_runs, load_over_rates())
+
+
+_team_bundles_flight = SingleFlight("team bundles", _load_team_bundles)
+
+
+def load_team_bundles():
+    """Team Analysis bundles of every batting team, built once per deliveries data (lazy loading)"""
+    _, bundles = _team_bundles_flight.get(is_stale=lambda loaded: loaded[0] != deliveries_key())
+    return bundles
+
+
+def team_bundle(team):
+    """Bundle of one team, empty when the team never batted"""
+    bundle = load_team_bundles().get(team)
+    if bundle is None:
+        empty = pd.DataFrame({
+            "match_id": pd.Series(dtype="int64"),
+            "inning": pd.Series(dtype="int64"),
+            "bowling_team": pd.Series(dtype=object),
+            "total_runs": pd.Series(dtype="int64"),
+        })
+        bundle = build_team_bundle(empty, load_over_rates().team_profile(team))
+    return bundle
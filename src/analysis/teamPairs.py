@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+from .datasetCache import code_fingerprint, load_arrays, save_arrays
+from .datasetPreprocessing import deliveries_key, load_deliveries_data, load_matches_data, matches_key
+from .deliveriesIndex import group_rows
+from ..utils.singleFlight import SingleFlight
+
+# Deliveries columns the team-pair index and cube are computed from
+TEAM_PAIR_COLUMNS = ["match_id", "inning", "batting_team", "bowling_team", "extra_runs", "total_runs"]
+
+# Per (batting team, bowling team, season) totals held by the cube
+CUBE_STATS = ["innings", "innings_runs", "extras", "sixes", "fours", "doubles", "singles", "runs"]
+
+TEAM_PAIR_PARTS = [
+    "teams",
+    "match_order", "match_pairs", "match_offsets",
+    "delivery_order", "delivery_pairs", "delivery_offsets",
+    "cube_pairs", "cube_seasons",
+] + [f"cube_{stat}" for stat in CUBE_STATS]
+
+# Rows of the Team v/s Team "HEAD TO HEAD INFO" table
+HEAD_TO_HEAD_INFO = ["Extra Runs", "Sixes", "Fours", "Doubles", "Singles", "Total Runs"]
+
+
+def _pair_codes(first, second, directory):
+    first = directory.get_indexer(np.asarray(first, dtype=object))
+    second = directory.get_indexer(np.asarray(second, dtype=object))
+    valid = (first >= 0) & (second >= 0)
+    return np.where(valid, first.astype(np.int64) * len(directory) + second, -1)
+
+
+def build_team_pairs(matches, deliveries):
+    """Index matches and deliveries by ordered team pair and aggregate each pair per season
+
+    Matches are grouped by (team1, team2) and deliveries by (batting_team,
+    bowling_team). Deliveries are ordered the way merging matches with
+    deliveries orders them: by match, in matches order, then in file order.
+    Deliveries of matches missing from the matches data are left out.
+    """
+    names = set()
+    for frame, cols in ((matches, ["team1", "team2"]), (deliveries, ["batting_team", "bowling_team"])):
+        for col in cols:
+            names.update(frame[col].dropna().astype(str).unique())
+    teams = np.array(sorted(names), dtype=str)
+    directory = pd.Index(teams)
+
+    match_order, match_pairs, match_offsets = group_rows(
+        _pair_codes(matches["team1"], matches["team2"], directory)
+    )
+
+    match_positions = pd.Index(matches["id"]).get_indexer(deliveries["match_id"])
+    joined = match_positions >= 0
+    pair_codes = _pair_codes(deliveries["batting_team"], deliveries["bowling_team"], directory)
+    pair_codes[~joined] = -1
+    rows = np.lexsort((np.arange(len(deliveries)), match_positions))
+    delivery_order, delivery_pairs, delivery_offsets = group_rows(pair_codes[rows])
+    delivery_order = rows[delivery_order]
+
+    # Cube: one row per (pair, season), summed over every ball of the pair
+    total_runs = deliveries["total_runs"].to_numpy()
+    balls = pd.DataFrame({
+        "pair": pair_codes,
+        "season": matches["season"].to_numpy()[np.where(joined, match_positions, 0)],
+        "match_id": deliveries["match_id"].to_numpy(),
+        "inning": deliveries["inning"].to_numpy(),
+        "extras": deliveries["extra_runs"].to_numpy(),
+        "sixes": total_runs == 6,
+        "fours": total_runs == 4,
+        "doubles": total_runs == 2,
+        "singles": total_runs == 1,
+        "runs": total_runs,
+    })[pair_codes >= 0]
+    cube = balls.groupby(["pair", "season"]).agg(
+        extras=("extras", "sum"),
+        sixes=("sixes", "sum"),
+        fours=("fours", "sum"),
+        doubles=("doubles", "sum"),
+        singles=("singles", "sum"),
+        runs=("runs", "sum"),
+    )
+    # Innings totals of the two regular innings (super overs are left out)
+    innings = (
+        balls[balls["inning"] < 3]
+        .groupby(["pair", "season", "match_id", "inning"])["runs"].sum()
+        .groupby(level=["pair", "season"]).agg(["count", "sum"])
+    )
+    cube["innings"] = innings["count"]
+    cube["innings_runs"] = innings["sum"]
+    cube = cube.fillna(0).reset_index()
+
+    seasons = cube["season"].to_numpy()
+    arrays = {
+        "teams": teams,
+        "match_order": match_order.astype(np.int64),
+        "match_pairs": match_pairs.astype(np.int64),
+        "match_offsets": match_offsets.astype(np.int64),
+        "delivery_order": delivery_order.astype(np.int64),
+        "delivery_pairs": delivery_pairs.astype(np.int64),
+        "delivery_offsets": delivery_offsets.astype(np.int64),
+        "cube_pairs": cube["pair"].to_numpy().astype(np.int64),
+        "cube_seasons": seasons.astype(str) if seasons.dtype == object else seasons,
+    }
+    for stat in CUBE_STATS:
+        arrays[f"cube_{stat}"] = cube[stat].to_numpy().astype(np.int64)
+    return arrays
+
+
+class TeamPairs:
+    """Matches, deliveries and per-season totals of every ordered team pair"""
+
+    def __init__(self, arrays):
+        self.teams = arrays["teams"].tolist()
+        self._codes = {team: code for code, team in enumerate(self.teams)}
+        self._groups = {}
+        for kind in ("match", "delivery"):
+            offsets = arrays[f"{kind}_offsets"].tolist()
+            self._groups[kind] = (
+                arrays[f"{kind}_order"],
+                {pair: (offsets[i], offsets[i + 1]) for i, pair in enumerate(arrays[f"{kind}_pairs"].tolist())},
+            )
+        cube = pd.DataFrame({"season": arrays["cube_seasons"]})
+        for stat in CUBE_STATS:
+            cube[stat] = arrays[f"cube_{stat}"]
+        cube_pairs = arrays["cube_pairs"]
+        starts = np.flatnonzero(np.r_[True, cube_pairs[1:] != cube_pairs[:-1]]) if len(cube_pairs) else []
+        stops = list(starts[1:]) + [len(cube_pairs)]
+        self._cube = cube
+        self._cube_rows = {int(cube_pairs[start]): (start, stop) for start, stop in zip(starts, stops)}
+
+    def pair(self, first, second):
+        """Code of the ordered pair, or None if either team is unknown"""
+        if first not in self._codes or second not in self._codes:
+            return None
+        return self._codes[first] * len(self.teams) + self._codes[second]
+
+    def _rows(self, kind, first, second):
+        order, ranges = self._groups[kind]
+        start, stop = ranges.get(self.pair(first, second), (0, 0))
+        return order[start:stop]
+
+    def matches(self, matches, team1, team2):
+        """Matches listing team1 as team1 and team2 as team2, in matches order"""
+        return matches.iloc[self._rows("match", team1, team2)]
+
+    def deliveries(self, deliveries, batting_team, bowling_team):
+        """Deliveries of batting_team against bowling_team, ordered by match as in matches"""
+        return deliveries.iloc[self._rows("delivery", batting_team, bowling_team)]
+
+    def head_to_head(self, t1, t2):
+        """HEAD TO HEAD INFO table of t1 and t2, summed from the cube"""
+        totals = pd.DataFrame(
+            [self.cube(t1, t2)[CUBE_STATS].sum(), self.cube(t2, t1)[CUBE_STATS].sum()],
+            index=[t1, t2],
+        )
+        return head_to_head_info(totals, t1, t2)
+
+    def cube(self, batting_team, bowling_team):
+        """Per-season totals of batting_team against bowling_team, by season"""
+        start, stop = self._cube_rows.get(self.pair(batting_team, bowling_team), (0, 0))
+        return self._cube.iloc[start:stop].reset_index(drop=True)
+
+
+def head_to_head_info(totals, t1, t2):
+    """Head-to-head table of both teams from their per-batting-team totals
+
+    Extra runs of a team are those it conceded, i.e. the extras of the other
+    team's innings against it.
+    """
+    totals = totals.reindex([t1, t2], fill_value=0).astype(np.int64)
+    table = pd.DataFrame({"info": HEAD_TO_HEAD_INFO})
+    for team, other in ((t1, t2), (t2, t1)):
+        batting = totals.loc[team]
+        table[f"{team}"] = [
+            totals.at[other, "extras"],
+            batting["sixes"],
+            batting["fours"],
+            batting["doubles"],
+            batting["singles"],
+            batting["runs"],
+        ]
+    return table
+
+
+def _load_team_pairs():
+    # The index depends on both datasets, so it is stored under both keys
+    label = f"team_pairs-{code_fingerprint(__file__)[:12]}-{matches_key()}"
+    key = deliveries_key()
+    arrays = load_arrays("deliveries", key, label, TEAM_PAIR_PARTS)
+    if arrays is None:
+        print("🗂️ Building team pair index...")
+        arrays = build_team_pairs(load_matches_data(), load_deliveries_data(TEAM_PAIR_COLUMNS))
+        save_arrays("deliveries", key, label, arrays)
+    return TeamPairs(arrays)
+
+
+_team_pairs_flight = SingleFlight("team pair index", _load_team_pairs)
+
+
+def load_team_pairs():
+    """Load the team-pair index and per-season cube (lazy loading)"""
+    return _team_pairs_flight.get()
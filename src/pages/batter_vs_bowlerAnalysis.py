@@ -2,12 +2,30 @@ import pandas as pd
 import seaborn as sns
 import streamlit as st
 import matplotlib.pyplot as plt
-from ..analysis.datasetPreprocessing import load_deliveries_data
+from ..utils.figureCache import cached_figure
+from ..utils.playerSelect import player_selectbox
+from ..analysis.datasetPreprocessing import deliveries_key, load_deliveries_data
+from ..analysis.deliveriesIndex import load_matchup_index
+from ..analysis.matchupMatrix import load_matchup_matrix
+
+# Deliveries columns this page reads (the summary comes from the matchup matrix)
+DELIVERIES_COLUMNS = [
+    "match_id",
+    "batting_team",
+    "bowling_team",
+    "over",
+    "ball",
+    "batter",
+    "bowler",
+    "total_runs",
+]
 
 
 def app():
     # Load data at the start of the function
-    new_deliveriesDF = load_deliveries_data()
+    new_deliveriesDF = load_deliveries_data(DELIVERIES_COLUMNS)
+    matchup_index = load_matchup_index()
+    matchup_matrix = load_matchup_matrix()
     
     st.markdown(
         """
@@ -22,16 +40,15 @@ def app():
         unsafe_allow_html=True,
     )
 
-    Batsman = new_deliveriesDF["batter"].unique().tolist()
-    Bowler = new_deliveriesDF["bowler"].unique().tolist()
-
     c1, c2 = st.columns([1, 1])
     with c1:
-        batsman = st.selectbox("Choose Batsman", Batsman)
+        batsman = player_selectbox("Choose Batsman", "Search Batsman", roles=("batter",))
     with c2:
-        bowler = st.selectbox("Choose Bowler", Bowler)
+        bowler = player_selectbox("Choose Bowler", "Search Bowler", roles=("bowler",))
 
-    if batsman == bowler:
+    if batsman is None or bowler is None:
+        st.info("Search for a batsman and a bowler to compare")
+    elif batsman == bowler:
         st.error("Batsman and Bowler can't be the same")
     else:
         Analyze = st.button("Analyze")
@@ -41,18 +58,10 @@ def app():
                 unsafe_allow_html=True,
             )
 
-            head_to_head = new_deliveriesDF[
-                (
-                    new_deliveriesDF["batter"].str.strip().str.lower()
-                    == batsman.strip().lower()
-                )
-                & (
-                    new_deliveriesDF["bowler"].str.strip().str.lower()
-                    == bowler.strip().lower()
-                )
-            ]
+            # Pair totals from the matchup matrix (names matched ignoring case and spaces)
+            matchup = matchup_matrix.summary(batsman, bowler)
 
-            if len(head_to_head) != 0:
+            if matchup["balls"] != 0:
                 st.markdown(
                     f"<h4 style='text-align: center;'> Head to Head Details </h4>",
                     unsafe_allow_html=True,
@@ -67,6 +76,9 @@ def app():
                     unsafe_allow_html=True,
                 )
 
+                # Raw rows are only needed for this table
+                head_to_head = matchup_index.take(new_deliveriesDF, batsman, bowler)
+
                 col1, col2 = st.columns([1, 1])
                 with col1:
                     st.dataframe(
@@ -88,28 +100,18 @@ def app():
                 # ----------------->   BASIC DETAILS      <----------------
                 ###########################################################
 
-                total_bowls = len(head_to_head)
-                total_runs = head_to_head["total_runs"].sum()
-
-                # Calculating boundaries and extras
-                sixes = head_to_head[head_to_head["batsman_runs"] == 6].shape[0]
-                fours = head_to_head[head_to_head["batsman_runs"] == 4].shape[0]
-                dot_balls = head_to_head[head_to_head["batsman_runs"] == 0].shape[0]
-                wide_balls = head_to_head[
-                    head_to_head["extras_type"].fillna("") == "wides"
-                ].shape[0]
-                legbyes = head_to_head[
-                    head_to_head["extras_type"].fillna("") == "legbyes"
-                ].shape[0]
-                byes = head_to_head[
-                    head_to_head["extras_type"].fillna("") == "byes"
-                ].shape[0]
-                noballs = head_to_head[
-                    head_to_head["extras_type"].fillna("") == "noballs"
-                ].shape[0]
-                penalty = head_to_head[
-                    head_to_head["extras_type"].fillna("") == "penalty"
-                ].shape[0]
+                total_bowls = matchup["balls"]
+                total_runs = matchup["runs"]
+
+                # Boundaries and extras
+                sixes = matchup["sixes"]
+                fours = matchup["fours"]
+                dot_balls = matchup["dots"]
+                wide_balls = matchup["wides"]
+                legbyes = matchup["legbyes"]
+                byes = matchup["byes"]
+                noballs = matchup["noballs"]
+                penalty = matchup["penalty"]
 
                 summary_df = pd.DataFrame(
                     {
@@ -140,7 +142,7 @@ def app():
                     }
                 )
 
-                with col2:
+                def matchup_distribution():
                     sns.set(style="whitegrid")
 
                     values = summary_df[f"{batsman} vs {bowler}"].values
@@ -171,7 +173,18 @@ def app():
                     ax.spines["top"].set_visible(False)
                     ax.spines["right"].set_visible(False)
 
-                    st.pyplot(fig)
+                    return fig
+
+                with col2:
+                    st.image(
+                        cached_figure(
+                            "matchup distribution",
+                            (batsman, bowler),
+                            deliveries_key(),
+                            matchup_distribution,
+                            transparent=False,
+                        )
+                    )
 
                 ###########################################################
                 # ----------------->   SUMMARY TABLE      <----------------
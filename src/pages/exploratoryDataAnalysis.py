@@ -4,49 +4,77 @@ import streamlit as st
 import plotly.express as px
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-from ..analysis.datasetPreprocessing import load_matches_data, load_deliveries_data
-
-
-def app():
-    # Load data at the start of the function
-    new_matchesDF = load_matches_data()
-    new_deliveriesDF = load_deliveries_data()
-    
-    st.markdown(
-        """
-    <h1 style='text-align:center; color: #e8630a;'><strong>🌟EXPLORATORY DATA ANALYSIS🌟</strong></h1>
-    <hr style="border-top: 3px solid #e8630a;">
-    """,
-        unsafe_allow_html=True,
-    )
-
-    #################################################################
-    ################## MATCHES DATASET LOADING ######################
-    #################################################################
-    with st.expander("👉 Matches Dataset: 2008 - 2024"):
-        st.write(new_matchesDF.head(5))
-
-        if st.checkbox(label="View Code", key=0):
-            st.code(
-                """
+from ..analysis.datasetPreprocessing import (
+    deliveries_key,
+    load_matches_data,
+    matches_key,
+    read_deliveries_head,
+)
+from ..analysis import edaAggregates, overRates
+from ..analysis.datasetCache import CACHE_DIR, code_fingerprint
+from ..analysis.edaAggregates import load_eda_aggregates, top_venue_wins
+from ..analysis.overRates import load_over_rates
+from ..utils import figureCache, lazySections
+from ..utils.figureCache import figure_png
+from ..utils.lazySections import LazySections
+
+# Text colours of the matplotlib charts, applied to each chart rather than globally
+EDA_STYLE = {"text.color": "white", "axes.labelcolor": "black"}
+
+# Prebuilt results and figures (scripts/build_eda_artifacts.py) are loaded from the dataset cache
+sections = LazySections("eda", artifact_dir=CACHE_DIR)
+
+# Artifacts are only reused by the code that built them, including the modules computing section results
+# (the preprocessing and column cache code is already part of the dataset keys)
+EDA_CODE_VERSION = code_fingerprint(
+    __file__, lazySections.__file__, figureCache.__file__, edaAggregates.__file__, overRates.__file__
+)[:12]
+
+
+def eda_fingerprint():
+    """Fingerprint of the data and code every EDA section is built from"""
+    return f"{matches_key()}-{deliveries_key()}-{EDA_CODE_VERSION}"
+
+
+#################################################################
+################## MATCHES DATASET LOADING ######################
+#################################################################
+def matches_head():
+    return load_matches_data().head(5)
+
+
+@sections.section("👉 Matches Dataset: 2008 - 2024", matches_head)
+def show_matches_head(head, figures):
+    st.write(head)
+
+    if st.checkbox(label="View Code", key=0):
+        st.code(
+            """
                         new_matchesDF = pd.read_csv('Datasets/matches_2008-2024.csv')
 
                         new_matchesDF.columns = new_matchesDF.columns.str.strip()
 
                         st.write(new_matchesDF.head(5))
                     """,
-                language="python",
-            )
+            language="python",
+        )
 
-    #################################################################
-    ################## DELEVERY DATASET LOADING #####################
-    #################################################################
-    with st.expander("👉 Deliveries Dataset: 2008 - 2024"):
-        st.write(new_deliveriesDF.head(5))
 
-        if st.checkbox(label="View Code", key=1):
-            st.code(
-                """
+#################################################################
+################## DELEVERY DATASET LOADING #####################
+#################################################################
+def deliveries_head():
+    # Only the shown rows are read, so this section does not load every deliveries column
+    return read_deliveries_head(5)
+
+
+@sections.section("👉 Deliveries Dataset: 2008 - 2024", deliveries_head)
+def show_deliveries_head(head, figures):
+    st.write(head)
+
+    if st.checkbox(label="View Code", key=1):
+        st.code(
+            """
                         new_deliveriesDF = pd.read_csv(
                             'deliveries_2008-2024.csv')
 
@@ -54,38 +82,46 @@ def app():
 
                         st.write(new_deliveriesDF.head(5))
                     """,
-                language="python",
-            )
+            language="python",
+        )
 
-    #################################################################
-    ################## MATCHES PER SEASON ###########################
-    #################################################################
-    with st.expander("👉 Matches Per Season"):
-        matches_per_season = new_matchesDF["season"].value_counts().sort_index()
 
-        colors = px.colors.qualitative.Safe
-        color_list = [colors[i % len(colors)] for i in range(len(matches_per_season))]
+#################################################################
+################## MATCHES PER SEASON ###########################
+#################################################################
+def matches_per_season():
+    return load_matches_data()["season"].value_counts().sort_index()
 
-        trace = go.Bar(
-            x=matches_per_season.index,
-            y=matches_per_season.values,
-            text=matches_per_season.values,
-            marker={"color": color_list},
-        )
 
-        layout = go.Layout(
-            title="Matches Per Season",
-            xaxis={"title": "Season"},
-            yaxis={"title": "Number of Matches Played"},
-        )
+def matches_per_season_figures(matches_per_season):
+    colors = px.colors.qualitative.Safe
+    color_list = [colors[i % len(colors)] for i in range(len(matches_per_season))]
+
+    trace = go.Bar(
+        x=matches_per_season.index,
+        y=matches_per_season.values,
+        text=matches_per_season.values,
+        marker={"color": color_list},
+    )
+
+    layout = go.Layout(
+        title="Matches Per Season",
+        xaxis={"title": "Season"},
+        yaxis={"title": "Number of Matches Played"},
+    )
+
+    fig = go.Figure(data=[trace], layout=layout)
+
+    return {"chart": fig}
 
-        fig = go.Figure(data=[trace], layout=layout)
 
-        st.plotly_chart(fig, transparent=True, use_container_width=True)
+@sections.section("👉 Matches Per Season", matches_per_season, matches_per_season_figures)
+def show_matches_per_season(matches_per_season, figures):
+    st.plotly_chart(figures["chart"], transparent=True, use_container_width=True)
 
-        if st.checkbox(label="View Code", key=2):
-            st.code(
-                """
+    if st.checkbox(label="View Code", key=2):
+        st.code(
+            """
                         matches_per_season = new_matchesDF['season'].value_counts(
                         ).sort_index()
 
@@ -108,36 +144,42 @@ def app():
                                         transparent = True,
                                         use_container_width = True)
                     """,
-                language="python",
-            )
-
-    ####################################################################
-    ########## Most Man of The Match Award Received By Players #########
-    ###################################################################
-    with st.expander("👉 Most POTM Awards"):
-        top_20_POTM = (
-            new_matchesDF["player_of_match"].value_counts().iloc[:20].sort_values()
+            language="python",
         )
 
-        fig = px.bar(
-            y=top_20_POTM.index,
-            x=top_20_POTM.values,
-            labels={"y": "Player", "x": "POTM Awards"},
-            color=top_20_POTM.index,
-            text=top_20_POTM.values,
-            color_discrete_sequence=px.colors.qualitative.Safe,
-        )
 
-        fig.update_layout(
-            height=700,
-            width=900,
-        )
+####################################################################
+########## Most Man of The Match Award Received By Players #########
+###################################################################
+def top_20_potm():
+    return load_matches_data()["player_of_match"].value_counts().iloc[:20].sort_values()
 
-        st.plotly_chart(fig, transparent=True, use_container_width=True)
 
-        if st.checkbox(label="View Code", key=3):
-            st.code(
-                """
+def top_20_potm_figures(top_20_POTM):
+    fig = px.bar(
+        y=top_20_POTM.index,
+        x=top_20_POTM.values,
+        labels={"y": "Player", "x": "POTM Awards"},
+        color=top_20_POTM.index,
+        text=top_20_POTM.values,
+        color_discrete_sequence=px.colors.qualitative.Safe,
+    )
+
+    fig.update_layout(
+        height=700,
+        width=900,
+    )
+
+    return {"chart": fig}
+
+
+@sections.section("👉 Most POTM Awards", top_20_potm, top_20_potm_figures)
+def show_top_20_potm(top_20_POTM, figures):
+    st.plotly_chart(figures["chart"], transparent=True, use_container_width=True)
+
+    if st.checkbox(label="View Code", key=3):
+        st.code(
+            """
                         top_20_POTM = new_matchesDF['player_of_match'].value_counts(
                         ).iloc[:20].sort_values()
 
@@ -153,34 +195,42 @@ def app():
                                         transparent = True,
                                         use_container_width = True)
                     """,
-                language="python",
-            )
-
-    ##########################################################################
-    ################ Venues With Most Matches ################################
-    ##########################################################################
-    with st.expander("👉 Top 20 Venues With Most Matches"):
-        top_20_venue = new_matchesDF["venue"].value_counts().iloc[:20]
-
-        fig = px.bar(
-            x=top_20_venue.index,
-            y=top_20_venue.values,
-            labels={"x": "Venue", "y": "Total Matches Played"},
-            color=top_20_venue.index,
-            text=top_20_venue.values,
-            color_discrete_sequence=px.colors.qualitative.Safe,
+            language="python",
         )
 
-        fig.update_layout(
-            height=700,
-            width=900,
-        )
 
-        st.plotly_chart(fig, transparent=True, use_container_width=True)
+##########################################################################
+################ Venues With Most Matches ################################
+##########################################################################
+def top_20_venues():
+    return load_matches_data()["venue"].value_counts().iloc[:20]
+
+
+def top_20_venues_figures(top_20_venue):
+    fig = px.bar(
+        x=top_20_venue.index,
+        y=top_20_venue.values,
+        labels={"x": "Venue", "y": "Total Matches Played"},
+        color=top_20_venue.index,
+        text=top_20_venue.values,
+        color_discrete_sequence=px.colors.qualitative.Safe,
+    )
+
+    fig.update_layout(
+        height=700,
+        width=900,
+    )
+
+    return {"chart": fig}
 
-        if st.checkbox(label="View Code", key=4):
-            st.code(
-                """
+
+@sections.section("👉 Top 20 Venues With Most Matches", top_20_venues, top_20_venues_figures)
+def show_top_20_venues(top_20_venue, figures):
+    st.plotly_chart(figures["chart"], transparent=True, use_container_width=True)
+
+    if st.checkbox(label="View Code", key=4):
+        st.code(
+            """
                         top_20_venue = new_matchesDF['venue'].value_counts(
                         ).iloc[:20]
 
@@ -202,36 +252,42 @@ def app():
                                         transparent=True,
                                         use_container_width=True)
                     """,
-                language="python",
-            )
-
-    ###########################################################################
-    ###################### Team With Most Match Wins ##########################
-    ###########################################################################
-    with st.expander("👉 Team With Most Match Wins"):
-        teams_total_toss_win = (
-            new_matchesDF["winner"].value_counts().iloc[:].sort_values()
+            language="python",
         )
 
-        fig = px.bar(
-            y=teams_total_toss_win.index,
-            x=teams_total_toss_win.values,
-            labels={"y": "Total Matches Won", "x": "Team"},
-            color=teams_total_toss_win.index,
-            text=teams_total_toss_win.values,
-            color_discrete_sequence=px.colors.qualitative.Safe,
-        )
 
-        fig.update_layout(
-            height=700,
-            width=900,
-        )
+###########################################################################
+###################### Team With Most Match Wins ##########################
+###########################################################################
+def team_match_wins():
+    return load_matches_data()["winner"].value_counts().iloc[:].sort_values()
 
-        st.plotly_chart(fig, transparent=True, use_container_width=True)
 
-        if st.checkbox(label="View Code", key=5):
-            st.code(
-                """
+def team_match_wins_figures(teams_total_toss_win):
+    fig = px.bar(
+        y=teams_total_toss_win.index,
+        x=teams_total_toss_win.values,
+        labels={"y": "Total Matches Won", "x": "Team"},
+        color=teams_total_toss_win.index,
+        text=teams_total_toss_win.values,
+        color_discrete_sequence=px.colors.qualitative.Safe,
+    )
+
+    fig.update_layout(
+        height=700,
+        width=900,
+    )
+
+    return {"chart": fig}
+
+
+@sections.section("👉 Team With Most Match Wins", team_match_wins, team_match_wins_figures)
+def show_team_match_wins(teams_total_toss_win, figures):
+    st.plotly_chart(figures["chart"], transparent=True, use_container_width=True)
+
+    if st.checkbox(label="View Code", key=5):
+        st.code(
+            """
                         teams_total_toss_win = new_matchesDF['winner'].value_counts(
                         ).iloc[:20].sort_values()
 
@@ -253,30 +309,38 @@ def app():
                                         transparent=True,
                                         use_container_width=True)
             """,
-                language="python",
-            )
-
-    ##################################################################
-    #################### Team With Most Toss Wins ####################
-    ##################################################################
-    with st.expander("👉 Team With Most Toss Wins"):
-        teams_toss_win_count = new_matchesDF["toss_winner"].value_counts()
-
-        fig = px.bar(
-            x=teams_toss_win_count.index,
-            y=teams_toss_win_count.values,
-            title="Toss Winners",
-            labels={"y": "Total Tosses Won", "x": "Team"},
-            color=teams_toss_win_count.index,
-            text=teams_toss_win_count.values,
-            color_discrete_sequence=px.colors.qualitative.Safe,
+            language="python",
         )
 
-        st.plotly_chart(fig, transparent=True, use_container_width=True)
 
-        if st.checkbox(label="View Code", key=6):
-            st.code(
-                """
+##################################################################
+#################### Team With Most Toss Wins ####################
+##################################################################
+def team_toss_wins():
+    return load_matches_data()["toss_winner"].value_counts()
+
+
+def team_toss_wins_figures(teams_toss_win_count):
+    fig = px.bar(
+        x=teams_toss_win_count.index,
+        y=teams_toss_win_count.values,
+        title="Toss Winners",
+        labels={"y": "Total Tosses Won", "x": "Team"},
+        color=teams_toss_win_count.index,
+        text=teams_toss_win_count.values,
+        color_discrete_sequence=px.colors.qualitative.Safe,
+    )
+
+    return {"chart": fig}
+
+
+@sections.section("👉 Team With Most Toss Wins", team_toss_wins, team_toss_wins_figures)
+def show_team_toss_wins(teams_toss_win_count, figures):
+    st.plotly_chart(figures["chart"], transparent=True, use_container_width=True)
+
+    if st.checkbox(label="View Code", key=6):
+        st.code(
+            """
                 teams_toss_win_count = matches_team['toss_winner'].value_counts(
                 )
 
@@ -290,28 +354,29 @@ def app():
                                 transparent=True,
                                 use_container_width=True)
         """,
-                language="python",
-            )
+            language="python",
+        )
 
-    #####################################################################
-    ########### Win Percentage of Team after Winning The Toss  ##########
-    #####################################################################
-    with st.expander("👉 Win Percentage of Team after Winning The Toss"):
-        fig = plt.figure(figsize=(15, 8))
 
-        win_percentage_after_toss = round(
-            (
-                new_matchesDF[new_matchesDF["toss_winner"] == new_matchesDF["winner"]][
-                    "winner"
-                ].value_counts()
-                / new_matchesDF["toss_winner"].value_counts()
-            )
-            * 100
-        ).sort_values(ascending=False)
+#####################################################################
+########### Win Percentage of Team after Winning The Toss  ##########
+#####################################################################
+def win_percentage_after_toss():
+    matches = load_matches_data()
+    return round(
+        (
+            matches[matches["toss_winner"] == matches["winner"]]["winner"].value_counts()
+            / matches["toss_winner"].value_counts()
+        )
+        * 100
+    ).sort_values(ascending=False)
 
-        explode = [0.1] + [0] * (len(win_percentage_after_toss) - 1)
 
-        plt.rcParams.update({"text.color": "white", "axes.labelcolor": "black"})
+def win_percentage_after_toss_figures(win_percentage_after_toss):
+    with plt.rc_context(EDA_STYLE):
+        fig = plt.figure(figsize=(15, 8))
+
+        explode = [0.1] + [0] * (len(win_percentage_after_toss) - 1)
 
         win_percentage_after_toss.plot(
             kind="pie", autopct="%1.1f%%", explode=explode, shadow=True, startangle=90
@@ -320,18 +385,27 @@ def app():
         plt.ylabel("")
         plt.title("Win Percentage of Team after Winning The Toss")
 
-        col1, col2 = st.columns([3, 2])
+    return {"pie": fig}
+
 
-        with col1:
-            st.pyplot(fig, transparent=True)
+@sections.section(
+    "👉 Win Percentage of Team after Winning The Toss",
+    win_percentage_after_toss,
+    win_percentage_after_toss_figures,
+)
+def show_win_percentage_after_toss(win_percentage_after_toss, figures):
+    col1, col2 = st.columns([3, 2])
 
-        with col2:
-            st.write("### Overall Record:")
-            st.dataframe(win_percentage_after_toss, width=500, height=575)
+    with col1:
+        st.image(figures["pie"])
 
-        if st.checkbox(label="View Code", key=7):
-            st.code(
-                """
+    with col2:
+        st.write("### Overall Record:")
+        st.dataframe(win_percentage_after_toss, width=500, height=575)
+
+    if st.checkbox(label="View Code", key=7):
+        st.code(
+            """
                 win_percentage_after_toss = round(
                     (
                         new_matchesDF[new_matchesDF['toss_winner']
@@ -360,55 +434,66 @@ def app():
 
                 st.pyplot(fig, transparent=True)
         """,
-                language="python",
-            )
-
-    #####################################################################
-    ############### Teams Winning Both Toss and Matches #################
-    #####################################################################
-    with st.expander("👉 Teams Winning Both Toss and Matches Since 2008"):
-        toss_Match_winner = new_matchesDF[
-            new_matchesDF["toss_winner"] == new_matchesDF["winner"]
-        ]["winner"].value_counts()
-
-        colors = px.colors.qualitative.Safe
-        color_list = colors[: len(toss_Match_winner)]
-
-        fig = go.Figure()
-
-        fig.add_trace(
-            go.Bar(
-                x=toss_Match_winner.index,
-                y=toss_Match_winner.values,
-                text=toss_Match_winner.values,
-                textposition="outside",
-                marker_color=color_list,
-            )
+            language="python",
         )
 
-        fig.update_layout(
-            title="Teams Winning Both Toss and Matches",
-            xaxis_title="Teams",
-            yaxis_title="Total Matches Won",
-            xaxis=dict(tickangle=-45),
-            height=800,
-            width=1200,
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
+
+#####################################################################
+############### Teams Winning Both Toss and Matches #################
+#####################################################################
+def toss_and_match_winners():
+    matches = load_matches_data()
+    return matches[matches["toss_winner"] == matches["winner"]]["winner"].value_counts()
+
+
+def toss_and_match_winners_figures(toss_Match_winner):
+    colors = px.colors.qualitative.Safe
+    color_list = colors[: len(toss_Match_winner)]
+
+    fig = go.Figure()
+
+    fig.add_trace(
+        go.Bar(
+            x=toss_Match_winner.index,
+            y=toss_Match_winner.values,
+            text=toss_Match_winner.values,
+            textposition="outside",
+            marker_color=color_list,
         )
+    )
+
+    fig.update_layout(
+        title="Teams Winning Both Toss and Matches",
+        xaxis_title="Teams",
+        yaxis_title="Total Matches Won",
+        xaxis=dict(tickangle=-45),
+        height=800,
+        width=1200,
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+    )
+
+    return {"chart": fig}
 
-        col1, col2 = st.columns(2)
 
-        with col1:
-            st.plotly_chart(fig, use_container_width=True)
+@sections.section(
+    "👉 Teams Winning Both Toss and Matches Since 2008",
+    toss_and_match_winners,
+    toss_and_match_winners_figures,
+)
+def show_toss_and_match_winners(toss_Match_winner, figures):
+    col1, col2 = st.columns(2)
 
-        with col2:
-            st.write("### Records:")
-            st.dataframe(toss_Match_winner, width=400, height=570)
+    with col1:
+        st.plotly_chart(figures["chart"], use_container_width=True)
 
-        if st.checkbox(label="View Code", key=8):
-            st.code(
-                """
+    with col2:
+        st.write("### Records:")
+        st.dataframe(toss_Match_winner, width=400, height=570)
+
+    if st.checkbox(label="View Code", key=8):
+        st.code(
+            """
                         toss_Match_winner = new_matchesDF[new_matchesDF['toss_winner']
                                           == new_matchesDF['winner']]['winner'].value_counts()
 
@@ -439,47 +524,54 @@ def app():
                         st.plotly_chart(fig,
                                 use_container_width=True)
         """,
-                language="python",
-            )
-
-    ############################################################################
-    ################## Top 20 Players With Most Runs ###########################
-    ############################################################################
-    with st.expander("👉 Top 20 Players With Most Runs"):
-        top_20_run_scorer = (
-            new_deliveriesDF.groupby("batter")["batsman_runs"]
-            .sum()
-            .sort_values(ascending=False)[:20]
+            language="python",
         )
 
-        top_20_run_scorer_df = top_20_run_scorer.reset_index()
-        top_20_run_scorer_df.columns = ["Player", "Runs"]
-
-        fig = px.bar(
-            top_20_run_scorer_df,
-            x="Runs",
-            y="Player",
-            labels={"Player": "Player", "Runs": "Total Runs"},
-            color="Player",
-            text="Runs",
-            color_discrete_sequence=px.colors.qualitative.Safe,
-        )
 
-        fig.update_layout(
-            height=600,
-            width=800,
-            yaxis_title="Player",
-            xaxis_title="Total Runs",
-            yaxis=dict(categoryorder="total ascending"),
-        )
+############################################################################
+################## Top 20 Players With Most Runs ###########################
+############################################################################
+def top_20_run_scorers():
+    top_20_run_scorer = (
+        load_eda_aggregates()["batter_runs"].sort_values(ascending=False, kind="stable")[:20]
+    )
+
+    top_20_run_scorer_df = top_20_run_scorer.reset_index()
+    top_20_run_scorer_df.columns = ["Player", "Runs"]
+    return top_20_run_scorer_df
+
+
+def top_20_run_scorers_figures(top_20_run_scorer_df):
+    fig = px.bar(
+        top_20_run_scorer_df,
+        x="Runs",
+        y="Player",
+        labels={"Player": "Player", "Runs": "Total Runs"},
+        color="Player",
+        text="Runs",
+        color_discrete_sequence=px.colors.qualitative.Safe,
+    )
+
+    fig.update_layout(
+        height=600,
+        width=800,
+        yaxis_title="Player",
+        xaxis_title="Total Runs",
+        yaxis=dict(categoryorder="total ascending"),
+    )
+
+    fig.update_traces(textposition="outside")
 
-        fig.update_traces(textposition="outside")
+    return {"chart": fig}
 
-        st.plotly_chart(fig, transparent=True, use_container_width=True)
 
-        if st.checkbox(label="View Code", key=9):
-            st.code(
-                """
+@sections.section("👉 Top 20 Players With Most Runs", top_20_run_scorers, top_20_run_scorers_figures)
+def show_top_20_run_scorers(top_20_run_scorer_df, figures):
+    st.plotly_chart(figures["chart"], transparent=True, use_container_width=True)
+
+    if st.checkbox(label="View Code", key=9):
+        st.code(
+            """
                         top_20_run_scorer = new_deliveriesDF.groupby(
                                             'batter')['batsman_runs'].sum().sort_values(ascending=False)[:20]
 
@@ -513,20 +605,22 @@ def app():
                                         use_container_width=True)
 
         """,
-                language="python",
-            )
+            language="python",
+        )
+
 
-    #############################################################################
-    ###############           MOST EXPENSIVE BOWLERS              ###############
-    #############################################################################
+#############################################################################
+###############           MOST EXPENSIVE BOWLERS              ###############
+#############################################################################
 
-    def plot_bar(data, title, xlabel, ylabel, col_width=2, rows=1):
+def plot_bar(data, title, xlabel, ylabel, col_width=2, rows=1):
+    with plt.rc_context(EDA_STYLE):
         fig = plt.figure(figsize=(10, 6))
 
         ax = sns.barplot(
             x="bowler",
             y="total_runs",
-            data=data[:10],
+            data=data[:10].astype({"bowler": str}),
             palette="viridis",
             hue=None,
             legend=False,
@@ -549,66 +643,74 @@ def app():
                 textcoords="offset points",
             )
 
-        st.pyplot(fig, transparent=True)
+    return fig
 
-    with st.expander("👉 Most Expensive Bowler"):
-        st.write("> Overall Most Expensive Bowler:")
-        col1, col2 = st.columns([3, 2])
 
-        with col1:
-            overall = (
-                new_deliveriesDF.groupby("bowler")["total_runs"]
-                .agg("sum")
-                .reset_index()
-                .sort_values("total_runs", ascending=False)
-                .head(30)
-            )
-            plot_bar(overall, "Overall Most Expensive Bowler", "Bowler", "Total Runs")
+def _most_expensive(bowler_runs):
+    return (
+        bowler_runs.reset_index()
+        .sort_values("total_runs", ascending=False, kind="stable")
+        .head(30)
+    )
+
 
-        with col2:
-            st.dataframe(overall, width=400, height=400)
+def most_expensive_bowlers():
+    """Most expensive bowlers overall, in the 1st over and in the 20th over"""
+    aggregates = load_eda_aggregates()
+    return (
+        _most_expensive(aggregates["bowler_runs"]),
+        _most_expensive(aggregates["first_over_bowler_runs"]),
+        _most_expensive(aggregates["last_over_bowler_runs"]),
+    )
 
-        st.write("> Most Expensive Bowler in 1st Over:")
-        col3, col4 = st.columns([3, 2])
 
-        with col3:
-            first_over = new_deliveriesDF[new_deliveriesDF["over"] == 0]
+def most_expensive_bowlers_figures(bowlers):
+    overall, first_over, twenty_over = bowlers
+    return {
+        "overall": plot_bar(overall, "Overall Most Expensive Bowler", "Bowler", "Total Runs"),
+        "first_over": plot_bar(
+            first_over, "Most Expensive Bowler in 1st Over", "Bowler", "Total Runs"
+        ),
+        "twenty_over": plot_bar(
+            twenty_over, "Most Expensive Bowler in 20th Over", "Bowler", "Total Runs"
+        ),
+    }
 
-            group = (
-                first_over.groupby("bowler")["total_runs"]
-                .agg("sum")
-                .reset_index()
-                .sort_values("total_runs", ascending=False)
-                .head(30)
-            )
-            plot_bar(group, "Most Expensive Bowler in 1st Over", "Bowler", "Total Runs")
 
-        with col4:
-            st.dataframe(group, width=400, height=400)
+@sections.section("👉 Most Expensive Bowler", most_expensive_bowlers, most_expensive_bowlers_figures)
+def show_most_expensive_bowlers(bowlers, figures):
+    overall, first_over, twenty_over = bowlers
 
-        st.write("> Most Expensive Bowler in 20th Over:")
-        col5, col6 = st.columns([3, 2])
+    st.write("> Overall Most Expensive Bowler:")
+    col1, col2 = st.columns([3, 2])
 
-        with col5:
-            twenty_over = new_deliveriesDF[new_deliveriesDF["over"] == 19]
+    with col1:
+        st.image(figures["overall"])
 
-            group = (
-                twenty_over.groupby("bowler")["total_runs"]
-                .agg("sum")
-                .reset_index()
-                .sort_values("total_runs", ascending=False)
-                .head(30)
-            )
-            plot_bar(
-                group, "Most Expensive Bowler in 20th Over", "Bowler", "Total Runs"
-            )
+    with col2:
+        st.dataframe(overall, width=400, height=400)
+
+    st.write("> Most Expensive Bowler in 1st Over:")
+    col3, col4 = st.columns([3, 2])
+
+    with col3:
+        st.image(figures["first_over"])
+
+    with col4:
+        st.dataframe(first_over, width=400, height=400)
 
-        with col6:
-            st.dataframe(group, width=400, height=400)
+    st.write("> Most Expensive Bowler in 20th Over:")
+    col5, col6 = st.columns([3, 2])
 
-        if st.checkbox(label="View Code", key=10):
-            st.code(
-                """
+    with col5:
+        st.image(figures["twenty_over"])
+
+    with col6:
+        st.dataframe(twenty_over, width=400, height=400)
+
+    if st.checkbox(label="View Code", key=10):
+        st.code(
+            """
                         overall = new_deliveriesDF.groupby('bowler')['total_runs'].agg('sum').reset_index().sort_values('total_runs',
                                                                                                                                     ascending=False).head(30)
 
@@ -632,330 +734,394 @@ def app():
 
                         st.pyplot(fig, transparent=True)
         """,
-                language="python",
-            )
-
-    #######################################################################
-    #####       Overwise Average Runs For Each Team Since 2008      #######
-    #######################################################################
-    with st.expander("👉 Overwise Average Runs For Each Team Since 2008"):
-        corr = (
-            new_deliveriesDF.pivot_table(
-                values="total_runs",
-                index="batting_team",
-                columns="over",
-                aggfunc="mean",
-            ).fillna(0)
-            * 6
+            language="python",
         )
 
-        for over in range(0, 20):
-            if over not in corr.columns:
-                corr[over] = 0
 
-        corr = corr[sorted(corr.columns)]
+#######################################################################
+#####       Overwise Average Runs For Each Team Since 2008      #######
+#######################################################################
+def overwise_average_runs():
+    corr = load_over_rates().matrix(include_overs=range(0, 20)).fillna(0)
 
-        corr_transposed = corr.T
+    return corr.T
 
-        fig = px.imshow(
-            corr_transposed,
-            color_continuous_scale="viridis",
-            labels=dict(x="Team", y="Over", color="Runs"),
-            x=corr_transposed.columns,
-            y=corr_transposed.index,
-        )
 
-        fig.update_yaxes(
-            tickvals=list(range(1, 21)), title_text="Overs", title_font_size=16
-        )
+def overwise_average_runs_figures(corr_transposed):
+    fig = px.imshow(
+        corr_transposed,
+        color_continuous_scale="viridis",
+        labels=dict(x="Team", y="Over", color="Runs"),
+        x=corr_transposed.columns,
+        y=corr_transposed.index,
+    )
 
-        fig.update_xaxes(title_text="Teams", title_font_size=16, tickangle=45)
+    fig.update_yaxes(
+        tickvals=list(range(1, 21)), title_text="Overs", title_font_size=16
+    )
 
-        st.plotly_chart(fig, transparent=True, use_container_width=True)
+    fig.update_xaxes(title_text="Teams", title_font_size=16, tickangle=45)
 
-    ########################################################################
-    #######          Toss Decision Based On Top Venues         #############
-    ########################################################################
-    with st.expander("👉 Toss Decision Based on Top Venues"):
-        top_venues = new_matchesDF["venue"].value_counts().head(15).index.to_list()
-        top_venues_matches = new_matchesDF[new_matchesDF["venue"].isin(top_venues)]
+    return {"chart": fig}
 
-        top_venues_matches["venue_location"] = (
-            top_venues_matches["venue"].astype(str)
-            + ", "
-            + top_venues_matches["city"].astype(str)
-        )
 
-        venue_toss_stats = (
-            top_venues_matches.groupby(["venue_location", "toss_decision"])
-            .size()
-            .reset_index(name="count")
-        )
+@sections.section(
+    "👉 Overwise Average Runs For Each Team Since 2008",
+    overwise_average_runs,
+    overwise_average_runs_figures,
+)
+def show_overwise_average_runs(corr_transposed, figures):
+    st.plotly_chart(figures["chart"], transparent=True, use_container_width=True)
 
-        venue_toss_stats = venue_toss_stats.sort_values(by="count", ascending=False)
-
-        fig = px.bar(
-            venue_toss_stats,
-            x="venue_location",
-            y="count",
-            color="toss_decision",
-            labels={"count": "Count", "venue_location": "Venue and City"},
-            color_discrete_sequence=px.colors.sequential.Viridis,
-            barmode="group",
-            text="count",
-        )
 
-        fig.update_layout(
-            title_text="Toss Decision Based on Top Venues",
-            xaxis_title="Venue and City",
-            yaxis_title="Count",
-            title_x=0.5,
-            height=600,
-            width=800,
-            xaxis=dict(showgrid=False, tickangle=-45),
-            yaxis=dict(showgrid=True),
-            plot_bgcolor="rgba(0,0,0,0)",
-            legend_title_text="Decision Taken",
-        )
+########################################################################
+#######          Toss Decision Based On Top Venues         #############
+########################################################################
+def venue_toss_decisions():
+    matches = load_matches_data()
+    top_venues = matches["venue"].value_counts().head(15).index.to_list()
+    top_venues_matches = matches[matches["venue"].isin(top_venues)].copy()
 
-        fig.update_traces(textposition="outside")
+    top_venues_matches["venue_location"] = (
+        top_venues_matches["venue"].astype(str)
+        + ", "
+        + top_venues_matches["city"].astype(str)
+    )
 
-        st.plotly_chart(fig, use_container_width=True)
+    venue_toss_stats = (
+        top_venues_matches.groupby(["venue_location", "toss_decision"])
+        .size()
+        .reset_index(name="count")
+    )
 
-        venue_toss_stats = venue_toss_stats.rename(
-            columns={
-                "count": "Count",
-                "venue_location": "Venue and City",
-                "toss_decision": "Decision Taken",
-            }
-        )
+    return venue_toss_stats.sort_values(by="count", ascending=False)
 
-        st.dataframe(
-            venue_toss_stats.sort_values(by="Count", ascending=False),
-            width=800,
-            height=400,
-        )
 
-    #############################################################################
-    ###########         Average Runs By Teams In Last Over         ##############
-    #############################################################################
-    with st.expander("👉 Average Runs Scored By Teams In Last Over"):
-        last_over = new_deliveriesDF[new_deliveriesDF["over"] == 19]
-
-        twenty_over_scores = (
-            (last_over.groupby("batting_team")["total_runs"]
-            .mean()
-            *6)
-            .round(2)
-            .sort_values(ascending=False)
-        )
+def venue_toss_decisions_figures(venue_toss_stats):
+    fig = px.bar(
+        venue_toss_stats,
+        x="venue_location",
+        y="count",
+        color="toss_decision",
+        labels={"count": "Count", "venue_location": "Venue and City"},
+        color_discrete_sequence=px.colors.sequential.Viridis,
+        barmode="group",
+        text="count",
+    )
 
-        fig = px.bar(
-            x=twenty_over_scores.values,
-            y=twenty_over_scores.index,
-            orientation="h",
-            labels={"x": "Total Runs", "y": "Teams"},
-            color=twenty_over_scores.index,
-            text=twenty_over_scores.values,
-            color_discrete_sequence=px.colors.sequential.Viridis,
-        )
+    fig.update_layout(
+        title_text="Toss Decision Based on Top Venues",
+        xaxis_title="Venue and City",
+        yaxis_title="Count",
+        title_x=0.5,
+        height=600,
+        width=800,
+        xaxis=dict(showgrid=False, tickangle=-45),
+        yaxis=dict(showgrid=True),
+        plot_bgcolor="rgba(0,0,0,0)",
+        legend_title_text="Decision Taken",
+    )
 
-        fig.update_traces(textposition="outside")
-        fig.update_layout(
-            yaxis=dict(autorange="reversed", showgrid=False),
-            xaxis=dict(showgrid=False),
-            plot_bgcolor="rgba(0,0,0,0)",
-            showlegend=False,
-            title="Average Runs Scored By Teams in Last Over Since 2008",
-        )
+    fig.update_traces(textposition="outside")
 
-        st.plotly_chart(fig, use_container_width=True)
+    return {"chart": fig}
 
-    ##############################################################################
-    #####           Total Runs Scored By Teams In Last Over Since 2008       #####
-    ##############################################################################
-    with st.expander("👉 Total Runs Scored By Teams In Last Over Since 2008"):
-        last_over = new_deliveriesDF[new_deliveriesDF["over"] == 19]
 
-        twenty_over_scores = (
-            last_over.groupby("batting_team")["total_runs"]
-            .sum()
-            .sort_values(ascending=False)
-        )
+@sections.section(
+    "👉 Toss Decision Based on Top Venues",
+    venue_toss_decisions,
+    venue_toss_decisions_figures,
+)
+def show_venue_toss_decisions(venue_toss_stats, figures):
+    st.plotly_chart(figures["chart"], use_container_width=True)
 
-        fig = px.bar(
-            x=twenty_over_scores.values,
-            y=twenty_over_scores.index,
-            orientation="h",
-            labels={"x": "Total Runs", "y": "Teams"},
-            color=twenty_over_scores.index,
-            text=twenty_over_scores.values,
-            color_discrete_sequence=px.colors.sequential.Viridis,
-        )
+    venue_toss_stats = venue_toss_stats.rename(
+        columns={
+            "count": "Count",
+            "venue_location": "Venue and City",
+            "toss_decision": "Decision Taken",
+        }
+    )
 
-        plt.xticks(rotation=45, ha="right")
+    st.dataframe(
+        venue_toss_stats.sort_values(by="Count", ascending=False),
+        width=800,
+        height=400,
+    )
 
-        fig.update_traces(textposition="outside")
 
-        fig.update_layout(
-            title="Total Runs Scored By Teams In Last Over Since 2008",
-            yaxis=dict(autorange="reversed", showgrid=False),
-            xaxis=dict(showgrid=False),
-            plot_bgcolor="rgba(0,0,0,0)",
-            showlegend=False,
-        )
+#############################################################################
+###########         Average Runs By Teams In Last Over         ##############
+#############################################################################
+def average_last_over_runs():
+    return (
+        (load_eda_aggregates()["last_over_team_mean_runs"]
+        *6)
+        .round(2)
+        .sort_values(ascending=False)
+    )
 
-        st.plotly_chart(fig, use_container_width=True)
 
-    ##############################################################################
-    ###                    Total Runs Scored in Each Season                 ######
-    ##############################################################################
-    with st.expander("👉 Total Runs Scored in Each Season"):
+def average_last_over_runs_figures(twenty_over_scores):
+    fig = px.bar(
+        x=twenty_over_scores.values,
+        y=twenty_over_scores.index,
+        orientation="h",
+        labels={"x": "Total Runs", "y": "Teams"},
+        color=twenty_over_scores.index,
+        text=twenty_over_scores.values,
+        color_discrete_sequence=px.colors.sequential.Viridis,
+    )
 
-        new_matchesDF["season"] = new_matchesDF["season"].astype(str)
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        yaxis=dict(autorange="reversed", showgrid=False),
+        xaxis=dict(showgrid=False),
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+        title="Average Runs Scored By Teams in Last Over Since 2008",
+    )
 
-        season_runs = new_matchesDF.groupby("season")["target_runs"].sum().reset_index()
+    return {"chart": fig}
 
-        temp4 = season_runs.set_index("season")
 
-        fig = px.line(
-            data_frame=season_runs,
-            x="season",
-            y="target_runs",
-            labels={"target_runs": "Total Runs", "season": "Season"},
-            markers=True,
-            text="target_runs",
-        )
+@sections.section(
+    "👉 Average Runs Scored By Teams In Last Over",
+    average_last_over_runs,
+    average_last_over_runs_figures,
+)
+def show_average_last_over_runs(twenty_over_scores, figures):
+    st.plotly_chart(figures["chart"], use_container_width=True)
 
-        fig.update_layout(
-            title="Total Runs Per Season",
-            title_x=0.5,
-            xaxis_title="Season",
-            yaxis_title="Total Runs",
-            xaxis=dict(showgrid=False, tickangle=-45),
-            yaxis=dict(showgrid=True),
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-        )
 
-        fig.update_traces(
-            textposition="top center", marker=dict(size=8), line=dict(width=2)
-        )
+##############################################################################
+#####           Total Runs Scored By Teams In Last Over Since 2008       #####
+##############################################################################
+def total_last_over_runs():
+    return load_eda_aggregates()["last_over_team_runs"].sort_values(ascending=False, kind="stable")
 
-        st.plotly_chart(fig, use_container_width=True)
-
-    #####################################################################
-    ###           Count of Matches By Different Umpires               ###
-    #####################################################################
-    with st.expander("👉 Count of Matches Umpired By Different Umpires"):
-        umpires = pd.concat(
-            [new_matchesDF["umpire1"], new_matchesDF["umpire2"]]
-        ).value_counts()
-
-        top_10_umpires = umpires.nlargest(10)
-
-        fig = px.bar(
-            x=top_10_umpires.values,
-            y=top_10_umpires.index,
-            orientation="h",
-            labels={"x": "Matches Umpired", "y": "Umpire Name"},
-            color=top_10_umpires.index,
-            text=top_10_umpires.values,
-            color_discrete_sequence=px.colors.sequential.Viridis,
-        )
 
-        fig.update_traces(textposition="outside")
-        fig.update_layout(
-            yaxis=dict(autorange="reversed", showgrid=False),
-            xaxis=dict(showgrid=False),
-            plot_bgcolor="rgba(0,0,0,0)",
-            showlegend=False,
-            title="Top 10 Umpires Based on Matches Umpired",
-        )
+def total_last_over_runs_figures(twenty_over_scores):
+    fig = px.bar(
+        x=twenty_over_scores.values,
+        y=twenty_over_scores.index,
+        orientation="h",
+        labels={"x": "Total Runs", "y": "Teams"},
+        color=twenty_over_scores.index,
+        text=twenty_over_scores.values,
+        color_discrete_sequence=px.colors.sequential.Viridis,
+    )
 
-        st.plotly_chart(fig, use_container_width=True)
-
-    #####################################################################
-    ####              Teams with more than 200+ scores               ####
-    #####################################################################
-    with st.expander("👉 Teams With More Than 200+ Scores"):
-        runs = (
-            new_deliveriesDF.groupby(
-                ["match_id", "inning", "batting_team", "bowling_team"]
-            )["total_runs"]
-            .sum()
-            .reset_index()
-        )
+    fig.update_traces(textposition="outside")
 
-        runs_over_200_df = runs[runs["total_runs"] > 200]
+    fig.update_layout(
+        title="Total Runs Scored By Teams In Last Over Since 2008",
+        yaxis=dict(autorange="reversed", showgrid=False),
+        xaxis=dict(showgrid=False),
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+    )
 
-        runs_over_200 = runs_over_200_df["batting_team"].value_counts()
+    return {"chart": fig}
 
-        fig = px.bar(
-            x=runs_over_200.values,
-            y=runs_over_200.index,
-            orientation="h",
-            labels={"x": "Number of Instances", "y": "Teams"},
-            text=runs_over_200.values,
-            color=runs_over_200.index,
-            color_discrete_sequence=px.colors.sequential.Viridis,
-        )
 
-        fig.update_traces(textposition="outside")
-        fig.update_layout(
-            yaxis=dict(autorange="reversed", showgrid=False),
-            xaxis=dict(showgrid=False),
-            plot_bgcolor="rgba(0,0,0,0)",
-            showlegend=False,
-            title="Most 200+ Runs Scored By Teams",
-        )
+@sections.section(
+    "👉 Total Runs Scored By Teams In Last Over Since 2008",
+    total_last_over_runs,
+    total_last_over_runs_figures,
+)
+def show_total_last_over_runs(twenty_over_scores, figures):
+    st.plotly_chart(figures["chart"], use_container_width=True)
 
-        st.plotly_chart(fig, use_container_width=True)
 
-    ###########################################################################
-    ############ Lucky Venue For Teams ########################################
-    ###########################################################################
-    with st.expander("👉  Lucky Venue For Teams"):
-        teams = new_matchesDF.team1.unique().tolist()
+##############################################################################
+###                    Total Runs Scored in Each Season                 ######
+##############################################################################
+def season_runs():
+    matches = load_matches_data()
+    # Group by the season as text without converting the shared matches frame
+    return matches.groupby(matches["season"].astype(str))["target_runs"].sum().reset_index()
 
-        new_matchesDF["venue"] = new_matchesDF["venue"]
 
-        for team in teams:
-            fig = plt.figure(figsize=(10, 5))
+def season_runs_figures(season_runs):
+    fig = px.line(
+        data_frame=season_runs,
+        x="season",
+        y="target_runs",
+        labels={"target_runs": "Total Runs", "season": "Season"},
+        markers=True,
+        text="target_runs",
+    )
 
-            team_name = team
+    fig.update_layout(
+        title="Total Runs Per Season",
+        title_x=0.5,
+        xaxis_title="Season",
+        yaxis_title="Total Runs",
+        xaxis=dict(showgrid=False, tickangle=-45),
+        yaxis=dict(showgrid=True),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+    )
+
+    fig.update_traces(
+        textposition="top center", marker=dict(size=8), line=dict(width=2)
+    )
+
+    return {"chart": fig}
+
+
+@sections.section("👉 Total Runs Scored in Each Season", season_runs, season_runs_figures)
+def show_season_runs(season_runs, figures):
+    st.plotly_chart(figures["chart"], use_container_width=True)
+
+
+#####################################################################
+###           Count of Matches By Different Umpires               ###
+#####################################################################
+def top_10_umpires():
+    matches = load_matches_data()
+    umpires = pd.concat([matches["umpire1"], matches["umpire2"]]).value_counts()
+    return umpires.nlargest(10)
+
+
+def top_10_umpires_figures(top_10_umpires):
+    fig = px.bar(
+        x=top_10_umpires.values,
+        y=top_10_umpires.index,
+        orientation="h",
+        labels={"x": "Matches Umpired", "y": "Umpire Name"},
+        color=top_10_umpires.index,
+        text=top_10_umpires.values,
+        color_discrete_sequence=px.colors.sequential.Viridis,
+    )
+
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        yaxis=dict(autorange="reversed", showgrid=False),
+        xaxis=dict(showgrid=False),
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+        title="Top 10 Umpires Based on Matches Umpired",
+    )
+
+    return {"chart": fig}
+
+
+@sections.section(
+    "👉 Count of Matches Umpired By Different Umpires",
+    top_10_umpires,
+    top_10_umpires_figures,
+)
+def show_top_10_umpires(top_10_umpires, figures):
+    st.plotly_chart(figures["chart"], use_container_width=True)
+
+
+#####################################################################
+####              Teams with more than 200+ scores               ####
+#####################################################################
+def teams_200_plus():
+    runs = load_eda_aggregates()["innings_runs"].reset_index()
+
+    runs_over_200_df = runs[runs["total_runs"] > 200]
+
+    return runs_over_200_df["batting_team"].astype(object).value_counts()
+
+
+def teams_200_plus_figures(runs_over_200):
+    fig = px.bar(
+        x=runs_over_200.values,
+        y=runs_over_200.index,
+        orientation="h",
+        labels={"x": "Number of Instances", "y": "Teams"},
+        text=runs_over_200.values,
+        color=runs_over_200.index,
+        color_discrete_sequence=px.colors.sequential.Viridis,
+    )
+
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        yaxis=dict(autorange="reversed", showgrid=False),
+        xaxis=dict(showgrid=False),
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+        title="Most 200+ Runs Scored By Teams",
+    )
+
+    return {"chart": fig}
+
+
+@sections.section("👉 Teams With More Than 200+ Scores", teams_200_plus, teams_200_plus_figures)
+def show_teams_200_plus(runs_over_200, figures):
+    st.plotly_chart(figures["chart"], use_container_width=True)
+
+
+###########################################################################
+############ Lucky Venue For Teams ########################################
+###########################################################################
+def lucky_venues():
+    """Top 10 winning venues of every team, in team1 order"""
+    return top_venue_wins(load_matches_data(), n=10)
 
-            lucky_venues = (
-                new_matchesDF[new_matchesDF["winner"] == team_name]["venue"]
-                .value_counts()
-                .nlargest(10)
-            )
 
-            num_venues = len(lucky_venues)
-
-            explode = [0.1] * num_venues
-            colors = [
-                "turquoise",
-                "lightblue",
-                "lightgreen",
-                "crimson",
-                "magenta",
-                "orange",
-            ]
-            colors = colors * (num_venues // len(colors) + 1)
-            colors = colors[:num_venues]
-
-            lucky_venues.plot(
-                kind="pie",
-                autopct="%1.1f%%",
-                explode=explode,
-                shadow=True,
-                startangle=20,
-                colors=colors,
+# Teams per row of the lucky venue grid
+LUCKY_VENUE_COLUMNS = 2
+
+# The pies are shown well below their drawn size, so a lower resolution than other charts keeps the PNGs small
+LUCKY_VENUE_DPI = 72
+
+LUCKY_VENUE_COLORS = ["turquoise", "lightblue", "lightgreen", "crimson", "magenta", "orange"]
+
+
+def lucky_venues_figures(teams):
+    """One PNG per row of team pies, so the grid is sent as a few small images"""
+    rows = {}
+    with plt.rc_context(EDA_STYLE):
+        for start in range(0, max(len(teams), 1), LUCKY_VENUE_COLUMNS):
+            row_teams = teams[start:start + LUCKY_VENUE_COLUMNS]
+            fig, axes = plt.subplots(
+                1, LUCKY_VENUE_COLUMNS, figsize=(10 * LUCKY_VENUE_COLUMNS, 5), squeeze=False
             )
+            for ax in axes.flat[len(row_teams):]:
+                ax.axis("off")
+
+            for ax, (team, lucky_venues) in zip(axes.flat, row_teams):
+                num_venues = len(lucky_venues)
+                colors = LUCKY_VENUE_COLORS * (num_venues // len(LUCKY_VENUE_COLORS) + 1)
+
+                lucky_venues.plot(
+                    kind="pie",
+                    ax=ax,
+                    autopct="%1.1f%%",
+                    explode=[0.1] * num_venues,
+                    shadow=True,
+                    startangle=20,
+                    colors=colors[:num_venues],
+                )
+
+                ax.set_title(f"Win Percentage at Different Venues for {team}")
 
-            plt.title(f"Win Percentage at Different Venues for {team}")
+                ax.set_ylabel("")
 
-            plt.ylabel("")
+            rows[f"row {start // LUCKY_VENUE_COLUMNS}"] = figure_png(fig, dpi=LUCKY_VENUE_DPI)
+
+    return rows
+
+
+@sections.section("👉  Lucky Venue For Teams", lucky_venues, lucky_venues_figures)
+def show_lucky_venues(teams, figures):
+    for row in figures.values():
+        st.image(row)
+
+
+def app():
+    st.markdown(
+        """
+    <h1 style='text-align:center; color: #e8630a;'><strong>🌟EXPLORATORY DATA ANALYSIS🌟</strong></h1>
+    <hr style="border-top: 3px solid #e8630a;">
+    """,
+        unsafe_allow_html=True,
+    )
 
-            st.pyplot(fig, transparent=True)
+    # Sections compute (or load their artifacts) when opened and keep them until the data changes
+    sections.render(eda_fingerprint())
@@ -1,13 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
 from ..utils.scrollToTop import create_scroll_to_top_button
-from ..analysis.datasetPreprocessing import load_deliveries_data
+from ..utils.playerSelect import player_selectbox
+from ..analysis.playerProfiles import player_profile
 
 
 def app():
-    # Load data at the start of the function
-    new_deliveriesDF = load_deliveries_data()
-    
     st.markdown(
         """
     <h1 style='text-align:center; color: #4fb9fc;'><strong>🏏 PLAYER ANALYSIS 🏏</strong></h1>
@@ -16,33 +14,23 @@ def app():
         unsafe_allow_html=True,
     )
 
-    Batsman = new_deliveriesDF["batter"].unique().tolist()
-    Bowler = new_deliveriesDF["bowler"].unique().tolist()
-
-    Batsman.extend(Bowler)
-    Players = list(set(Batsman))
-
-    player = st.selectbox("Select A Player", Players)
+    player = player_selectbox("Select A Player", "Search A Player", roles=("batter", "bowler"))
     Analyze = st.button("Analyze")
 
     ###########################################################
     # --------------->   PLAYER AS BATSMAN      <--------------
     ###########################################################
 
-    if Analyze:
-        selected_player_bat_df = new_deliveriesDF[new_deliveriesDF["batter"] == player]
+    if Analyze and player is not None:
+        # Grouped runs, overs and splits of the player, read from the profile store
+        batting, bowling = player_profile(player)
 
-        if len(selected_player_bat_df) != 0:
+        if batting is not None:
             ###########################################################
             # ----------->   RUNS AGAINST OTHER TEAMS      <-----------
             ###########################################################
 
-            player_runs_against_teams = (
-                selected_player_bat_df.groupby("bowling_team")["total_runs"]
-                .sum()
-                .reset_index()
-                .sort_values(by="total_runs", ascending=False)
-            )
+            player_runs_against_teams = batting.runs_by_team
 
             fig = go.Figure()
 
@@ -77,12 +65,7 @@ def app():
             #############################################################
             # --------->   RUNS AGAINST DIFFERENT BOWLERS      <---------
             #############################################################
-            player_runs_against_bowlers = (
-                selected_player_bat_df.groupby("bowler")["total_runs"]
-                .sum()
-                .reset_index()
-                .sort_values(by="total_runs", ascending=False)[:15]
-            )
+            player_runs_against_bowlers = batting.runs_by_bowler
 
             fig = go.Figure()
 
@@ -117,12 +100,7 @@ def app():
             #############################################################
             # ---------------->   PARTNERSHIP RUNS      <----------------
             #############################################################
-            player_partnership_runs = (
-                selected_player_bat_df.groupby("non_striker")["total_runs"]
-                .sum()
-                .reset_index()
-                .sort_values(by="total_runs", ascending=False)[:15]
-            )
+            player_partnership_runs = batting.runs_with_partner
 
             fig = go.Figure()
 
@@ -158,9 +136,7 @@ def app():
             #############################################################
             # ------->   PLAYER'S RUNS IN DIFFERENT INNINGS      <-------
             #############################################################
-            innings_runs = selected_player_bat_df[selected_player_bat_df["inning"] < 3]
-
-            innings = innings_runs.groupby("inning")["total_runs"].sum().reset_index()
+            innings = batting.runs_by_inning
 
             fig = go.Figure()
 
@@ -200,18 +176,11 @@ def app():
         # --------------->   PLAYER AS BOWLER      <--------------
         ###########################################################
 
-        selected_player_boll_df = new_deliveriesDF[new_deliveriesDF["bowler"] == player]
-
-        if len(selected_player_boll_df) != 0:
+        if bowling is not None:
             #############################################################
             # -------->   RUNS GIVEN TO DIFFERENT PLAYERS      <--------
             #############################################################
-            player_df_bowl_players = (
-                selected_player_boll_df.groupby("batter")["total_runs"]
-                .sum()
-                .reset_index()
-                .sort_values(by="total_runs", ascending=False)[:15]
-            )
+            player_df_bowl_players = bowling.runs_to_batter
 
             fig = go.Figure()
 
@@ -247,12 +216,7 @@ def app():
             # --------->   RUNS GIVEN IN DIFFERENT OVERS      <---------
             #############################################################
 
-            player_df_bowl_overs = (
-                selected_player_boll_df.groupby("over")["total_runs"]
-                .sum()
-                .reset_index()
-                .sort_values(by="over", ascending=True)
-            )
+            player_df_bowl_overs = bowling.runs_by_over
 
             fig = go.Figure()
 
@@ -302,21 +266,7 @@ def app():
             #############################################################
             # --------->   OVERS THROWN BY THE PLAYER      <---------
             #############################################################
-            selected_player_boll_over = (
-                selected_player_boll_df["over"].value_counts().reset_index()
-            )
-
-            selected_player_boll_over.columns = ["over", "count"]
-
-            selected_player_boll_over["over"] = selected_player_boll_over[
-                "over"
-            ].astype(int)
-
-            selected_player_boll_over = selected_player_boll_over.sort_values(by="over")
-
-            selected_player_boll_over["count"] = (
-                selected_player_boll_over["count"] / 6
-            ).round(2)
+            selected_player_boll_over = bowling.overs_bowled
 
             fig = go.Figure()
 
@@ -364,14 +314,7 @@ def app():
             #############################################################
             # --------->   RUNS GIVEN TO DIFFERENT TEAMS      <---------
             #############################################################
-            player_df_bowl_n = new_deliveriesDF[new_deliveriesDF["bowler"] == player]
-
-            player_df_bowl_teams = (
-                player_df_bowl_n.groupby("batting_team")["total_runs"]
-                .sum()
-                .reset_index()
-                .sort_values(by="total_runs", ascending=False)[:15]
-            )
+            player_df_bowl_teams = bowling.runs_by_batting_team
 
             fig = go.Figure()
 
@@ -6,13 +6,16 @@ import plotly.offline as pyo
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from ..utils.scrollToTop import create_scroll_to_top_button
-from ..analysis.datasetPreprocessing import load_matches_data, load_deliveries_data
+from ..utils.figureCache import cached_figure
+from ..analysis.datasetPreprocessing import deliveries_key, load_matches_data, matches_key
+from ..analysis.teamBundles import team_bundle
 
 
 def app():
     # Load data at the start of the function
     new_matchesDF = load_matches_data()
-    new_deliveriesDF = load_deliveries_data()
+    # Rendered charts are reused until either dataset changes
+    chart_fingerprint = f"{matches_key()}-{deliveries_key()}"
     
     st.markdown(
         """
@@ -34,26 +37,9 @@ def app():
         ###########################################################
         # -------->   AVERAGE SCORE AGAINST EACH TEAM      <-------
         ###########################################################
-        selected_team_df = new_deliveriesDF[
-            new_deliveriesDF["batting_team"].str.strip() == team
-        ]
-
-        innings_data = (
-            selected_team_df.groupby(["match_id", "inning", "bowling_team"])[
-                "total_runs"
-            ]
-            .sum()
-            .reset_index()
-        )
-
-        innings_data_scores = (
-            innings_data.groupby("bowling_team")["total_runs"]
-            .mean()
-            .round()
-            .astype(int)
-            .reset_index()
-            .sort_values(by="total_runs", ascending=False)
-        )
+        # Innings totals, over profile and splits of every team are built once
+        bundle = team_bundle(team)
+        innings_data_scores = bundle.opponent_averages
 
         fig = go.Figure()
 
@@ -98,14 +84,20 @@ def app():
         st.image("Images/divider.png")
 
         ###########################################################
-        # -> AVERAGE RUNS SCORED BY THE TEAM IN DIFFERENT OVERS   <-
+        # ------------>   BATTING FIRST V/S CHASING     <----------
         ###########################################################
-        team_over_data = (
-            (selected_team_df.groupby("over")["total_runs"].mean() * 6)
-            .round()
-            .astype(int)
-            .reset_index()
+        st.markdown(
+            f"<h5 style='text-align: center; color: white;'> {team} Batting First v/s Chasing </h5>",
+            unsafe_allow_html=True,
         )
+        st.table(bundle.inning_splits)
+
+        st.image("Images/divider.png")
+
+        ###########################################################
+        # -> AVERAGE RUNS SCORED BY THE TEAM IN DIFFERENT OVERS   <-
+        ###########################################################
+        team_over_data = bundle.over_profile
 
         fig = go.Figure()
 
@@ -188,17 +180,20 @@ def app():
         )
 
         # Most Win Based On Venue,City
-        venue_win = new_matchesDF[new_matchesDF["winner"] == team][
-            "venue"
-        ].value_counts()[:10]
-
-        fig = plt.figure(figsize=(20, 5))
-        ax = sns.barplot(x=venue_win.index, y=venue_win.values)
-        ax.bar_label(ax.containers[0])
-        plt.xlabel("Venues")
-        plt.ylabel("Wins")
-        plt.xticks(fontsize=12, rotation="vertical")
-        st.pyplot(fig, transparent=True)
+        def venue_wins():
+            venue_win = new_matchesDF[new_matchesDF["winner"] == team][
+                "venue"
+            ].value_counts()[:10]
+
+            fig = plt.figure(figsize=(20, 5))
+            ax = sns.barplot(x=venue_win.index, y=venue_win.values)
+            ax.bar_label(ax.containers[0])
+            plt.xlabel("Venues")
+            plt.ylabel("Wins")
+            plt.xticks(fontsize=12, rotation="vertical")
+            return fig
+
+        st.image(cached_figure("venue wins", (team,), chart_fingerprint, venue_wins))
 
         st.image("Images/divider.png")
 
@@ -208,30 +203,18 @@ def app():
         )
 
         # Top 10 Highest Runs
-        fig = plt.figure(figsize=(12, 10))
-        team_runs_over_200_df = (
-            selected_team_df.groupby(["match_id", "bowling_team", "inning"])[
-                "total_runs"
-            ]
-            .sum()
-            .reset_index()
-            .sort_values(by="total_runs", ascending=False)
-        )
-        team_runs_over_200 = team_runs_over_200_df[
-            team_runs_over_200_df["total_runs"] > 200
-        ]
-        team_runs_over_200["data"] = (
-            team_runs_over_200["match_id"].astype(str)
-            + "_"
-            + team_runs_over_200["bowling_team"]
-        )
-        ax = sns.barplot(data=team_runs_over_200, y="data", x="total_runs")
-        ax.bar_label(ax.containers[0])
-        plt.title(f"{team} 200+ Runs : Total({len(team_runs_over_200)})")
-        plt.xlabel("Runs")
-        plt.ylabel("Opponents")
-        plt.xticks(fontsize=12, rotation="vertical")
-        st.pyplot(fig, transparent=True)
+        def highest_totals():
+            fig = plt.figure(figsize=(12, 10))
+            team_runs_over_200 = bundle.highest_totals
+            ax = sns.barplot(data=team_runs_over_200, y="data", x="total_runs")
+            ax.bar_label(ax.containers[0])
+            plt.title(f"{team} 200+ Runs : Total({len(team_runs_over_200)})")
+            plt.xlabel("Runs")
+            plt.ylabel("Opponents")
+            plt.xticks(fontsize=12, rotation="vertical")
+            return fig
+
+        st.image(cached_figure("highest totals", (team,), chart_fingerprint, highest_totals))
 
         st.image("Images/divider.png")
         st.markdown(
@@ -240,31 +223,19 @@ def app():
         )
 
         # Top 10 Lowest Runs
-        fig = plt.figure(figsize=(12, 10))
-        team_runs_over_df = (
-            selected_team_df.groupby(["match_id", "bowling_team", "inning"])[
-                "total_runs"
-            ]
-            .sum()
-            .reset_index()
-            .sort_values(by="total_runs", ascending=True)
-        )
-        team_runs_over_df = team_runs_over_df[team_runs_over_df["inning"] < 3]
-        team_runs_over_df = team_runs_over_df[:10]
-
-        team_runs_over_df["data"] = (
-            team_runs_over_df["match_id"].astype(str)
-            + "_"
-            + team_runs_over_df["bowling_team"]
-        )
-
-        ax = sns.barplot(data=team_runs_over_df, y="data", x="total_runs")
-        ax.bar_label(ax.containers[0])
-        plt.title(f"{team} Top 10 Lowest Runs")
-        plt.xlabel("Runs")
-        plt.ylabel("Opponents")
-        plt.xticks(fontsize=12, rotation="vertical")
-        st.pyplot(fig, transparent=True)
+        def lowest_totals():
+            fig = plt.figure(figsize=(12, 10))
+            team_runs_over_df = bundle.lowest_totals
+
+            ax = sns.barplot(data=team_runs_over_df, y="data", x="total_runs")
+            ax.bar_label(ax.containers[0])
+            plt.title(f"{team} Top 10 Lowest Runs")
+            plt.xlabel("Runs")
+            plt.ylabel("Opponents")
+            plt.xticks(fontsize=12, rotation="vertical")
+            return fig
+
+        st.image(cached_figure("lowest totals", (team,), chart_fingerprint, lowest_totals))
 
         st.image("Images/divider.png")
 
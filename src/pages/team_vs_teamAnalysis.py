@@ -4,7 +4,20 @@ import streamlit as st
 import plotly.express as px
 import matplotlib.pyplot as plt
 from ..utils.scrollToTop import create_scroll_to_top_button
-from ..analysis.datasetPreprocessing import load_matches_data, load_deliveries_data
+from ..utils.figureCache import cached_figure
+from ..analysis.datasetPreprocessing import (
+    deliveries_key,
+    load_deliveries_data,
+    load_matches_data,
+    matches_key,
+)
+from ..analysis.teamPairs import load_team_pairs
+
+# Deliveries columns this page reads (team totals come from the team-pair cube)
+DELIVERIES_COLUMNS = [
+    "batter",
+    "total_runs",
+]
 
 
 ###########################################################
@@ -40,10 +53,39 @@ def gen_colors(t1, t2):
     return [color_t1, color_t2]
 
 
+###########################################################
+# ----------->   TOP BOUNDARY HITTERS CHART    <-----------
+###########################################################
+def boundary_hitters_chart(batting_deliveries, runs, title, xlabel):
+    """Draw function of the top 10 players by deliveries hit for the given runs"""
+
+    def draw():
+        fig = plt.figure(figsize=(12, 10), dpi=150)
+
+        hitters = batting_deliveries[
+            batting_deliveries["total_runs"] == runs
+        ]["batter"].astype(object)
+
+        ax = sns.countplot(y=hitters, order=hitters.value_counts().iloc[:10].index)
+
+        ax.bar_label(ax.containers[0])
+
+        plt.title(title)
+        plt.ylabel("Players")
+        plt.xlabel(xlabel)
+
+        return fig
+
+    return draw
+
+
 def app():
     # Load data at the start of the function
     new_matchesDF = load_matches_data()
-    new_deliveriesDF = load_deliveries_data()
+    new_deliveriesDF = load_deliveries_data(DELIVERIES_COLUMNS)
+    team_pairs = load_team_pairs()
+    # Rendered charts are reused until either dataset changes
+    chart_fingerprint = f"{matches_key()}-{deliveries_key()}"
     
     st.markdown(
         """ 
@@ -53,10 +95,6 @@ def app():
         unsafe_allow_html=True,
     )
 
-    combine_df = new_matchesDF.merge(
-        new_deliveriesDF, left_on="id", right_on="match_id", how="left"
-    )
-
     Teams = new_matchesDF.team1.unique().tolist()
 
     c1, c2 = st.columns(2)
@@ -82,13 +120,9 @@ def app():
             )
 
             # Total Match Played
-            t1_batting = new_matchesDF[
-                (new_matchesDF["team1"] == t1) & (new_matchesDF["team2"] == t2)
-            ]
+            t1_batting = team_pairs.matches(new_matchesDF, t1, t2)
 
-            t2_batting = new_matchesDF[
-                (new_matchesDF["team1"] == t2) & (new_matchesDF["team2"] == t1)
-            ]
+            t2_batting = team_pairs.matches(new_matchesDF, t2, t1)
 
             total = pd.concat([t1_batting, t2_batting], ignore_index=True)
 
@@ -102,96 +136,91 @@ def app():
                 ###########################################################
                 # --------------------->   WINNER    <--------------------
                 ###########################################################
-                fig = plt.figure(figsize=(6, 4))
+                def match_winners():
+                    fig = plt.figure(figsize=(6, 4))
+
+                    ax = sns.countplot(total["winner"], palette=colors)
 
-                ax = sns.countplot(total["winner"], palette=colors)
+                    ax.bar_label(ax.containers[0])
 
-                ax.bar_label(ax.containers[0])
+                    plt.title(f"{t1} vs {t2} : Match Winners", fontsize=10)
+                    plt.xlabel("Teams")
+                    plt.ylabel("Winning Count")
 
-                plt.title(f"{t1} vs {t2} : Match Winners", fontsize=10)
-                plt.xlabel("Teams")
-                plt.ylabel("Winning Count")
+                    return fig
 
-                st.pyplot(fig, transparent=True)
+                st.image(cached_figure("match winners", (t1, t2), chart_fingerprint, match_winners))
 
                 ###########################################################
                 # -------------------->   TOSS WINS    <-------------------
                 ###########################################################
                 st.image("Images/divider.png")
-                fig = plt.figure(figsize=(6, 4))
 
-                print(total["toss_winner"].value_counts())
+                def toss_winners():
+                    fig = plt.figure(figsize=(6, 4))
+
+                    ax = sns.countplot(total["toss_winner"], palette=colors)
 
-                ax = sns.countplot(total["toss_winner"], palette=colors)
+                    ax.bar_label(ax.containers[0])
 
-                ax.bar_label(ax.containers[0])
+                    plt.title(f"{t1} vs {t2} : Toss Winners", fontsize=10)
 
-                plt.title(f"{t1} vs {t2} : Toss Winners", fontsize=10)
+                    plt.xlabel("Teams")
+                    plt.ylabel("Winning Count")
 
-                plt.xlabel("Teams")
-                plt.ylabel("Winning Count")
+                    return fig
 
-                st.pyplot(fig, transparent=True)
+                st.image(cached_figure("toss winners", (t1, t2), chart_fingerprint, toss_winners))
 
                 ###########################################################
                 # --------------->   PLAYER OF THE MATCH    <--------------
                 ###########################################################
                 st.image("Images/divider.png")
-                fig = plt.figure(figsize=(6, 8))
-
-                ax = sns.countplot(
-                    y=total["player_of_match"],
-                    hue=total["winner"],
-                    order=total["player_of_match"].value_counts().index,
-                    palette=colors,
-                )
+                def players_of_the_match():
+                    fig = plt.figure(figsize=(6, 8))
+
+                    ax = sns.countplot(
+                        y=total["player_of_match"],
+                        hue=total["winner"],
+                        order=total["player_of_match"].value_counts().index,
+                        palette=colors,
+                    )
 
-                if len(ax.containers) > 0:
-                    ax.bar_label(ax.containers[0])
-                if len(ax.containers) > 1:
-                    ax.bar_label(ax.containers[1])
+                    if len(ax.containers) > 0:
+                        ax.bar_label(ax.containers[0])
+                    if len(ax.containers) > 1:
+                        ax.bar_label(ax.containers[1])
 
-                legend = plt.legend()
-                frame = legend.get_frame()
-                frame.set_facecolor("black")
+                    legend = plt.legend()
+                    frame = legend.get_frame()
+                    frame.set_facecolor("black")
 
-                st.pyplot(fig, transparent=True)
+                    return fig
 
-                t1_batting = combine_df[
-                    (
-                        (combine_df["batting_team"] == t1)
-                        & (combine_df["bowling_team"] == t2)
-                    )
-                ]
+                st.image(
+                    cached_figure("players of the match", (t1, t2), chart_fingerprint, players_of_the_match)
+                )
 
-                t2_batting = combine_df[
-                    (
-                        (combine_df["batting_team"] == t2)
-                        & (combine_df["bowling_team"] == t1)
-                    )
-                ]
+                # Deliveries of each side batting against the other, ordered by match
+                t1_batting_del = team_pairs.deliveries(new_deliveriesDF, t1, t2)
+                t2_batting_del = team_pairs.deliveries(new_deliveriesDF, t2, t1)
 
-                total_del = pd.concat([t1_batting, t2_batting], ignore_index=True)
+                # Per-season totals of each side batting against the other
+                t1_cube = team_pairs.cube(t1, t2)
+                t2_cube = team_pairs.cube(t2, t1)
 
                 ###########################################################
                 # --------------->   BATTING TEAM T1 AVG    <--------------
                 ###########################################################
                 st.image("Images/divider.png")
-                temp = (
-                    total_del.groupby(
-                        ["season", "match_id", "inning", "batting_team", "bowling_team"]
-                    )["total_runs"]
-                    .sum()
-                    .reset_index()
-                )
-
-                temp = temp[temp["inning"] < 3]
+                runs = t1_cube[t1_cube["innings"] > 0]
 
-                runs = temp[temp.batting_team == t1][
-                    ["total_runs", "season", "match_id", "inning"]
-                ]
-
-                runs_avg = runs.groupby(by="season").mean().reset_index()
+                runs_avg = pd.DataFrame(
+                    {
+                        "season": runs["season"],
+                        "total_runs": runs["innings_runs"] / runs["innings"],
+                    }
+                )
 
                 fig = px.line(
                     data_frame=runs_avg,
@@ -207,23 +236,14 @@ def app():
                 # --------------->   BATTING TEAM T2 AVG    <--------------
                 ###########################################################
                 st.image("Images/divider.png")
-                fig = plt.figure(figsize=(10, 4))
-
-                temp = (
-                    total_del.groupby(
-                        ["season", "match_id", "inning", "batting_team", "bowling_team"]
-                    )["total_runs"]
-                    .sum()
-                    .reset_index()
-                )
-
-                temp = temp[temp["inning"] < 3]
+                runs = t2_cube[t2_cube["innings"] > 0]
 
-                runs = temp[temp.batting_team == t2][
-                    ["total_runs", "season", "match_id", "inning"]
-                ]
-
-                runs_avg = runs.groupby(by="season").mean().reset_index()
+                runs_avg = pd.DataFrame(
+                    {
+                        "season": runs["season"],
+                        "total_runs": runs["innings_runs"] / runs["innings"],
+                    }
+                )
 
                 fig = px.line(
                     data_frame=runs_avg,
@@ -244,76 +264,38 @@ def app():
                     unsafe_allow_html=True,
                 )
 
-                fig = plt.figure(figsize=(10, 4))
+                def city_wins():
+                    fig = plt.figure(figsize=(10, 4))
 
-                ax = sns.countplot(x=total["city"], hue=total["winner"], palette=colors)
+                    ax = sns.countplot(x=total["city"], hue=total["winner"], palette=colors)
 
-                if len(ax.containers) > 0:
-                    ax.bar_label(ax.containers[0])
-                if len(ax.containers) > 1:
-                    ax.bar_label(ax.containers[1])
+                    if len(ax.containers) > 0:
+                        ax.bar_label(ax.containers[0])
+                    if len(ax.containers) > 1:
+                        ax.bar_label(ax.containers[1])
 
-                legend = plt.legend()
-                frame = legend.get_frame()
-                frame.set_facecolor("black")
+                    legend = plt.legend()
+                    frame = legend.get_frame()
+                    frame.set_facecolor("black")
 
-                plt.title(
-                    f"{t1} vs {t2} : Match Win Based On City",
-                    fontsize=10,
-                )
+                    plt.title(
+                        f"{t1} vs {t2} : Match Win Based On City",
+                        fontsize=10,
+                    )
+
+                    plt.xlabel("City Names")
+                    plt.ylabel("frequency")
 
-                plt.xlabel("City Names")
-                plt.ylabel("frequency")
+                    return fig
 
-                st.pyplot(fig, transparent=True)
+                st.image(cached_figure("city wins", (t1, t2), chart_fingerprint, city_wins))
 
                 ###########################################################
                 # ---------------->   HEAD TO HEAD INFO    <---------------
                 ###########################################################
                 st.image("Images/divider.png")
 
-                def info(team):
-                    t = team
-                    er = total_del[total_del.bowling_team == t]["extra_runs"].sum()
-
-                    sixes = total_del[
-                        (total_del["batting_team"] == t)
-                        & (total_del["total_runs"] == 6)
-                    ].count()[0]
-
-                    fours = total_del[
-                        (total_del["batting_team"] == t)
-                        & (total_del["total_runs"] == 4)
-                    ].count()[0]
-
-                    doubles = total_del[
-                        (total_del["batting_team"] == t)
-                        & (total_del["total_runs"] == 2)
-                    ].count()[0]
-
-                    singles = total_del[
-                        (total_del["batting_team"] == t)
-                        & (total_del["total_runs"] == 1)
-                    ].count()[0]
-
-                    total_runs = total_del[total_del["batting_team"] == t][
-                        "total_runs"
-                    ].sum()
-
-                    return [er, sixes, fours, doubles, singles, total_runs]
-
-                df = pd.DataFrame(columns=["info", f"{t1}", f"{t2}"], index=None)
-                df["info"] = [
-                    "Extra Runs",
-                    "Sixes",
-                    "Fours",
-                    "Doubles",
-                    "Singles",
-                    "Total Runs",
-                ]
-
-                df[f"{t1}"] = info(t1)
-                df[f"{t2}"] = info(t2)
+                df = team_pairs.head_to_head(t1, t2)
 
                 st.markdown(
                     f"<h4 style='text-align: center; color: white;'> HEAD TO HEAD INFO </h4>",
@@ -331,25 +313,19 @@ def app():
                     unsafe_allow_html=True,
                 )
 
-                fig = plt.figure(figsize=(12, 10), dpi=150)
-
-                t1_player_six = total_del[
-                    (total_del["batting_team"] == t1) & (total_del["total_runs"] == 6)
-                ]["batter"]
-
-                ax = sns.countplot(
-                    y=t1_player_six, order=t1_player_six.value_counts().iloc[:10].index
-                )
-
-                ax.bar_label(ax.containers[0])
-
-                plt.title(
-                    f"Number of Sixes Hitted By Players of Team {t1} vs {t2} "
+                st.image(
+                    cached_figure(
+                        "t1 sixes",
+                        (t1, t2),
+                        chart_fingerprint,
+                        boundary_hitters_chart(
+                            t1_batting_del,
+                            6,
+                            f"Number of Sixes Hitted By Players of Team {t1} vs {t2} ",
+                            "Number of Sixes",
+                        ),
+                    )
                 )
-                plt.ylabel("Players")
-                plt.xlabel("Number of Sixes")
-
-                st.pyplot(fig, transparent=True)
 
                 ###########################################################
                 # ------------------>   TEAM T1 FOURS    <-----------------
@@ -360,25 +336,19 @@ def app():
                     unsafe_allow_html=True,
                 )
 
-                fig = plt.figure(figsize=(12, 10), dpi=150)
-
-                t1_player_six = total_del[
-                    (total_del["batting_team"] == t1) & (total_del["total_runs"] == 4)
-                ]["batter"]
-
-                ax = sns.countplot(
-                    y=t1_player_six, order=t1_player_six.value_counts().iloc[:10].index
-                )
-
-                ax.bar_label(ax.containers[0])
-
-                plt.title(
-                    f"Number of fours Hitted By Players of Team {t1} vs {t2} "
+                st.image(
+                    cached_figure(
+                        "t1 fours",
+                        (t1, t2),
+                        chart_fingerprint,
+                        boundary_hitters_chart(
+                            t1_batting_del,
+                            4,
+                            f"Number of fours Hitted By Players of Team {t1} vs {t2} ",
+                            "Number of fours",
+                        ),
+                    )
                 )
-                plt.ylabel("Players")
-                plt.xlabel("Number of fours")
-
-                st.pyplot(fig, transparent=True)
 
                 ###########################################################
                 # ------------------>   TEAM T2 SIXES    <-----------------
@@ -389,25 +359,19 @@ def app():
                     unsafe_allow_html=True,
                 )
 
-                fig = plt.figure(figsize=(12, 10), dpi=150)
-
-                t1_player_six = total_del[
-                    (total_del["batting_team"] == t2) & (total_del["total_runs"] == 6)
-                ]["batter"]
-
-                ax = sns.countplot(
-                    y=t1_player_six, order=t1_player_six.value_counts().iloc[:10].index
-                )
-
-                ax.bar_label(ax.containers[0])
-
-                plt.title(
-                    f"Number of Sixes Hitted By Players of Team {t2} vs {t1} "
+                st.image(
+                    cached_figure(
+                        "t2 sixes",
+                        (t1, t2),
+                        chart_fingerprint,
+                        boundary_hitters_chart(
+                            t2_batting_del,
+                            6,
+                            f"Number of Sixes Hitted By Players of Team {t2} vs {t1} ",
+                            "Number of Sixes",
+                        ),
+                    )
                 )
-                plt.ylabel("Players")
-                plt.xlabel("Number of Sixes")
-
-                st.pyplot(fig, transparent=True)
 
                 ###########################################################
                 # ------------------>   TEAM T2 FOURS    <-----------------
@@ -418,25 +382,19 @@ def app():
                     unsafe_allow_html=True,
                 )
 
-                fig = plt.figure(figsize=(12, 10), dpi=150)
-
-                t1_player_six = total_del[
-                    (total_del["batting_team"] == t2) & (total_del["total_runs"] == 4)
-                ]["batter"]
-
-                ax = sns.countplot(
-                    y=t1_player_six, order=t1_player_six.value_counts().iloc[:10].index
-                )
-
-                ax.bar_label(ax.containers[0])
-
-                plt.title(
-                    f"Number of fours Hitted By Players of Team {t2}  vs {t1} "
+                st.image(
+                    cached_figure(
+                        "t2 fours",
+                        (t1, t2),
+                        chart_fingerprint,
+                        boundary_hitters_chart(
+                            t2_batting_del,
+                            4,
+                            f"Number of fours Hitted By Players of Team {t2}  vs {t1} ",
+                            "Number of fours",
+                        ),
+                    )
                 )
-                plt.ylabel("Players")
-                plt.xlabel("Number of fours")
-
-                st.pyplot(fig, transparent=True)
 
                 st.image("Images/divider.png")
 
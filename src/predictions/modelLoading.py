@@ -0,0 +1,191 @@
+import os
+import sys
+import pickle
+import numpy as np
+from ..utils.singleFlight import SingleFlight
+
+SCORE_MODEL_PATH = "Model/predict_ipl_score_best_rf.pkl"
+WINNER_MODEL_PATH = "Model/winner_prediction_model.pkl"
+# Older winner models were saved at the project root without team labels
+LEGACY_WINNER_MODEL_PATH = "winner_prediction_model.pkl"
+
+# Score model inputs: wickets out, over, runs and wickets in the last 5 overs, current runs,
+# then the one-hot batting and bowling teams (10 each)
+SCORE_FEATURE_COUNT = 25
+
+# Set IPL_MODEL_HOT_RELOAD=0 to keep serving the loaded models when their files change
+MODEL_HOT_RELOAD = os.getenv("IPL_MODEL_HOT_RELOAD", "1") == "1"
+
+
+def file_stamp(path):
+    """(modification time, size) of a file, None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def object_memory_bytes(obj):
+    """Approximate memory held by an object graph, counting numpy buffers by nbytes
+
+    Follows containers, instance attributes and the state of extension types
+    that only expose __getstate__ (such as the trees of a random forest).
+    """
+    # Keep every visited object alive, so a temporary's id cannot be reused and skipped
+    seen = {}
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen[id(item)] = item
+        if isinstance(item, np.ndarray):
+            total += item.nbytes
+            if item.dtype == object:
+                stack.extend(item.ravel().tolist())
+            continue
+        total += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool, type, type(None))):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.append(vars(item))
+        elif hasattr(item, "__getstate__"):
+            try:
+                stack.append(item.__getstate__())
+            except TypeError:
+                pass
+    return total
+
+
+def _check_feature_count(model, count, name):
+    n_features = getattr(model, "n_features_in_", None)
+    if n_features is not None and n_features != count:
+        raise ValueError(f"{name} expects {n_features} features, the page builds {count}")
+
+
+def _load_score_model():
+    print("🤖 Loading score prediction model...")
+    with open(SCORE_MODEL_PATH, "rb") as f:
+        return SCORE_MODEL_PATH, pickle.load(f)
+
+
+def _validate_score_model(model):
+    if not hasattr(model, "predict"):
+        raise ValueError(f"Score model is a {type(model).__name__}, not a predictor")
+    _check_feature_count(model, SCORE_FEATURE_COUNT, "Score model")
+
+
+def _load_winner_model():
+    """Return the path loaded and (model, feature_columns, team_labels); team_labels is None for older models"""
+    print("🤖 Loading winner prediction model...")
+    try:
+        with open(WINNER_MODEL_PATH, "rb") as f:
+            model, feature_columns, team_labels = pickle.load(f)
+        path = WINNER_MODEL_PATH
+    except (ValueError, pickle.UnpicklingError) as e:
+        # Fallback for older model format or corrupted file
+        try:
+            with open(LEGACY_WINNER_MODEL_PATH, "rb") as f:
+                model, feature_columns = pickle.load(f)
+        except (FileNotFoundError, pickle.UnpicklingError):
+            raise e
+        team_labels = None
+        path = LEGACY_WINNER_MODEL_PATH
+    return path, (model, feature_columns, team_labels)
+
+
+def _validate_winner_model(loaded):
+    model, feature_columns, _ = loaded
+    if not hasattr(model, "predict_proba"):
+        raise ValueError(f"Winner model is a {type(model).__name__}, which has no predict_proba")
+    feature_columns = list(feature_columns)
+    if not feature_columns or len(set(feature_columns)) != len(feature_columns):
+        raise ValueError("Winner model feature list is empty or has duplicate columns")
+    _check_feature_count(model, len(feature_columns), "Winner model")
+    names = getattr(model, "feature_names_in_", None)
+    if names is not None and list(names) != feature_columns:
+        raise ValueError("Winner model was fitted on different features than its saved feature list")
+
+
+class RegisteredModel:
+    """A model artifact loaded once per process, validated, and reloaded when its file changes
+
+    A reload that fails keeps serving the model already loaded until the file
+    changes again; a first load that fails raises, like any other loader.
+    """
+
+    def __init__(self, name, paths, loader, validate):
+        self.name = name
+        self.paths = paths
+        self._loader = loader
+        self._validate = validate
+        self._flight = SingleFlight(name, self._load)
+        self._current = None
+        self.path = None
+        self.memory_mb = None
+        self.reloads = 0
+
+    def _load(self):
+        # Stamped before reading, so a write during the load triggers another reload
+        stamps = {path: file_stamp(path) for path in self.paths}
+        try:
+            path, value = self._loader()
+            self._validate(value)
+        except Exception as e:
+            if self._current is None:
+                raise
+            print(f"⚠️ Reload of {self.name} failed, keeping the loaded model: {str(e)}")
+            return self._current[0], stamps, self._current[2]
+        if self._current is not None:
+            self.reloads += 1
+        self.path = path
+        self.memory_mb = round(object_memory_bytes(value) / (1024 * 1024), 1)
+        self._current = (path, stamps, value)
+        print(f"🤖 Loaded {self.name} from {path} ({self.memory_mb} MB)")
+        return self._current
+
+    def _is_stale(self, loaded):
+        _, stamps, _ = loaded
+        return any(file_stamp(path) != stamp for path, stamp in stamps.items())
+
+    def get(self):
+        _, _, value = self._flight.get(is_stale=self._is_stale if MODEL_HOT_RELOAD else None)
+        return value
+
+    def status(self):
+        status = self._flight.status()
+        status.update(path=self.path, memory_mb=self.memory_mb, reloads=self.reloads)
+        return status
+
+
+# Process-wide registry: sessions (and the warm-up) share a single unpickled copy of each model
+MODEL_REGISTRY = {
+    "score model": RegisteredModel(
+        "score model", [SCORE_MODEL_PATH], _load_score_model, _validate_score_model
+    ),
+    "winner model": RegisteredModel(
+        "winner model", [WINNER_MODEL_PATH, LEGACY_WINNER_MODEL_PATH], _load_winner_model, _validate_winner_model
+    ),
+}
+
+
+def load_score_model():
+    """Load the first innings score model (lazy loading)"""
+    return MODEL_REGISTRY["score model"].get()
+
+
+def load_winner_model():
+    """Load the winner model as (model, feature_columns, team_labels) (lazy loading)"""
+    return MODEL_REGISTRY["winner model"].get()
+
+
+def load_state():
+    """Load state (idle/loading/ready/failed), timing, path, memory and reloads of each model"""
+    return [MODEL_REGISTRY["score model"].status(), MODEL_REGISTRY["winner model"].status()]
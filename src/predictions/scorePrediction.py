@@ -1,6 +1,7 @@
 import pickle
 import pandas as pd
 import streamlit as st
+from .modelLoading import load_score_model
 
 
 def app():
@@ -9,14 +10,18 @@ def app():
     <hr style="border-top: 3px solid #ffcd19;">
     ''', unsafe_allow_html=True)
 
-    # Load Saved Model - now uses decompressed model
+    # Load Saved Model - now uses decompressed model, shared with the warm-up
     try:
-        model = pickle.load(open('Model/predict_ipl_score_best_rf.pkl', 'rb'))
+        model = load_score_model()
     except (FileNotFoundError, pickle.UnpicklingError) as e:
         st.error(f"❌ Score prediction model not available")
         st.info("📦 The model is being downloaded and decompressed. This feature will be available once the process completes.")
         st.warning("⚡ Try other features like Winner Prediction, Team Analysis, or Player Analysis in the meantime!")
         return
+    except ValueError as e:
+        st.error(f"Error loading score prediction model: {str(e)}")
+        st.info("The model file does not match the inputs this page builds. Please retrain the model.")
+        return
 
     TEAMS = ['Chennai Super Kings', 'Delhi Capitals', 'Kings XI Punjab',
              'Kolkata Knight Riders', 'Mumbai Indians', 'Rajasthan Royals',
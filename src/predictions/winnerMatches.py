@@ -0,0 +1,47 @@
+from ..analysis.datasetPreprocessing import load_keyed_matches, matches_key
+from ..utils.singleFlight import SingleFlight
+
+# Teams the winner model predicts for
+WINNER_TEAMS = [
+    'Chennai Super Kings',
+    'Kolkata Knight Riders',
+    'Punjab Kings',
+    'Delhi Capitals',
+    'Rajasthan Royals',
+    'Sunrisers Hyderabad',
+    'Mumbai Indians',
+    'Royal Challengers Bengaluru',
+    'Lucknow Super Giants',
+    'Gujarat Titans'
+]
+
+# The shared loader names Punjab "Kings XI Punjab"; the model was trained on "Punjab Kings"
+MODEL_TEAM_NAMES = {'Kings XI Punjab': 'Punjab Kings'}
+
+# Matches columns the winner page's features are computed from
+WINNER_MATCH_COLUMNS = ['team1', 'team2', 'winner', 'result']
+
+
+def model_matches(matches):
+    """Matches as the winner model was trained on: decided matches between WINNER_TEAMS"""
+    view = matches[WINNER_MATCH_COLUMNS].copy()
+    for col in ['team1', 'team2', 'winner']:
+        view[col] = view[col].replace(MODEL_TEAM_NAMES)
+    view = view[(view['team1'].isin(WINNER_TEAMS)) & (view['team2'].isin(WINNER_TEAMS))]
+    view = view[view['winner'].isin(WINNER_TEAMS)]
+    view = view[~view['result'].isin(['tie', 'no result'])]
+    return view.reset_index(drop=True)
+
+
+def _load_winner_matches():
+    key, matches = load_keyed_matches()
+    return key, model_matches(matches)
+
+
+_winner_matches_flight = SingleFlight("winner matches", _load_winner_matches)
+
+
+def load_winner_matches():
+    """Model-ready matches view of the shared matches data, built once per matches data (lazy loading)"""
+    _, view = _winner_matches_flight.get(is_stale=lambda loaded: loaded[0] != matches_key())
+    return view
@@ -2,6 +2,8 @@ import pickle
 import pandas as pd
 import streamlit as st
 import numpy as np
+from .modelLoading import load_winner_model
+from .winnerMatches import WINNER_TEAMS as TEAMS, load_winner_matches
 
 
 def app():
@@ -10,19 +12,6 @@ def app():
     <hr style="border-top: 3px solid #700961;">
     ''', unsafe_allow_html=True)
 
-    TEAMS = [
-        'Chennai Super Kings',
-        'Kolkata Knight Riders', 
-        'Punjab Kings',
-        'Delhi Capitals',
-        'Rajasthan Royals',
-        'Sunrisers Hyderabad',
-        'Mumbai Indians',
-        'Royal Challengers Bengaluru',
-        'Lucknow Super Giants',
-        'Gujarat Titans'
-    ]
-
     VENUES = [
         'M Chinnaswamy Stadium',
         'Punjab Cricket Association Stadium, Mohali',
@@ -84,48 +73,23 @@ def app():
         'Dr. Y.S. Rajasekhara Reddy ACA-VDCA Cricket Stadium, Visakhapatnam'
     ]
 
-    # Load historical data for calculating head-to-head and bat/bowl first stats
+    # Historical matches for the head-to-head and bat/bowl first stats, prepared once from the shared loader
     try:
-        matches_df = pd.read_csv('Datasets/matches_2008-2024.csv')
-        
-        # Apply same preprocessing as training
-        team_name_map = {
-            'Delhi Daredevils': 'Delhi Capitals',
-            'Deccan Chargers': 'Sunrisers Hyderabad',
-            'Kings XI Punjab': 'Punjab Kings',
-            'Rising Pune Supergiants': 'Rising Pune Supergiant',
-            'Royal Challengers Bangalore': 'Royal Challengers Bengaluru',
-        }
-        for col in ['team1', 'team2', 'toss_winner', 'winner']:
-            matches_df[col] = matches_df[col].replace(team_name_map)
-        
-        matches_df = matches_df[(matches_df['team1'].isin(TEAMS)) & (matches_df['team2'].isin(TEAMS))]
-        matches_df = matches_df[matches_df['winner'].isin(TEAMS)]
-        matches_df = matches_df.dropna(subset=['winner'])
-        matches_df = matches_df[matches_df['result'] != 'tie']
-        matches_df = matches_df[matches_df['result'] != 'no result']
-        
+        matches_df = load_winner_matches()
     except FileNotFoundError:
         st.error("Datasets/matches_2008-2024.csv not found!")
         return
 
     # Load Saved Model
     try:
-        with open('Model/winner_prediction_model.pkl', 'rb') as f:
-            model, feature_columns, team_labels = pickle.load(f)
+        model, feature_columns, team_labels = load_winner_model()
     except FileNotFoundError:
         st.error("Winner prediction model not found! Please train the model first by running winner_model_train.py")
         return
     except (ValueError, pickle.UnpicklingError) as e:
-        # Fallback for older model format or corrupted file
-        try:
-            with open('winner_prediction_model.pkl', 'rb') as f:
-                model, feature_columns = pickle.load(f)
-            team_labels = None
-        except (FileNotFoundError, pickle.UnpicklingError):
-            st.error(f"Error loading winner prediction model: {str(e)}")
-            st.info("The model file may be corrupted or incompatible. Please retrain the model.")
-            return
+        st.error(f"Error loading winner prediction model: {str(e)}")
+        st.info("The model file may be corrupted or incompatible. Please retrain the model.")
+        return
 
     # Home ground mapping
     team_home_venues = {
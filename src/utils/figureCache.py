@@ -0,0 +1,94 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+import matplotlib.pyplot as plt
+
+# Size cap of the rendered charts kept in memory, in megabytes
+FIGURE_CACHE_MB = float(os.getenv("IPL_FIGURE_CACHE_MB", "64"))
+
+
+def figure_png(fig, transparent=True, dpi=200):
+    """Render a matplotlib figure to PNG bytes the way st.pyplot does, then free it"""
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", transparent=transparent)
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+class FigureCache:
+    """Rendered matplotlib charts as PNG bytes, shared by every session of the process.
+
+    A chart is keyed by its kind, its parameters and the fingerprint of the
+    data it is drawn from. The least recently shown charts are dropped once
+    the PNGs kept exceed max_bytes. Drawing goes through one lock, as pyplot's
+    current figure is global to the process.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._pngs = OrderedDict()
+        self._lock = threading.Lock()
+        self._draw_lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            png = self._pngs.get(key)
+            if png is not None:
+                self.hits += 1
+                self._pngs.move_to_end(key)
+            return png
+
+    def _put(self, key, png):
+        with self._lock:
+            if key in self._pngs:
+                return
+            self._pngs[key] = png
+            self.size += len(png)
+            while self.size > self.max_bytes and len(self._pngs) > 1:
+                _, dropped = self._pngs.popitem(last=False)
+                self.size -= len(dropped)
+
+    def render(self, kind, params, fingerprint, draw, transparent=True):
+        """PNG bytes of the chart drawn by draw(), which returns its figure
+
+        draw() is only called when the chart is not cached. Figures it leaves
+        open, including after an error, are closed.
+        """
+        key = (kind, params, fingerprint)
+        png = self._get(key)
+        if png is not None:
+            return png
+        with self._draw_lock:
+            # Another session may have drawn it while this one waited
+            png = self._get(key)
+            if png is not None:
+                return png
+            with self._lock:
+                self.misses += 1
+            opened = set(plt.get_fignums())
+            try:
+                png = figure_png(draw(), transparent=transparent)
+            finally:
+                for num in set(plt.get_fignums()) - opened:
+                    plt.close(num)
+        self._put(key, png)
+        return png
+
+    def clear(self):
+        with self._lock:
+            self._pngs.clear()
+            self.size = 0
+
+
+figure_cache = FigureCache(int(FIGURE_CACHE_MB * 1024 * 1024))
+
+
+def cached_figure(kind, params, fingerprint, draw, transparent=True):
+    """PNG bytes of a chart from the shared figure cache, drawn on a miss"""
+    return figure_cache.render(kind, params, fingerprint, draw, transparent=transparent)
@@ -0,0 +1,159 @@
+import os
+import json
+import pickle
+import shutil
+import threading
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+import streamlit as st
+from matplotlib.figure import Figure
+from .figureCache import figure_png
+
+# Results are stored pickled, which only reliably load under the pandas and numpy that wrote them
+ARTIFACT_LIBRARIES = f"pandas{pd.__version__}-numpy{np.__version__}"
+
+
+class LazySections:
+    """Page sections that compute and render only while their expander is open.
+
+    Each section is a compute function, an optional figures function and a
+    render function. The computed result and figures are kept per section and
+    reused until the data fingerprint changes, so reruns (like ticking "View
+    Code") render from memory. An open section renders inside a fragment, so
+    its widgets rerun that section alone.
+
+    With an artifact_dir, results and figures prebuilt by build_artifacts()
+    for the same fingerprint and pandas/numpy versions are loaded instead of
+    computed.
+    """
+
+    def __init__(self, name, artifact_dir=None):
+        self.name = name
+        self.artifact_dir = artifact_dir
+        self._sections = []
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def section(self, title, compute, figures=None):
+        """Register the decorated render(result, figures) function under an expander title
+
+        figures(result) returns the section's charts by name: plotly figures
+        are kept as they are, matplotlib figures as PNG bytes.
+        """
+        def register(render):
+            self._sections.append((title, compute, figures, render))
+            return render
+        return register
+
+    def _build(self, compute, figures):
+        result = compute()
+        charts = {}
+        if figures is not None:
+            for name, fig in figures(result).items():
+                charts[name] = figure_png(fig) if isinstance(fig, Figure) else fig
+        return result, charts
+
+    def result(self, i, fingerprint):
+        """(result, figures) of the i-th section, built again when the fingerprint changes"""
+        cached = self._results.get(i)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        with self._lock:
+            cached = self._results.get(i)
+            if cached is None or cached[0] != fingerprint:
+                title, compute, figures, _ = self._sections[i]
+                built = self._load_artifact(i, fingerprint)
+                if built is None:
+                    built = self._build(compute, figures)
+                cached = (fingerprint, built)
+                self._results[i] = cached
+        return cached[1]
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def _artifact_path(self, fingerprint):
+        return os.path.join(self.artifact_dir, f"{self.name}-{fingerprint}-{ARTIFACT_LIBRARIES}")
+
+    def build_artifacts(self, fingerprint):
+        """Compute every section and write its result and figures to the artifact directory"""
+        target = self._artifact_path(fingerprint)
+        tmp = f"{target}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        for i, (title, compute, figures, _) in enumerate(self._sections):
+            result, charts = self._build(compute, figures)
+            section_dir = os.path.join(tmp, str(i))
+            os.makedirs(section_dir)
+            with open(os.path.join(section_dir, "result.pkl"), "wb") as f:
+                pickle.dump(result, f)
+            manifest = []
+            for j, (name, chart) in enumerate(charts.items()):
+                if isinstance(chart, bytes):
+                    file_name = f"{j}.png"
+                    with open(os.path.join(section_dir, file_name), "wb") as f:
+                        f.write(chart)
+                else:
+                    file_name = f"{j}.json"
+                    with open(os.path.join(section_dir, file_name), "w") as f:
+                        f.write(chart.to_json())
+                manifest.append([name, file_name])
+            with open(os.path.join(section_dir, "figures.json"), "w") as f:
+                json.dump(manifest, f)
+            print(f"🖼️ Built {title.lstrip('👉 ')} ({len(charts)} figures)")
+        # Replace the previous artifacts of this page, whatever data they were built for
+        prefix = f"{self.name}-"
+        for entry in os.listdir(self.artifact_dir):
+            if entry.startswith(prefix) and ".tmp-" not in entry:
+                shutil.rmtree(os.path.join(self.artifact_dir, entry), ignore_errors=True)
+        os.replace(tmp, target)
+        print(f"💾 Saved {len(self._sections)} {self.name} sections at {target}")
+        return target
+
+    def _load_artifact(self, i, fingerprint):
+        if self.artifact_dir is None:
+            return None
+        section_dir = os.path.join(self._artifact_path(fingerprint), str(i))
+        try:
+            with open(os.path.join(section_dir, "figures.json")) as f:
+                manifest = json.load(f)
+            with open(os.path.join(section_dir, "result.pkl"), "rb") as f:
+                result = pickle.load(f)
+            charts = {}
+            for name, file_name in manifest:
+                path = os.path.join(section_dir, file_name)
+                if file_name.endswith(".png"):
+                    with open(path, "rb") as f:
+                        charts[name] = f.read()
+                else:
+                    with open(path) as f:
+                        charts[name] = pio.from_json(f.read())
+        except (OSError, ValueError, AttributeError, ImportError, pickle.UnpicklingError):
+            return None
+        return result, charts
+
+    def _expander(self, title, key):
+        """Expander of a section and whether it is open"""
+        try:
+            expander = st.expander(title, key=key, on_change="rerun")
+            return expander, expander.open
+        except TypeError:
+            # Streamlit versions without expander state: an explicit toggle decides
+            expander = st.expander(title)
+            with expander:
+                is_open = st.toggle("Show", key=key)
+            return expander, is_open
+
+    def render(self, fingerprint):
+        """Render every section, computing only the open ones"""
+        fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+        for i, (title, _, _, render) in enumerate(self._sections):
+            expander, is_open = self._expander(title, f"{self.name}-section-{i}")
+            if not is_open:
+                continue
+            with expander:
+                show = (lambda built, render=render: render(*built))
+                if fragment is not None:
+                    show = fragment(show)
+                show(self.result(i, fingerprint))
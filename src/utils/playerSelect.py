@@ -0,0 +1,18 @@
+import streamlit as st
+from ..analysis.playerDirectory import load_player_directory
+
+
+def player_selectbox(label, search_label, roles=("batter", "bowler")):
+    """Search box plus a selectbox holding one page of matching players
+
+    Only the best matches of the search are sent to the browser, so the
+    options stay small however many players the data holds.
+    """
+    query = st.text_input(search_label, placeholder="Type part of a name")
+    players, total = load_player_directory().search(query, roles)
+    player = st.selectbox(label, players)
+    if total > len(players):
+        st.caption(f"Top {len(players)} of {total} players by balls played, search to narrow the list")
+    elif not players:
+        st.caption(f"No player matches '{query.strip()}'")
+    return player
@@ -0,0 +1,94 @@
+import time
+import threading
+
+IDLE = "idle"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class SingleFlight:
+    """Run a loader once and share its result with every thread that asks for it.
+
+    Threads arriving while a load is in flight wait for that load instead of
+    starting their own. A failed load is reported to the threads that waited
+    on it and retried by the next caller.
+    """
+
+    def __init__(self, name, loader):
+        self.name = name
+        self._loader = loader
+        # Held for a whole load, so only one thread runs the loader
+        self._lock = threading.Lock()
+        # Guards the state and everything published with it, so readers see one consistent snapshot
+        self._status_lock = threading.Lock()
+        self._value = None
+        self._error = None
+        # Loads finished so far, so a waiter can tell the load it waited on has failed
+        self._flights = 0
+        self.state = IDLE
+        self.started_at = None
+        self.finished_at = None
+
+    def _snapshot(self):
+        with self._status_lock:
+            return self.state, self._value, self._error, self._flights
+
+    def get(self, is_stale=None):
+        """Return the loaded value, loading it again when is_stale(value) says it is not enough"""
+        state, value, _, flights_seen = self._snapshot()
+        if state == READY and not (is_stale and is_stale(value)):
+            return value
+
+        with self._lock:
+            state, value, error, flights = self._snapshot()
+            if state == READY and not (is_stale and is_stale(value)):
+                return value
+            if state == FAILED and flights != flights_seen:
+                raise error
+            return self._run()
+
+    def _publish(self, state, started_at, finished_at, value=None, error=None):
+        with self._status_lock:
+            self.state = state
+            self.started_at = started_at
+            self.finished_at = finished_at
+            self._value = value
+            self._error = error
+            if state in (READY, FAILED):
+                self._flights += 1
+
+    def _run(self):
+        started_at = time.time()
+        self._publish(LOADING, started_at, None)
+        try:
+            value = self._loader()
+        except Exception as e:
+            self._publish(FAILED, started_at, time.time(), error=e)
+            raise
+        self._publish(READY, started_at, time.time(), value=value)
+        return value
+
+    def peek(self):
+        """Return the loaded value without triggering a load"""
+        state, value, _, _ = self._snapshot()
+        return value if state == READY else None
+
+    def reset(self):
+        """Drop the loaded value so the next get() loads again"""
+        with self._lock:
+            self._publish(IDLE, None, None)
+
+    def status(self):
+        with self._status_lock:
+            state, started_at, finished_at, error = self.state, self.started_at, self.finished_at, self._error
+        if started_at is None:
+            seconds = None
+        else:
+            seconds = (finished_at or time.time()) - started_at
+        return {
+            "name": self.name,
+            "state": state,
+            "seconds": None if seconds is None else round(seconds, 3),
+            "error": None if error is None else str(error),
+        }
@@ -0,0 +1,49 @@
+import os
+import time
+import threading
+
+# Set IPL_WARM_UP=0 to load datasets and models only when a page first needs them
+WARM_UP_ENABLED = os.getenv("IPL_WARM_UP", "1") == "1"
+
+_warm_up_thread = None
+_warm_up_lock = threading.Lock()
+_timings = {}
+
+
+def _run_tasks(tasks):
+    started = time.time()
+    for name, load in tasks:
+        task_started = time.time()
+        try:
+            load()
+        except Exception as e:
+            # The page asking for it later retries the load and reports the error
+            _timings[name] = None
+            print(f"⚠️ Warm-up of {name} failed after {time.time() - task_started:.2f}s: {str(e)}")
+            continue
+        _timings[name] = round(time.time() - task_started, 3)
+        print(f"🔥 Warmed up {name} in {_timings[name]:.2f}s")
+    print(f"🔥 Warm-up finished in {time.time() - started:.2f}s")
+
+
+def start_warm_up(tasks):
+    """Run the (name, loader) tasks once per process on a background thread
+
+    Loaders should be single-flight, so a page asking for an artifact that is
+    still warming up waits for that load instead of starting its own.
+    """
+    global _warm_up_thread
+    if not WARM_UP_ENABLED:
+        return None
+    with _warm_up_lock:
+        if _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(
+                target=_run_tasks, args=(list(tasks),), name="ipl-warm-up", daemon=True
+            )
+            _warm_up_thread.start()
+    return _warm_up_thread
+
+
+def warm_up_timings():
+    """Seconds each warmed-up artifact took to load (None when it failed)"""
+    return dict(_timings)
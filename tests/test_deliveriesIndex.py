@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.analysis.datasetPreprocessing import compact_deliveries
+from src.analysis.deliveriesIndex import (
+    PLAYER_ROLES,
+    MatchIndex,
+    MatchupIndex,
+    PlayerIndex,
+    build_match_index,
+    build_matchup_index,
+    build_player_index,
+    group_rows,
+)
+
+
+@pytest.fixture(params=["object", "compact"])
+def deliveries(request):
+    """Two matches with their balls out of file order, as loaded and in compact form"""
+    frame = pd.DataFrame({
+        "match_id": [7, 3, 3, 7, 3, 7, 3, 3, 7],
+        "inning": [2, 1, 2, 1, 1, 1, 2, 1, 2],
+        "over": [0, 1, 0, 0, 0, 0, 0, 0, 0],
+        "ball": [1, 1, 2, 2, 2, 1, 1, 1, 2],
+        "batter": ["A", "B", "C", "D", None, "D", "C", "B", "A"],
+        "bowler": ["E", "F", "G", "H", "F", "H", "G", "F", "E"],
+        "non_striker": ["B", "A", "D", "C", "A", "C", "D", "A", "B"],
+        "player_dismissed": [None, None, "C", None, None, None, None, "B", None],
+        "batsman_runs": [1, 4, 0, 6, 1, 2, 0, 1, 0],
+    })
+    return compact_deliveries(frame, report=False) if request.param == "compact" else frame
+
+
+def test_group_rows_keeps_row_order_and_drops_missing():
+    codes = np.array([2, -1, 0, 2, 0, -1, 5])
+    order, groups, offsets = group_rows(codes)
+    assert groups.tolist() == [0, 2, 5]
+    grouped = [order[start:stop].tolist() for start, stop in zip(offsets[:-1], offsets[1:])]
+    assert grouped == [[2, 4], [0, 3], [6]]
+
+
+def test_match_index_takes_each_innings_in_ball_order(deliveries):
+    index = MatchIndex(build_match_index(deliveries))
+    assert index.match_ids() == [3, 7]
+    for (match_id, inning), _ in deliveries.groupby(["match_id", "inning"]):
+        # The page's former filters, ordered by over and ball
+        expected = deliveries[(deliveries["match_id"] == match_id) & (deliveries["inning"] == inning)]
+        expected = expected.sort_values(["over", "ball"], kind="stable")
+        assert index.take(deliveries, match_id, inning).index.tolist() == expected.index.tolist()
+    assert index.take(deliveries, 3).index.tolist() == [7, 4, 1, 6, 2]
+    assert index.take(deliveries, 12345, 1).empty
+
+
+def test_player_index_matches_role_filters(deliveries):
+    index = PlayerIndex(build_player_index(deliveries))
+    assert index.players == ["A", "B", "C", "D", "E", "F", "G", "H"]
+    for player in index.players:
+        for role in PLAYER_ROLES:
+            # The page's former filter of every delivery
+            expected = deliveries[deliveries[role] == player]
+            assert index.take(deliveries, player, role).index.tolist() == expected.index.tolist()
+            assert index.count(player, role) == len(expected)
+    assert index.take(deliveries, "Nobody", "batter").empty
+    assert index.count("Nobody", "batter") == 0
+    assert index.directory(("bowler",)) == ["E", "F", "G", "H"]
+    assert index.directory(("player_dismissed",)) == ["B", "C"]
+
+
+def _pair_filter(deliveries, batter, bowler):
+    """The Batter v/s Bowler page's former filter, ignoring case and surrounding spaces"""
+    return deliveries[
+        (deliveries["batter"].astype(str).str.strip().str.lower() == batter.strip().lower())
+        & (deliveries["bowler"].astype(str).str.strip().str.lower() == bowler.strip().lower())
+    ]
+
+
+def test_matchup_index_matches_pair_filters(deliveries):
+    index = MatchupIndex(build_matchup_index(deliveries))
+    for batter in ["A", "B", "C", "D"]:
+        for bowler in ["E", "F", "G", "H"]:
+            expected = _pair_filter(deliveries, batter, bowler)
+            assert index.take(deliveries, batter, bowler).index.tolist() == expected.index.tolist()
+    assert index.rows("A", "Nobody").size == 0
+
+
+def test_matchup_index_ignores_case_and_spaces():
+    deliveries = pd.DataFrame({
+        "batter": ["Player A", " player a", "Player B"],
+        "bowler": ["Player C", "PLAYER C ", "Player C"],
+    })
+    index = MatchupIndex(build_matchup_index(deliveries))
+    assert index.rows("player a", "player c").tolist() == [0, 1]
+    assert index.rows(" PLAYER B", "player c").tolist() == [2]
+    assert index.bowlers_of(index.batter_pairs("Player B")).tolist() == ["PLAYER C"]
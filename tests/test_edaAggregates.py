@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.analysis.datasetPreprocessing import compact_deliveries
+from src.analysis.edaAggregates import EDA_STATISTICS, Statistic, aggregate, top_venue_wins
+
+
+@pytest.fixture(params=["object", "compact"])
+def deliveries(request):
+    """A dozen balls of first, middle and last overs with a missing batter, as loaded and in compact form"""
+    frame = pd.DataFrame({
+        "match_id": [5, 5, 5, 5, 5, 5, 8, 8, 8, 8, 8, 8],
+        "inning": [1, 1, 1, 2, 2, 2, 1, 1, 2, 2, 2, 2],
+        "batting_team": ["Kings", "Kings", "Kings", "Royals", "Royals", "Royals",
+                         "Titans", "Titans", "Kings", "Kings", "Kings", "Kings"],
+        "bowling_team": ["Royals", "Royals", "Royals", "Kings", "Kings", "Kings",
+                         "Kings", "Kings", "Titans", "Titans", "Titans", "Titans"],
+        "over": [0, 0, 19, 0, 7, 19, 0, 19, 0, 0, 7, 19],
+        "batter": ["A", "B", "A", "C", None, "C", "D", "D", "B", "A", "A", "B"],
+        "bowler": ["E", "E", "F", "G", "G", "H", "E", "F", "H", "H", "G", "H"],
+        "batsman_runs": [1, 4, 6, 0, 2, 1, 4, 0, 1, 6, 0, 2],
+        "total_runs": [1, 5, 6, 0, 2, 1, 4, 1, 1, 6, 0, 3],
+    })
+    return compact_deliveries(frame, report=False) if request.param == "compact" else frame
+
+
+def _groupby(frame, stat):
+    """The pandas groupby a statistic replaces"""
+    if stat.where is not None:
+        col, wanted = stat.where
+        frame = frame[frame[col] == wanted]
+    grouped = frame.groupby(stat.group_by, observed=True)
+    if stat.reduction == "count":
+        return grouped.size()
+    return grouped[stat.value].agg(stat.reduction)
+
+
+def _assert_same_groups(result, expected):
+    """Same groups in the same order with the same values (categorical labels compare as values)"""
+    assert result.index.tolist() == expected.index.tolist()
+    np.testing.assert_allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+
+@pytest.mark.parametrize("name", list(EDA_STATISTICS))
+def test_eda_statistics_match_groupby(deliveries, name):
+    stat = EDA_STATISTICS[name]
+    _assert_same_groups(aggregate(deliveries, {name: stat})[name], _groupby(deliveries, stat))
+
+
+def test_count_and_missing_group_values(deliveries):
+    stat = Statistic(["batter", "over"], "total_runs", "count", None)
+    result = aggregate(deliveries, {"balls": stat})["balls"]
+    _assert_same_groups(result, _groupby(deliveries, stat))
+    # The ball without a batter is left out, like groupby's dropna
+    assert result.sum() == len(deliveries) - 1
+
+
+def test_unknown_reduction_is_rejected(deliveries):
+    with pytest.raises(ValueError):
+        aggregate(deliveries, {"bad": Statistic(["batter"], "total_runs", "median", None)})
+
+
+def test_sparse_group_space_matches_groupby():
+    # Three keys of 200 distinct values each give far more possible groups than rows,
+    # so the groups are found with np.unique instead of a slot per possible group
+    rows = np.arange(200)
+    frame = pd.DataFrame({"a": rows, "b": rows * 7 % 200, "c": rows * 13 % 200, "runs": rows % 7})
+    stat = Statistic(["c", "a", "b"], "runs", "sum", None)
+    _assert_same_groups(aggregate(frame, {"runs": stat})["runs"], _groupby(frame, stat))
+
+
+def test_top_venue_wins_counts_each_team_in_team1_order():
+    matches = pd.DataFrame({
+        "team1": ["Kings", "Royals", "Kings", "Titans", "Royals", "Kings", "Royals"],
+        "winner": ["Kings", "Kings", None, "Titans", "Kings", "Royals", "Kings"],
+        "venue": ["Eden", "Wankhede", "Eden", "Chepauk", "Chepauk", "Eden", "Eden"],
+    })
+    wins = dict(top_venue_wins(matches, n=2))
+    assert list(wins) == ["Kings", "Royals", "Titans"]
+    # The page's former value_counts per team, whose order among ties is not fixed
+    for team, venues in wins.items():
+        counts = matches[matches["winner"] == team]["venue"].value_counts()
+        assert venues.tolist() == counts[:2].tolist()
+        assert all(counts[venue] == count for venue, count in venues.items())
+    # Wankhede and Chepauk tie for Kings, so the venue of the first win goes first
+    assert wins["Kings"].index.tolist() == ["Eden", "Wankhede"]
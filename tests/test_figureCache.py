@@ -0,0 +1,66 @@
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import pytest
+from src.utils.figureCache import FigureCache
+
+
+def _draw(calls):
+    def draw():
+        calls.append(1)
+        fig, ax = plt.subplots(figsize=(1, 1))
+        ax.plot([0, 1], [0, len(calls)])
+        return fig
+    return draw
+
+
+def test_render_draws_once_per_key():
+    cache = FigureCache(1 << 30)
+    calls = []
+    png = cache.render("line", (1,), "data", _draw(calls))
+    assert png.startswith(b"\x89PNG")
+    assert cache.render("line", (1,), "data", _draw(calls)) == png
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Another fingerprint is other data, so it is drawn again
+    cache.render("line", (1,), "other data", _draw(calls))
+    assert len(calls) == 2
+    assert plt.get_fignums() == []
+
+
+def test_least_recently_shown_chart_is_dropped():
+    calls = []
+    first = FigureCache(1 << 30).render("line", (0,), "data", _draw([]))
+    cache = FigureCache(int(len(first) * 2.5))
+    for params in [(0,), (1,), (0,), (2,)]:
+        cache.render("line", params, "data", _draw(calls))
+    assert len(calls) == 3
+    assert cache.size <= cache.max_bytes
+    # (1,) was shown least recently, so it went first
+    cache.render("line", (0,), "data", _draw(calls))
+    assert len(calls) == 3
+    cache.render("line", (1,), "data", _draw(calls))
+    assert len(calls) == 4
+
+
+def test_figures_are_closed_when_drawing_fails():
+    cache = FigureCache(1 << 30)
+
+    def draw():
+        plt.subplots()
+        raise ValueError("bad data")
+
+    with pytest.raises(ValueError):
+        cache.render("line", (), "data", draw)
+    assert plt.get_fignums() == []
+
+
+def test_clear_drops_every_chart():
+    cache = FigureCache(1 << 30)
+    calls = []
+    cache.render("line", (), "data", _draw(calls))
+    cache.clear()
+    assert cache.size == 0
+    cache.render("line", (), "data", _draw(calls))
+    assert len(calls) == 2
@@ -0,0 +1,82 @@
+import pandas as pd
+from src.analysis.matchCalendar import MatchCalendar
+
+
+def _matches():
+    """Two seasons, with two matches of one pair on the same day and a rematch listed the other way round"""
+    return pd.DataFrame({
+        "id": [21, 22, 23, 24, 25, 26],
+        "season": [2019, 2019, 2019, 2019, 2020, 2020],
+        "team1": ["Kings", "Royals", "Kings", "Titans", "Royals", "Kings"],
+        "team2": ["Royals", "Kings", "Titans", "Royals", "Kings", "Royals"],
+        "date": pd.to_datetime([
+            "2019-04-01", "2019-04-01", "2019-04-03", "2019-04-05", "2020-05-02", "2020-05-09",
+        ]),
+    })
+
+
+def _pair_matches(matches, season, team1, team2):
+    """The Match Scorecard page's former filters"""
+    season_matches = matches[matches["season"] == season]
+    return season_matches[
+        ((season_matches["team1"] == team1) & (season_matches["team2"] == team2))
+        | ((season_matches["team1"] == team2) & (season_matches["team2"] == team1))
+    ]
+
+
+def test_calendar_matches_filters():
+    matches = _matches()
+    calendar = MatchCalendar(matches)
+    assert calendar.seasons() == [2019, 2020]
+    assert calendar.teams(2019) == ["Kings", "Royals", "Titans"]
+    for season in calendar.seasons():
+        for team1 in calendar.teams(season):
+            for team2 in calendar.teams(season):
+                if team1 == team2:
+                    continue
+                expected = _pair_matches(matches, season, team1, team2)
+                dates = expected["date"].astype(str).unique().tolist()
+                assert calendar.dates(season, team1, team2) == dates
+                for date in dates:
+                    first = expected[expected["date"].astype(str) == date].iloc[0]
+                    assert matches.iloc[calendar.match_row(season, team1, team2, date)]["id"] == first["id"]
+
+
+def test_same_day_matches_pick_the_first():
+    calendar = MatchCalendar(_matches())
+    assert calendar.dates(2019, "Royals", "Kings") == ["2019-04-01"]
+    assert calendar.match_row(2019, "Royals", "Kings", "2019-04-01") == 0
+    assert [match_id for _, match_id, _ in calendar.pair_matches(2019, "Kings", "Royals")] == [21, 22]
+
+
+def test_team_matches_in_matches_order():
+    calendar = MatchCalendar(_matches())
+    assert [match_id for _, match_id, _ in calendar.team_matches(2019, "Royals")] == [21, 22, 24]
+    assert calendar.team_matches(2020, "Titans") == []
+
+
+def test_calendar_handles_missing_selections():
+    calendar = MatchCalendar(_matches())
+    assert calendar.dates(2019, "Kings", None) == []
+    assert calendar.match_row(2019, "Unknown XI", "Kings", "2019-04-01") is None
+    assert calendar.match_row(2019, "Kings", "Titans", "2019-04-01") is None
+    assert calendar.teams(1999) == []
+
+
+def test_calendar_follows_a_changed_matches_file(tmp_path, monkeypatch):
+    from src.analysis import datasetCache, datasetPreprocessing, matchCalendar
+    csv_path = tmp_path / "matches.csv"
+    monkeypatch.setattr(datasetPreprocessing, "MATCHES_CSV", str(csv_path))
+    monkeypatch.setattr(datasetPreprocessing, "ensure_large_files_exist", lambda: None)
+    monkeypatch.setattr(datasetCache, "CACHE_DIR", str(tmp_path / "cache"))
+    datasetPreprocessing._matches_flight.reset()
+    matchCalendar._match_calendar_flight.reset()
+
+    _matches().iloc[:4].to_csv(csv_path, index=False)
+    assert matchCalendar.load_match_calendar().seasons() == [2019]
+    _matches().to_csv(csv_path, index=False)
+    assert matchCalendar.load_match_calendar().seasons() == [2019, 2020]
+    assert datasetPreprocessing.load_matches_data()["id"].tolist() == [21, 22, 23, 24, 25, 26]
+
+    datasetPreprocessing._matches_flight.reset()
+    matchCalendar._match_calendar_flight.reset()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from src.analysis.datasetPreprocessing import compact_deliveries
+from src.analysis.overRates import OverRates, build_over_rates
+
+
+@pytest.fixture
+def matches():
+    return pd.DataFrame({"id": [1, 2, 3], "season": [2019, 2020, 2021]})
+
+
+@pytest.fixture(params=["object", "compact"])
+def deliveries(request):
+    """Balls of three seasons and two innings, plus a ball of a match missing from matches"""
+    frame = pd.DataFrame({
+        "match_id": [1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 9],
+        "inning": [1, 1, 2, 2, 1, 2, 2, 1, 1, 2, 2, 1],
+        "batting_team": ["Kings", "Kings", "Royals", "Royals", "Titans", "Kings", "Kings",
+                         "Royals", "Royals", "Kings", "Kings", "Titans"],
+        "over": [0, 5, 0, 19, 5, 0, 5, 0, 0, 5, 19, 0],
+        "total_runs": [4, 1, 0, 6, 2, 1, 3, 1, 2, 6, 1, 4],
+    })
+    return compact_deliveries(frame, report=False) if request.param == "compact" else frame
+
+
+def _run_rates(deliveries):
+    """The heatmap's former pivot: mean runs per ball of each team and over, times six"""
+    deliveries = deliveries.assign(batting_team=np.asarray(deliveries["batting_team"], dtype=object))
+    return deliveries.pivot_table(
+        index="batting_team", columns="over", values="total_runs", aggfunc="mean"
+    ).astype(float) * 6
+
+
+def _assert_same_rates(result, expected):
+    pdt.assert_frame_equal(
+        result, expected, check_names=False, check_column_type=False, check_index_type=False
+    )
+
+
+def test_matrix_matches_pivot_table(matches, deliveries):
+    rates = OverRates(build_over_rates(matches, deliveries))
+    _assert_same_rates(rates.matrix(), _run_rates(deliveries))
+
+
+def test_matrix_filters_seasons_and_innings(matches, deliveries):
+    rates = OverRates(build_over_rates(matches, deliveries))
+    merged = matches.merge(deliveries, left_on="id", right_on="match_id")
+    selected = merged[merged["season"].between(2020, 2021) & (merged["inning"] == 2)]
+    _assert_same_rates(rates.matrix(seasons=(2020, 2021), innings=[2]), _run_rates(selected))
+
+
+def test_matrix_adds_requested_overs_as_nan(matches, deliveries):
+    matrix = OverRates(build_over_rates(matches, deliveries)).matrix(include_overs=range(0, 20))
+    assert matrix.columns.tolist() == list(range(0, 20))
+    assert matrix[10].isna().all()
+
+
+def test_team_profile_matches_groupby(matches, deliveries):
+    rates = OverRates(build_over_rates(matches, deliveries))
+    for team in ["Kings", "Royals", "Titans"]:
+        # Team Analysis's former over profile
+        expected = deliveries[deliveries["batting_team"] == team].groupby("over")["total_runs"].mean() * 6
+        profile = rates.team_profile(team)
+        assert profile.index.tolist() == expected.index.tolist()
+        np.testing.assert_allclose(profile.to_numpy(), expected.to_numpy())
+    assert rates.team_profile("Unknown XI").empty
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.analysis.datasetPreprocessing import compact_deliveries
+from src.analysis.deliveriesIndex import MatchIndex, build_match_index
+from src.analysis.scorecards import Scorecards, build_scorecards, overs_notation
+
+
+@pytest.fixture(params=["object", "compact"])
+def deliveries(request):
+    """Two innings of one match, out of ball order, with wides, a no-ball and two dismissals"""
+    frame = pd.DataFrame({
+        "match_id": [4] * 14,
+        "inning": [1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2],
+        "over": [0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0],
+        "ball": [2, 1, 3, 4, 5, 6, 1, 7, 1, 2, 3, 4, 5, 6],
+        "batter": ["B", "A", "A", "A", "C", "C", "C", "C", "D", "D", "E", "E", "E", "D"],
+        "bowler": ["X", "X", "X", "X", "X", "X", "Z", "X", "A", "A", "A", "B", "A", "A"],
+        "batsman_runs": [1, 4, 0, 0, 2, 0, 6, 1, 0, 0, 1, 4, 0, 2],
+        "total_runs": [1, 4, 0, 1, 2, 0, 6, 1, 1, 0, 1, 5, 0, 2],
+        "extras_type": [None, None, None, "wides", None, None, None, None,
+                        "wides", None, None, "noballs", None, None],
+        "is_wicket": [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0],
+        "player_dismissed": [None, None, "A", None, None, None, None, None,
+                             None, None, None, None, "E", None],
+        "dismissal_kind": [None, None, "bowled", None, None, None, None, None,
+                           None, None, None, None, "caught", None],
+    })
+    return compact_deliveries(frame, report=False) if request.param == "compact" else frame
+
+
+def _batting(innings):
+    """The Match Scorecard page's former batting groupby"""
+    batting = innings.groupby("batter", sort=False, observed=True).agg(
+        Runs=("batsman_runs", "sum"), Balls=("batsman_runs", "count")
+    ).reset_index()
+    dismissals = innings[innings["player_dismissed"].notna()][["player_dismissed", "dismissal_kind"]]
+    dismissals.columns = ["batter", "Dismissal"]
+    batting = batting.astype({"batter": str}).merge(dismissals.astype({"batter": str}), on="batter", how="left")
+    batting["Dismissal"] = batting["Dismissal"].astype(object).fillna("Not Out")
+    return batting
+
+
+def test_overs_notation():
+    assert [overs_notation(balls) for balls in (0, 5, 6, 22, 24)] == ["0", "0.5", "1", "3.4", "4"]
+
+
+def test_scorecard_matches_innings_groupbys(deliveries):
+    cards = Scorecards(build_scorecards(deliveries)).match(4)
+    index = MatchIndex(build_match_index(deliveries))
+    assert list(cards) == [1, 2]
+    for inning, card in cards.items():
+        innings = index.take(deliveries, 4, inning)
+        expected = _batting(innings)
+        for col in ["batter", "Runs", "Balls", "Dismissal"]:
+            assert card.batting[col].tolist() == expected[col].tolist()
+
+        legal = ~innings["extras_type"].isin(["wides", "noballs"])
+        bowling = innings.assign(legal=legal).groupby("bowler", observed=True).agg(
+            balls=("legal", "sum"), runs=("total_runs", "sum"), wickets=("is_wicket", "sum")
+        )
+        assert card.bowling["bowler"].tolist() == bowling.index.astype(str).tolist()
+        assert card.bowling["Overs"].tolist() == [overs_notation(balls) for balls in bowling["balls"]]
+        assert card.bowling["Runs"].tolist() == bowling["runs"].tolist()
+        assert card.bowling["Wickets"].tolist() == bowling["wickets"].tolist()
+        # A bowler with only wides and no-balls has no economy
+        economy = (bowling["runs"] * 6 / bowling["balls"]).where(bowling["balls"] > 0)
+        np.testing.assert_allclose(card.bowling["Economy"], economy)
+
+        assert card.runs == innings["total_runs"].sum()
+        assert card.wickets == innings["is_wicket"].sum()
+        assert card.overs == overs_notation(legal.sum())
+
+
+def test_scorecard_counts_legal_balls():
+    frame = pd.DataFrame({
+        "match_id": [4] * 3, "inning": [1] * 3, "over": [0] * 3, "ball": [1, 2, 3],
+        "batter": ["A"] * 3, "bowler": ["X", "Y", "Y"], "batsman_runs": [0, 0, 1],
+        "total_runs": [1, 1, 1], "extras_type": ["wides", "noballs", None], "is_wicket": [0] * 3,
+        "player_dismissed": [None] * 3, "dismissal_kind": [None] * 3,
+    })
+    card = Scorecards(build_scorecards(frame)).match(4)[1]
+    assert card.overs == "0.1"
+    assert card.bowling["Overs"].tolist() == ["0", "0.1"]
+    assert np.isnan(card.bowling["Economy"][0])
+    assert card.batting["Dismissal"].tolist() == ["Not Out"]
+
+
+def test_unknown_match_has_no_innings(deliveries):
+    assert Scorecards(build_scorecards(deliveries)).match(12345) == {}
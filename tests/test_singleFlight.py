@@ -0,0 +1,123 @@
+import threading
+import time
+import pytest
+from src.utils.singleFlight import FAILED, IDLE, READY, SingleFlight
+
+
+class Loader:
+    """A loader counting its calls, failing while fail is set"""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("no data")
+        return self.calls
+
+
+def test_loads_once():
+    loader = Loader()
+    flight = SingleFlight("test", loader)
+    assert flight.status() == {"name": "test", "state": IDLE, "seconds": None, "error": None}
+    assert flight.peek() is None
+    assert flight.get() == 1
+    assert flight.get() == 1
+    assert loader.calls == 1
+    assert flight.peek() == 1
+    assert flight.status()["state"] == READY
+    assert flight.status()["seconds"] is not None
+
+
+def test_stale_value_is_loaded_again():
+    loader = Loader()
+    flight = SingleFlight("test", loader)
+    assert flight.get(is_stale=lambda value: value < 2) == 1
+    assert flight.get(is_stale=lambda value: value < 2) == 2
+    assert flight.get(is_stale=lambda value: value < 2) == 2
+    assert loader.calls == 2
+
+
+def test_failed_load_is_retried_by_next_caller():
+    loader = Loader()
+    loader.fail = True
+    flight = SingleFlight("test", loader)
+    with pytest.raises(RuntimeError):
+        flight.get()
+    status = flight.status()
+    assert status["state"] == FAILED
+    assert status["error"] == "no data"
+    assert flight.peek() is None
+
+    loader.fail = False
+    assert flight.get() == 2
+    assert flight.status()["state"] == READY
+    assert flight.status()["error"] is None
+
+
+def test_reset_loads_again():
+    loader = Loader()
+    flight = SingleFlight("test", loader)
+    flight.get()
+    flight.reset()
+    assert flight.status()["state"] == IDLE
+    assert flight.status()["seconds"] is None
+    assert flight.peek() is None
+    assert flight.get() == 2
+
+
+def test_waiters_share_one_load():
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "loaded"
+
+    flight = SingleFlight("test", loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.get())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == ["loaded"] * 4
+    assert len(calls) == 1
+
+
+def test_waiters_of_a_failed_load_get_its_error():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise RuntimeError("no data")
+
+    flight = SingleFlight("test", loader)
+    errors = []
+
+    def get():
+        try:
+            flight.get()
+        except RuntimeError as e:
+            errors.append(e)
+
+    first = threading.Thread(target=get)
+    first.start()
+    started.wait(5)
+    # Arrives while the load is in flight, so it waits on that load
+    waiter = threading.Thread(target=get)
+    waiter.start()
+    time.sleep(0.1)
+    release.set()
+    first.join(5)
+    waiter.join(5)
+    assert len(errors) == 2
+    assert len(calls) == 1
@@ -0,0 +1,102 @@
+import pandas as pd
+import pytest
+from src.analysis.datasetPreprocessing import compact_deliveries
+from src.analysis.teamPairs import TeamPairs, build_team_pairs
+
+
+@pytest.fixture
+def matches():
+    return pd.DataFrame({
+        "id": [10, 11, 12, 13],
+        "season": [2020, 2020, 2021, 2021],
+        "team1": ["Kings", "Royals", "Kings", "Titans"],
+        "team2": ["Royals", "Kings", "Royals", "Kings"],
+    })
+
+
+@pytest.fixture(params=["object", "compact"])
+def deliveries(request):
+    """Balls of every match but in another order than matches, with a super over and an unknown match"""
+    frame = pd.DataFrame({
+        "match_id": [12, 10, 11, 99, 12, 10, 13, 11, 12, 13, 10, 12],
+        "inning": [1, 1, 1, 1, 2, 2, 2, 2, 3, 1, 1, 4],
+        "batting_team": ["Kings", "Kings", "Royals", "Kings", "Royals", "Royals",
+                         "Kings", "Kings", "Kings", "Titans", "Kings", "Royals"],
+        "bowling_team": ["Royals", "Royals", "Kings", "Royals", "Kings", "Kings",
+                         "Titans", "Royals", "Royals", "Kings", "Royals", "Kings"],
+        "extra_runs": [0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],
+        "total_runs": [4, 1, 6, 1, 2, 0, 1, 1, 6, 4, 2, 1],
+    })
+    return compact_deliveries(frame, report=False) if request.param == "compact" else frame
+
+
+def _merged(matches, deliveries):
+    """Deliveries joined to their matches, as the Team v/s Team page used to build them"""
+    return matches[["id", "season"]].merge(deliveries, left_on="id", right_on="match_id")
+
+
+def test_pair_matches_match_filters(matches, deliveries):
+    pairs = TeamPairs(build_team_pairs(matches, deliveries))
+    for team1, team2 in [("Kings", "Royals"), ("Royals", "Kings"), ("Titans", "Kings")]:
+        expected = matches[(matches["team1"] == team1) & (matches["team2"] == team2)]
+        assert pairs.matches(matches, team1, team2).index.tolist() == expected.index.tolist()
+    assert pairs.matches(matches, "Kings", "Titans").empty
+    assert pairs.matches(matches, "Unknown XI", "Kings").empty
+
+
+def test_pair_deliveries_follow_merge_order(matches, deliveries):
+    pairs = TeamPairs(build_team_pairs(matches, deliveries))
+    # Row positions survive the merge through a column, so the merged order can be compared
+    merged = _merged(matches, deliveries.assign(row=range(len(deliveries))))
+    for (batting, bowling), expected in merged.groupby(["batting_team", "bowling_team"], observed=True):
+        assert pairs.deliveries(deliveries, batting, bowling).index.tolist() == expected["row"].tolist()
+    assert pairs.deliveries(deliveries, "Royals", "Titans").empty
+
+
+def test_cube_sums_each_pair_per_season(matches, deliveries):
+    pairs = TeamPairs(build_team_pairs(matches, deliveries))
+    merged = _merged(matches, deliveries)
+    for (batting, bowling), balls in merged.groupby(["batting_team", "bowling_team"], observed=True):
+        cube = pairs.cube(batting, bowling)
+        assert cube["season"].tolist() == sorted(balls["season"].unique().tolist())
+        assert cube["runs"].sum() == balls["total_runs"].sum()
+        assert cube["extras"].sum() == balls["extra_runs"].sum()
+        assert cube["sixes"].sum() == (balls["total_runs"] == 6).sum()
+        # Super overs are left out of the innings totals
+        innings = balls[balls["inning"] < 3].groupby(["match_id", "inning"])["total_runs"].sum()
+        assert cube["innings"].sum() == len(innings)
+        assert cube["innings_runs"].sum() == innings.sum()
+    assert pairs.cube("Royals", "Titans").empty
+
+
+def _info(both, t1, t2):
+    """The page's former HEAD TO HEAD INFO table, six filters per team over head-to-head deliveries"""
+    def info(team):
+        batting = both[both["batting_team"] == team]
+        return [
+            both[both["bowling_team"] == team]["extra_runs"].sum(),
+            (batting["total_runs"] == 6).sum(),
+            (batting["total_runs"] == 4).sum(),
+            (batting["total_runs"] == 2).sum(),
+            (batting["total_runs"] == 1).sum(),
+            batting["total_runs"].sum(),
+        ]
+    return pd.DataFrame({
+        "info": ["Extra Runs", "Sixes", "Fours", "Doubles", "Singles", "Total Runs"],
+        t1: info(t1),
+        t2: info(t2),
+    })
+
+
+def test_head_to_head_matches_previous_info(matches, deliveries):
+    pairs = TeamPairs(build_team_pairs(matches, deliveries))
+    merged = _merged(matches, deliveries)
+    for t1, t2 in [("Kings", "Royals"), ("Royals", "Kings"), ("Kings", "Titans"), ("Royals", "Titans")]:
+        both = merged[
+            ((merged["batting_team"] == t1) & (merged["bowling_team"] == t2))
+            | ((merged["batting_team"] == t2) & (merged["bowling_team"] == t1))
+        ]
+        table = pairs.head_to_head(t1, t2)
+        expected = _info(both, t1, t2)
+        assert table.columns.tolist() == expected.columns.tolist()
+        assert table.astype(str).equals(expected.astype(str))